@@ -2,23 +2,53 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
+import tempfile
+import threading
+from collections import deque
 from functools import lru_cache
-from typing import Dict, List, Sequence, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
-from rapidfuzz import fuzz
+from cachetools import LRUCache
+from rapidfuzz import fuzz, process
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - only needed for the embedding stage.
+    np = None  # type: ignore
 
 try:  # Optional because model download can fail offline during development.
-    from sentence_transformers import SentenceTransformer, util
+    from sentence_transformers import SentenceTransformer
 except Exception:  # pragma: no cover - dependency may be absent in some environments.
     SentenceTransformer = None  # type: ignore
-    util = None  # type: ignore
+
+try:  # Optional CPU backend: ONNX Runtime export of the same model.
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+except Exception:  # pragma: no cover - dependency may be absent in some environments.
+    ort = None  # type: ignore
+    Tokenizer = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL_NAME = os.getenv("AMENITY_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+# "torch" loads DEFAULT_MODEL_NAME with sentence-transformers; "onnx" loads the
+# export written by scripts/export_embedding_onnx.py from ONNX_MODEL_DIR.
+EMBED_BACKEND = os.getenv("AMENITY_EMBED_BACKEND", "torch").lower()
+ONNX_MODEL_DIR = Path(os.getenv("AMENITY_EMBED_ONNX_DIR", str(Path("backend") / "data" / "embedding-onnx")))
+ONNX_MODEL_FILE = os.getenv("AMENITY_EMBED_ONNX_FILE", "model_int8.onnx")
+# Skip the embedding stage (instead of waiting) while the model is still loading.
+DEFER_UNTIL_READY = os.getenv("AMENITY_EMBED_DEFER_UNTIL_READY", "false").lower() == "true"
+ALIAS_VECTORS_DIR = Path(os.getenv("AMENITY_ALIAS_VECTORS_DIR", str(Path("backend") / "data")))
+SENTENCE_CACHE_SIZE = int(os.getenv("AMENITY_SENTENCE_CACHE_SIZE", "10000"))
+SENTENCE_CACHE_PERSIST = os.getenv("AMENITY_SENTENCE_CACHE_PERSIST", "false").lower() == "true"
+FUZZY_SCORE_CUTOFF = 90
+# Extraction may already run in a process pool, so default to one thread.
+FUZZY_WORKERS = int(os.getenv("AMENITY_FUZZY_WORKERS", "1"))
 
 _NEGATION_PATTERNS = (
     "no",
@@ -71,29 +101,53 @@ def detect_amenity_mentions(tags: Sequence[str], text: str, *, similarity_thresh
     if not sentences:
         sentences = [text]
     normalized_sentences = [_normalize_for_window(sentence) for sentence in sentences]
-    sentence_embeddings = _encode_sentences(sentences)
 
+    tag_aliases = [_aliases_for(_canonicalize(tag)) for tag in tags]
+    request_patterns = {
+        _normalize_for_window(alias) for aliases in tag_aliases for alias in aliases
+    }
+    direct_hits = _find_direct_hits(
+        normalized_sentences,
+        (_static_alias_automaton(), _AliasAutomaton(request_patterns)),
+    )
+
+    tag_alias_norms = [
+        {_normalize_for_window(alias) for alias in aliases} - {""} for aliases in tag_aliases
+    ]
+    unresolved_aliases = sorted(
+        {
+            alias
+            for alias_norms in tag_alias_norms
+            if not alias_norms & direct_hits
+            for alias in alias_norms
+        }
+    )
+    fuzzy_hits = _find_fuzzy_hits(unresolved_aliases, normalized_sentences)
+
+    unresolved = [
+        index
+        for index, alias_norms in enumerate(tag_alias_norms)
+        if not (alias_norms & direct_hits or alias_norms & fuzzy_hits)
+    ]
+    embedding_hits: Set[int] = set()
+    if unresolved:
+        sentence_embeddings = _encode_sentences(sentences)
+        if sentence_embeddings is not None:
+            embedding_hits = _find_embedding_hits(
+                {index: tag_aliases[index] for index in unresolved},
+                sentences,
+                sentence_embeddings,
+                similarity_threshold,
+            )
+
+    unresolved_set = set(unresolved)
     present: List[str] = []
     missing: List[str] = []
-
-    for original_tag in tags:
-        canonical = _canonicalize(original_tag)
-        alias_candidates = _aliases_for(canonical)
-        if _has_direct_alias_hit(alias_candidates, sentences, normalized_sentences):
-            present.append(original_tag)
-            continue
-
-        if _has_fuzzy_hit(alias_candidates, normalized_sentences):
-            present.append(original_tag)
-            continue
-
-        if sentence_embeddings is not None and _has_embedding_hit(
-            alias_candidates, sentences, sentence_embeddings, similarity_threshold
-        ):
+    for index, original_tag in enumerate(tags):
+        if index not in unresolved_set or index in embedding_hits:
             present.append(original_tag)
-            continue
-
-        missing.append(original_tag)
+        else:
+            missing.append(original_tag)
 
     return present, missing
 
@@ -139,79 +193,374 @@ def _split_sentences(text: str) -> List[str]:
     return sentences
 
 
-def _has_direct_alias_hit(
-    aliases: Sequence[str],
-    sentences: Sequence[str],
+class _AliasAutomaton:
+    """Word-level Aho-Corasick automaton over normalized alias phrases.
+
+    Matching whole tokens rather than characters gives the same boundary
+    semantics as the ``f" {alias} " in f" {sentence} "`` check it replaces,
+    while finding every alias occurrence in a single scan of the sentence.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, int]]] = [[]]
+        for pattern in patterns:
+            words = pattern.split()
+            if words:
+                self._add(pattern, words)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, words: List[str]) -> None:
+        state = 0
+        for word in words:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][word] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((pattern, len(words)))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0) if state else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, words: Sequence[str]) -> Iterator[Tuple[int, str, int]]:
+        """Yield ``(start_index, pattern, length)`` for every alias occurrence."""
+        state = 0
+        for index, word in enumerate(words):
+            while state and word not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(word, 0)
+            for pattern, length in self._out[state]:
+                yield index - length + 1, pattern, length
+
+
+@lru_cache(maxsize=1)
+def _static_alias_automaton() -> _AliasAutomaton:
+    patterns = {
+        _normalize_for_window(alias)
+        for key, aliases in _AMENITY_ALIASES.items()
+        for alias in [key, *aliases]
+    }
+    return _AliasAutomaton(patterns)
+
+
+def _find_direct_hits(
     normalized_sentences: Sequence[str],
-) -> bool:
-    for sentence, normalized in zip(sentences, normalized_sentences):
+    automata: Sequence[_AliasAutomaton],
+    window_words: int = 5,
+) -> Set[str]:
+    """Return aliases that appear un-negated in at least one sentence.
+
+    An alias counts for a sentence only if none of its occurrences there has
+    a negation cue within ``window_words`` words; negation windows are only
+    inspected at hit positions.
+    """
+
+    hits: Set[str] = set()
+    for normalized in normalized_sentences:
         if not normalized:
             continue
-        padded = f" {normalized} "
-        for alias in aliases:
-            alias_norm = _normalize_for_window(alias)
-            if not alias_norm:
+        words = normalized.split()
+        occurrences: Dict[str, List[Tuple[int, int]]] = {}
+        for automaton in automata:
+            for start, pattern, length in automaton.find(words):
+                occurrences.setdefault(pattern, []).append((start, length))
+        for pattern, spans in occurrences.items():
+            if pattern in hits:
                 continue
-            if f" {alias_norm} " in padded and not _is_negated(normalized, alias_norm):
-                return True
-    return False
+            negated = False
+            for start, length in spans:
+                window_start = max(0, start - window_words)
+                window_end = min(len(words), start + length + window_words)
+                if _contains_negation(" ".join(words[window_start:window_end])):
+                    negated = True
+                    break
+            if not negated:
+                hits.add(pattern)
+    return hits
+
+
+def _find_fuzzy_hits(aliases: Sequence[str], normalized_sentences: Sequence[str]) -> Set[str]:
+    """Return aliases whose WRatio against any non-negated sentence reaches the cutoff.
+
+    All aliases are scored against all sentences in one ``process.cdist``
+    call; with ``score_cutoff`` set, scores below the cutoff come back as 0.
+    """
+
+    candidates = [
+        sentence for sentence in normalized_sentences if sentence and not _contains_negation(sentence)
+    ]
+    if not aliases or not candidates:
+        return set()
+    try:
+        scores = process.cdist(
+            aliases,
+            candidates,
+            scorer=fuzz.WRatio,
+            score_cutoff=FUZZY_SCORE_CUTOFF,
+            workers=FUZZY_WORKERS,
+        )
+    except ImportError:  # pragma: no cover - cdist needs numpy
+        return {
+            alias
+            for alias in aliases
+            if any(fuzz.WRatio(alias, sentence) >= FUZZY_SCORE_CUTOFF for sentence in candidates)
+        }
+    row_hits = scores.max(axis=1) > 0
+    return {alias for alias, hit in zip(aliases, row_hits) if hit}
+
+
+def _find_embedding_hits(
+    tag_aliases: Dict[int, Sequence[str]],
+    sentences: Sequence[str],
+    sentence_embeddings,
+    threshold: float,
+) -> Set[int]:
+    """Return the keys of ``tag_aliases`` whose best alias/sentence cosine clears ``threshold``.
 
+    Alias rows come from the precomputed store where possible; the rest are
+    encoded in one batch. A single matrix multiply then scores every alias
+    against every sentence, and each tag is judged on its best pair, which
+    is rejected if that sentence is negated.
+    """
 
-def _has_fuzzy_hit(aliases: Sequence[str], normalized_sentences: Sequence[str]) -> bool:
-    for normalized_sentence in normalized_sentences:
-        if not normalized_sentence or _contains_negation(normalized_sentence):
+    if np is None:
+        return set()
+    alias_texts = sorted({alias for aliases in tag_aliases.values() for alias in aliases if alias})
+    alias_matrix = _alias_matrix(alias_texts)
+    if alias_matrix is None:
+        return set()
+    row_of = {alias: row for row, alias in enumerate(alias_texts)}
+    scores = alias_matrix @ np.asarray(sentence_embeddings, dtype=np.float32).T
+
+    hits: Set[int] = set()
+    for key, aliases in tag_aliases.items():
+        rows = sorted({row_of[alias] for alias in aliases if alias})
+        if not rows:
             continue
-        for alias in aliases:
-            alias_norm = _normalize_for_window(alias)
-            if not alias_norm:
-                continue
-            score = fuzz.WRatio(alias_norm, normalized_sentence)
-            if score >= 90:
-                return True
-    return False
+        tag_scores = scores[rows]
+        best = int(tag_scores.argmax())
+        if tag_scores.flat[best] < threshold:
+            continue
+        sentence = _normalize_for_window(sentences[best % tag_scores.shape[1]])
+        if not _contains_negation(sentence):
+            hits.add(key)
+    return hits
 
 
-def _has_embedding_hit(
-    aliases: Sequence[str],
-    sentences: Sequence[str],
-    sentence_embeddings,
-    threshold: float,
-) -> bool:
-    model = _get_model()
-    if model is None or util is None:
-        return False
-    alias_texts = [alias for alias in aliases if alias]
+def _alias_matrix(alias_texts: Sequence[str]):
+    """Stack unit-length embeddings for ``alias_texts``, one row per alias."""
+
     if not alias_texts:
-        return False
-    alias_embeddings = _encode_aliases(tuple(alias_texts))
-    if alias_embeddings is None:
-        return False
-    scores = util.cos_sim(alias_embeddings, sentence_embeddings)
-    max_value = scores.max().item()
-    if max_value < threshold:
-        return False
-    index = int(scores.argmax().item())
-    sentence_index = index % scores.shape[1]
-    sentence = _normalize_for_window(sentences[sentence_index])
-    if _contains_negation(sentence):
-        return False
-    return True
-
-
-def _is_negated(normalized_sentence: str, alias: str, window_words: int = 5) -> bool:
-    if alias not in normalized_sentence:
-        return False
-    words = normalized_sentence.split()
-    alias_words = alias.split()
-    alias_len = len(alias_words)
-    for idx in range(len(words) - alias_len + 1):
-        if words[idx : idx + alias_len] == alias_words:
-            window_start = max(0, idx - window_words)
-            window_end = min(len(words), idx + alias_len + window_words)
-            snippet = " ".join(words[window_start:window_end])
-            if _contains_negation(snippet):
-                return True
-    return False
+        return None
+    store = _alias_vector_store()
+    rows: Dict[str, object] = {}
+    if store is not None:
+        texts, matrix = store
+        index = {text: row for row, text in enumerate(texts)}
+        known = [alias for alias in alias_texts if alias in index]
+        if known:
+            rows.update(zip(known, matrix[[index[alias] for alias in known]]))
+    pending = [alias for alias in alias_texts if alias not in rows]
+    if pending:
+        encoded = _encode_texts(pending)
+        if encoded is None:
+            return None
+        rows.update(zip(pending, encoded))
+    return np.asarray([rows[alias] for alias in alias_texts], dtype=np.float32)
+
+
+def _model_fingerprint() -> List[str]:
+    return [EMBED_BACKEND, DEFAULT_MODEL_NAME, ONNX_MODEL_FILE if EMBED_BACKEND == "onnx" else ""]
+
+
+class SentenceEmbeddingCache:
+    """Bounded, thread-safe LRU of sentence embeddings.
+
+    Keys are a digest of the whitespace-normalized sentence, so re-assessing a
+    listing only encodes sentences that are new or were edited.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = max(0, maxsize)
+        self._entries: LRUCache = LRUCache(maxsize=max(1, self._maxsize))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(sentence: str) -> str:
+        return " ".join(sentence.split())
+
+    @staticmethod
+    def key(normalized_sentence: str) -> bytes:
+        return hashlib.blake2b(normalized_sentence.encode("utf-8"), digest_size=16).digest()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: bytes):
+        if not self._maxsize:
+            return None
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return vector
+
+    def put(self, key: bytes, vector) -> None:
+        if self._maxsize:
+            with self._lock:
+                self._entries[key] = vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def save(self, path: Path) -> int:
+        """Write the cached vectors to ``path`` (an ``.npz`` file); return the count."""
+
+        with self._lock:
+            items = list(self._entries.items())
+        if not items:
+            return 0
+        keys = np.frombuffer(b"".join(key for key, _ in items), dtype="S16")
+        vectors = np.stack([vector for _, vector in items]).astype(np.float32)
+        _replace_file(path, lambda handle: np.savez(handle, keys=keys, vectors=vectors))
+        return len(items)
+
+    def load(self, path: Path) -> int:
+        """Add vectors saved by :meth:`save`; return the count."""
+
+        with np.load(path) as data:
+            keys, vectors = data["keys"], data["vectors"]
+        loaded = 0
+        for key, vector in zip(keys[-self._maxsize :], vectors[-self._maxsize :]):
+            self.put(key.tobytes(), vector)
+            loaded += 1
+        return loaded
+
+
+_sentence_cache = SentenceEmbeddingCache(SENTENCE_CACHE_SIZE)
+
+
+def sentence_cache_path() -> Path:
+    digest = hashlib.sha256("\n".join(_model_fingerprint()).encode("utf-8")).hexdigest()
+    return ALIAS_VECTORS_DIR / f"sentence-cache-{digest[:16]}.npz"
+
+
+def save_sentence_cache() -> None:
+    """Persist the sentence cache when ``AMENITY_SENTENCE_CACHE_PERSIST`` is enabled."""
+
+    if not SENTENCE_CACHE_PERSIST or np is None:
+        return
+    path = sentence_cache_path()
+    try:
+        count = _sentence_cache.save(path)
+    except Exception as exc:
+        logger.warning("Failed to save sentence embeddings to %s: %s", path, exc)
+        return
+    if count:
+        logger.info("Saved %s sentence embeddings to %s.", count, path)
+
+
+def _load_sentence_cache() -> None:
+    if not SENTENCE_CACHE_PERSIST or np is None:
+        return
+    path = sentence_cache_path()
+    try:
+        count = _sentence_cache.load(path)
+    except FileNotFoundError:
+        return
+    except Exception as exc:
+        logger.warning("Failed to load sentence embeddings from %s: %s", path, exc)
+        return
+    logger.info("Loaded %s sentence embeddings from %s.", count, path)
+
+
+def _replace_file(path: Path, write) -> None:
+    """Write ``path`` through a uniquely named temp file in the same directory, then swap it in."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False)
+    try:
+        with handle:
+            write(handle)
+        os.replace(handle.name, path)
+    except Exception:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
+
+
+_alias_store = None
+_alias_store_lock = threading.Lock()
+
+
+def _alias_vector_store():
+    """Load (or build and save) embeddings for every static alias.
+
+    The file name hashes the backend, model name and alias list, so editing
+    ``_AMENITY_ALIASES`` or switching models writes a fresh file instead
+    of reusing stale vectors. The matrix is memory-mapped read-only, which
+    lets extraction worker processes share its pages.
+
+    Only a successful build is kept; a failed encode returns ``None`` and the
+    next call tries again.
+    """
+
+    global _alias_store
+    if _alias_store is not None:
+        return _alias_store
+    # Resolve the model before taking the lock: loading it builds the store
+    # from inside ``load_model``, which already holds the model lock.
+    if np is None or _get_model() is None:
+        return None
+    with _alias_store_lock:
+        if _alias_store is None:
+            _alias_store = _build_alias_vector_store()
+        return _alias_store
+
+
+def _build_alias_vector_store():
+    texts = sorted({alias for tag in _AMENITY_ALIASES for alias in _aliases_for(tag)})
+    digest = hashlib.sha256("\n".join([*_model_fingerprint(), *texts]).encode("utf-8")).hexdigest()
+    path = ALIAS_VECTORS_DIR / f"amenity-aliases-{digest[:16]}.npy"
+    try:
+        matrix = np.load(path, mmap_mode="r")
+        if matrix.shape[0] == len(texts):
+            return texts, matrix
+        logger.warning("Ignoring alias vector file %s with unexpected shape %s.", path, matrix.shape)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning("Failed to load alias vectors from %s: %s", path, exc)
+
+    encoded = _encode_texts(texts)
+    if encoded is None:
+        return None
+    matrix = np.asarray(encoded, dtype=np.float32)
+    try:
+        _replace_file(path, lambda handle: np.save(handle, matrix))
+        return texts, np.load(path, mmap_mode="r")
+    except Exception as exc:
+        logger.warning("Failed to save alias vectors to %s: %s", path, exc)
+        return texts, matrix
 
 
 def _contains_negation(normalized_text: str) -> bool:
@@ -225,8 +574,111 @@ def _contains_negation(normalized_text: str) -> bool:
     return False
 
 
-@lru_cache(maxsize=1)
-def _get_model():
+_model = None
+_model_state = "idle"  # idle -> loading -> ready | unavailable
+_model_lock = threading.Lock()
+_warmup_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def model_status() -> str:
+    """Return the embedding model state: idle, loading, ready, or unavailable."""
+
+    return _model_state
+
+
+def embeddings_deferred() -> bool:
+    """True while the embedding stage is being skipped because the model is still loading."""
+
+    return DEFER_UNTIL_READY and _model is None and _model_state != "unavailable"
+
+
+def load_model():
+    """Load the embedding model, run a warm-up encode, and build the alias store.
+
+    Blocking and idempotent; concurrent callers wait for the first load.
+    """
+
+    global _model, _model_state
+    with _model_lock:
+        if _model_state in ("ready", "unavailable"):
+            return _model
+        _model_state = "loading"
+        model = _load_model()
+        if model is None:
+            _model_state = "unavailable"
+            return None
+        try:
+            model.encode(["warm up"], normalize_embeddings=True, show_progress_bar=False)
+        except Exception as exc:  # pragma: no cover - depends on runtime env
+            logger.warning("Embedding model warm-up encode failed: %s", exc)
+        _model = model
+        _alias_vector_store()
+        _load_sentence_cache()
+        _model_state = "ready"
+        logger.info("Embedding model %s ready (%s backend).", DEFAULT_MODEL_NAME, EMBED_BACKEND)
+        return model
+
+
+def start_model_warmup() -> None:
+    """Load the embedding model on a background thread if nobody has started it yet."""
+
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is not None or _model_state != "idle":
+            return
+        _warmup_thread = threading.Thread(target=load_model, name="amenity-model-warmup", daemon=True)
+        _warmup_thread.start()
+
+
+class OnnxSentenceEncoder:
+    """Mean-pooled sentence embeddings from an ONNX export of a sentence-transformers model.
+
+    Mirrors the subset of ``SentenceTransformer.encode`` the matcher uses, so
+    the rest of the pipeline does not care which backend produced the vectors.
+    """
+
+    def __init__(self, session, tokenizer, *, batch_size: int = 32) -> None:
+        self._session = session
+        self._tokenizer = tokenizer
+        self._batch_size = max(1, batch_size)
+        self._input_names = {item.name for item in session.get_inputs()}
+
+    @classmethod
+    def from_dir(cls, model_dir: Path, model_file: str = ONNX_MODEL_FILE, *, max_length: int = 256):
+        session = ort.InferenceSession(str(model_dir / model_file), providers=["CPUExecutionProvider"])
+        tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        tokenizer.enable_truncation(max_length=max_length)
+        pad_id = tokenizer.token_to_id("[PAD]")
+        tokenizer.enable_padding(pad_id=pad_id if pad_id is not None else 0, pad_token="[PAD]")
+        return cls(session, tokenizer)
+
+    def encode(self, texts: Sequence[str], normalize_embeddings: bool = True, show_progress_bar: bool = False):
+        texts = list(texts)
+        batches = []
+        for start in range(0, len(texts), self._batch_size):
+            encodings = self._tokenizer.encode_batch(texts[start : start + self._batch_size])
+            input_ids = np.asarray([encoding.ids for encoding in encodings], dtype=np.int64)
+            attention_mask = np.asarray([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self._input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+            token_embeddings = self._session.run(None, feeds)[0]
+            weights = attention_mask[..., None].astype(np.float32)
+            summed = (token_embeddings * weights).sum(axis=1)
+            batches.append(summed / np.clip(weights.sum(axis=1), 1e-9, None))
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        embeddings = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+        return embeddings
+
+
+def _load_model():
+    if EMBED_BACKEND == "onnx":
+        return _load_onnx_model()
     if SentenceTransformer is None:
         logger.warning("SentenceTransformer not available; amenity embedding checks disabled.")
         return None
@@ -237,26 +689,57 @@ def _get_model():
         return None
 
 
-def _encode_sentences(sentences: Sequence[str]):
-    model = _get_model()
-    if model is None:
-        return None
-    if not sentences:
+def _load_onnx_model():
+    if ort is None or Tokenizer is None or np is None:
+        logger.warning("onnxruntime/tokenizers not available; amenity embedding checks disabled.")
         return None
     try:
-        return model.encode(list(sentences), normalize_embeddings=True, show_progress_bar=False)
-    except Exception as exc:  # pragma: no cover - guard against runtime errors
-        logger.warning("Failed to encode sentences: %s", exc)
+        return OnnxSentenceEncoder.from_dir(ONNX_MODEL_DIR, ONNX_MODEL_FILE)
+    except Exception as exc:  # pragma: no cover - depends on runtime env
+        logger.warning("Failed to load ONNX embedding model from %s: %s", ONNX_MODEL_DIR, exc)
+        return None
+
+
+def _get_model():
+    if _model is not None or _model_state == "unavailable":
+        return _model
+    if DEFER_UNTIL_READY:
+        start_model_warmup()
         return None
+    return load_model()
 
 
-@lru_cache(maxsize=256)
-def _encode_aliases(aliases: Tuple[str, ...]):
+def _encode_sentences(sentences: Sequence[str]):
+    """Embed ``sentences``, encoding only those missing from the sentence cache."""
+
+    model = _get_model()
+    if model is None or np is None:
+        return None
+    if not sentences:
+        return None
+    normalized = [SentenceEmbeddingCache.normalize(sentence) for sentence in sentences]
+    keys = [SentenceEmbeddingCache.key(text) for text in normalized]
+    vectors = [_sentence_cache.get(key) for key in keys]
+    pending = {key: text for key, text, vector in zip(keys, normalized, vectors) if vector is None}
+    if pending:
+        try:
+            encoded = model.encode(list(pending.values()), normalize_embeddings=True, show_progress_bar=False)
+        except Exception as exc:  # pragma: no cover - guard against runtime errors
+            logger.warning("Failed to encode sentences: %s", exc)
+            return None
+        fresh = dict(zip(pending, np.asarray(encoded, dtype=np.float32)))
+        for key, vector in fresh.items():
+            _sentence_cache.put(key, vector)
+        vectors = [fresh[key] if vector is None else vector for key, vector in zip(keys, vectors)]
+    return np.stack(vectors)
+
+
+def _encode_texts(texts: Sequence[str]):
     model = _get_model()
     if model is None:
         return None
     try:
-        return model.encode(list(aliases), normalize_embeddings=True, show_progress_bar=False)
+        return model.encode(list(texts), normalize_embeddings=True, show_progress_bar=False)
     except Exception as exc:  # pragma: no cover
-        logger.warning("Failed to encode amenity aliases %s: %s", aliases, exc)
+        logger.warning("Failed to encode amenity aliases: %s", exc)
         return None
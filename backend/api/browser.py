@@ -3,17 +3,99 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
 from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
+    Route,
     async_playwright,
     Error as PlaywrightError,
 )
 
+from .utils import DEFAULT_USER_AGENT, extract_im_width
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 900},
+    "extra_http_headers": {"user-agent": DEFAULT_USER_AGENT},
+}
+
+
+DEFAULT_BLOCKED_URL_PATTERNS: Tuple[str, ...] = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "connect.facebook.net",
+    "facebook.com/tr",
+    "bat.bing.com",
+    "hotjar.com",
+    "branch.io",
+    "ct.pinterest.com",
+    "analytics.tiktok.com",
+    "/tracking/",
+)
+
+
+@dataclass(frozen=True)
+class ResourceBlockProfile:
+    """Request-interception rules applied to every browser context.
+
+    Extraction only needs the DOM, ``srcset`` attributes and the PdpSections
+    XHR, so media, fonts, tracking scripts and full-size images are aborted.
+    Documents, scripts, stylesheets and XHR/fetch traffic are left alone.
+    """
+
+    blocked_resource_types: FrozenSet[str] = frozenset({"media", "font"})
+    blocked_url_patterns: Tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+    max_image_width: Optional[int] = 720
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """Return why a request should be aborted, or ``None`` to allow it."""
+        if resource_type == "document":
+            return None
+        if resource_type in self.blocked_resource_types:
+            return "resource_type"
+        lowered = url.lower()
+        if any(pattern in lowered for pattern in self.blocked_url_patterns):
+            return "url_pattern"
+        if (
+            resource_type == "image"
+            and self.max_image_width is not None
+            and extract_im_width(url) > self.max_image_width
+        ):
+            return "image_width"
+        return None
+
+
+def rewrite_upstream_url(url: str, upstream: str) -> Optional[str]:
+    """Point ``url`` at the ``upstream`` origin, keeping its path and query.
+
+    Returns ``None`` for non-HTTP URLs (``data:``, ``blob:``), which are left alone.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    base = urlsplit(upstream)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+
+@dataclass
+class _PooledPage:
+    """A configured context/page pair that can be reused across renders."""
+
+    browser: Browser
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+
 
 class BrowserManager:
     """Singleton manager that provides Playwright browser contexts."""
@@ -23,14 +105,27 @@ class BrowserManager:
         headless: bool = True,
         max_concurrency: int = 4,
         disable_sandbox: bool = True,
+        max_page_uses: int = 25,
+        context_options: Optional[dict] = None,
+        block_profile: Optional[ResourceBlockProfile] = None,
+        upstream_override: Optional[str] = None,
     ) -> None:
         self._headless = headless
         self._max_concurrency = max_concurrency
         self._disable_sandbox = disable_sandbox
+        self._max_page_uses = max(1, max_page_uses)
+        self._context_options = dict(context_options or DEFAULT_CONTEXT_OPTIONS)
         self._playwright = None
         self._browser: Optional[Browser] = None
         self._lock = asyncio.Lock()
         self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._idle_pages: List[_PooledPage] = []
+        self._pages_in_use = 0
+        self._pages_waiting = 0
+        self._block_profile = block_profile
+        # Load tests send every request to a local stand-in server instead of the internet.
+        self._upstream_override = upstream_override
+        self._resource_stats: Dict[str, Dict[str, int]] = {}
 
     async def _ensure_browser(self) -> Browser:
         async with self._lock:
@@ -70,7 +165,7 @@ class BrowserManager:
             for attempt in range(2):
                 browser = await self._ensure_browser()
                 try:
-                    context = await browser.new_context()
+                    context = await self._new_context(browser)
                 except PlaywrightError as exc:
                     if self._is_browser_closed_error(exc) and attempt == 0:
                         last_exc = exc
@@ -92,28 +187,160 @@ class BrowserManager:
 
     @asynccontextmanager
     async def page(self) -> AsyncIterator[Page]:
-        """Yield a Playwright page scoped to a fresh context."""
+        """Yield a pre-configured page from the warm pool.
+
+        Pages are reset and returned to the pool after use. Pages that raised,
+        failed their health check, or reached ``max_page_uses`` are closed
+        together with their context instead of being recycled.
+        """
+        self._pages_waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._pages_waiting -= 1
+        self._pages_in_use += 1
+        try:
+            slot = await self._checkout()
+            reusable = False
+            try:
+                yield slot.page
+                reusable = True
+            finally:
+                await self._checkin(slot, reusable)
+        finally:
+            self._pages_in_use -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        """Return pool occupancy and per-resource-type interception counters."""
+        return {
+            "max_concurrency": self._max_concurrency,
+            "pages_in_use": self._pages_in_use,
+            "pages_waiting": self._pages_waiting,
+            "idle_pages": len(self._idle_pages),
+            "resources": {kind: dict(counts) for kind, counts in sorted(self._resource_stats.items())},
+        }
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """Pre-create pooled pages so the first requests skip context setup.
+
+        Idle and checked-out pages both count toward ``count``. Each page is
+        created while holding a concurrency slot, as :meth:`page` does, so
+        warming never takes the pool past ``max_concurrency``; it stops
+        rather than waits when every slot is busy.
+        """
+        target = min(count or self._max_concurrency, self._max_concurrency)
+        while len(self._idle_pages) + self._pages_in_use < target:
+            if self._semaphore.locked():
+                return
+            await self._semaphore.acquire()
+            try:
+                if len(self._idle_pages) + self._pages_in_use >= target:
+                    return
+                self._idle_pages.append(await self._create_slot())
+            except PlaywrightError:
+                logger.warning("Failed to pre-create pooled Playwright page.", exc_info=True)
+                return
+            finally:
+                self._semaphore.release()
+
+    async def _checkout(self) -> _PooledPage:
+        while self._idle_pages:
+            slot = self._idle_pages.pop()
+            if self._is_healthy(slot):
+                return slot
+            await self._discard(slot)
+        return await self._create_slot()
+
+    async def _checkin(self, slot: _PooledPage, reusable: bool) -> None:
+        slot.uses += 1
+        if not reusable or slot.uses >= self._max_page_uses or not self._is_healthy(slot):
+            await self._discard(slot)
+            return
+        try:
+            await slot.page.evaluate(
+                """() => {
+                    try { window.localStorage.clear(); } catch (err) {}
+                    try { window.sessionStorage.clear(); } catch (err) {}
+                }"""
+            )
+            await slot.context.clear_cookies()
+            await slot.page.goto("about:blank")
+        except PlaywrightError:
+            await self._discard(slot)
+            return
+        self._idle_pages.append(slot)
+
+    async def _create_slot(self) -> _PooledPage:
         last_exc: Optional[PlaywrightError] = None
         for attempt in range(2):
-            async with self.context() as context:
-                try:
-                    page = await context.new_page()
-                except PlaywrightError as exc:
-                    if self._is_browser_closed_error(exc) and attempt == 0:
-                        last_exc = exc
-                        await self._handle_browser_disconnect()
-                        continue
-                    raise
+            browser = await self._ensure_browser()
+            try:
+                context = await self._new_context(browser)
+            except PlaywrightError as exc:
+                if self._is_browser_closed_error(exc) and attempt == 0:
+                    last_exc = exc
+                    await self._handle_browser_disconnect()
+                    continue
+                raise
+            try:
+                page = await context.new_page()
+            except PlaywrightError as exc:
                 try:
-                    yield page
-                finally:
-                    try:
-                        await page.close()
-                    except PlaywrightError:
-                        pass
-                return
-        if last_exc:
-            raise last_exc
+                    await context.close()
+                except PlaywrightError:
+                    pass
+                if self._is_browser_closed_error(exc) and attempt == 0:
+                    last_exc = exc
+                    await self._handle_browser_disconnect()
+                    continue
+                raise
+            return _PooledPage(browser=browser, context=context, page=page)
+        assert last_exc is not None
+        raise last_exc
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        context = await browser.new_context(**self._context_options)
+        if self._block_profile is not None or self._upstream_override:
+            await context.route("**/*", self._route_request)
+        return context
+
+    async def _route_request(self, route: Route) -> None:
+        request = route.request
+        resource_type = request.resource_type
+        reason = self._block_profile.block_reason(request.url, resource_type) if self._block_profile else None
+        counters = self._resource_stats.setdefault(resource_type, {"allowed": 0, "blocked": 0})
+        try:
+            if reason:
+                counters["blocked"] += 1
+                await route.abort("blockedbyclient")
+            else:
+                counters["allowed"] += 1
+                upstream_url = (
+                    rewrite_upstream_url(request.url, self._upstream_override) if self._upstream_override else None
+                )
+                if upstream_url is None:
+                    await route.continue_()
+                else:
+                    # continue_() cannot switch https to http, so fetch and replay the response.
+                    response = await route.fetch(url=upstream_url)
+                    await route.fulfill(response=response)
+        except PlaywrightError:
+            # The page navigated or closed while the request was paused.
+            pass
+
+    def _is_healthy(self, slot: _PooledPage) -> bool:
+        return (
+            slot.browser is self._browser
+            and slot.browser.is_connected()
+            and not slot.page.is_closed()
+        )
+
+    async def _discard(self, slot: _PooledPage) -> None:
+        try:
+            await slot.context.close()
+        except PlaywrightError:
+            pass
 
     async def close(self) -> None:
         """Tear down the global browser instance."""
@@ -129,6 +356,9 @@ class BrowserManager:
             await self._dispose_browser_locked()
 
     async def _dispose_browser_locked(self) -> None:
+        idle_pages, self._idle_pages = self._idle_pages, []
+        for slot in idle_pages:
+            await self._discard(slot)
         if self._browser:
             browser = self._browser
             self._browser = None
@@ -0,0 +1,80 @@
+"""Capture bundles: one compressed file holding every render artifact of a listing.
+
+A bundle is gzip-compressed JSON wrapping a :class:`ListingCapture`, so a
+recorded listing can be fed back through :meth:`ListingCapture.extract` and
+the heuristics without a browser. ``scripts/assess.py --dump-bundle`` writes
+them and ``scripts/replay.py`` re-scores a directory of them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+from .database import utcnow
+from .extract import ListingCapture
+
+BUNDLE_FORMAT = "hostscore-capture"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".capture.json.gz"
+
+PathLike = Union[str, os.PathLike]
+
+
+class BundleError(ValueError):
+    """Raised when a file is not a readable capture bundle."""
+
+
+def bundle_filename(url: str) -> str:
+    """Stable file name for a (normalized) listing URL."""
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return f"{digest}{BUNDLE_SUFFIX}"
+
+
+def write_bundle(capture: ListingCapture, path: PathLike) -> Path:
+    """Write ``capture`` to ``path`` atomically and return the path."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "captured_at": utcnow().isoformat(),
+        "capture": capture.to_dict(),
+    }
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        json.dump(document, fh, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, target)
+    return target
+
+
+def read_bundle(path: PathLike) -> ListingCapture:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            document = json.load(fh)
+    except (OSError, EOFError, json.JSONDecodeError) as exc:
+        raise BundleError(f"{path}: not a capture bundle ({exc})") from exc
+    if not isinstance(document, dict) or document.get("format") != BUNDLE_FORMAT:
+        raise BundleError(f"{path}: not a capture bundle")
+    if document.get("version") != BUNDLE_VERSION:
+        raise BundleError(f"{path}: unsupported bundle version {document.get('version')!r}")
+    try:
+        return ListingCapture.from_dict(document["capture"])
+    except (KeyError, TypeError) as exc:
+        raise BundleError(f"{path}: malformed capture ({exc})") from exc
+
+
+def find_bundles(paths: Iterable[PathLike]) -> Iterator[Path]:
+    """Yield bundle files, expanding directories recursively in sorted order."""
+
+    for entry in map(Path, paths):
+        if entry.is_dir():
+            yield from sorted(entry.rglob(f"*{BUNDLE_SUFFIX}"))
+        else:
+            yield entry
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import threading
-from typing import Callable, Generic, Optional, TypeVar
+from typing import Awaitable, Callable, Dict, Generic, Optional, Protocol, TypeVar
 
 from cachetools import TTLCache
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+logger = logging.getLogger(__name__)
+
 
 class AssessmentCache(Generic[K, V]):
     """Thread-safe TTL cache with LRU eviction semantics."""
@@ -39,3 +43,124 @@ class AssessmentCache(Generic[K, V]):
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
+
+
+class CacheStore(Protocol):
+    """Persistent key/value backend used as an L2 cache tier."""
+
+    async def get_cache_entry(self, namespace: str, key: str) -> Optional[str]:
+        ...
+
+    async def put_cache_entry(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        *,
+        ttl_seconds: int,
+        max_entries: int,
+    ) -> None:
+        ...
+
+
+class TieredCache(Generic[V]):
+    """In-memory L1 cache with an optional read-through persistent L2 tier.
+
+    L2 entries are serialized to text so they survive restarts and are shared
+    by every worker pointed at the same SQLite file. L2 failures are logged
+    and treated as misses; they never fail the request.
+    """
+
+    def __init__(
+        self,
+        l1: AssessmentCache[str, V],
+        *,
+        namespace: str,
+        serialize: Callable[[V], str],
+        deserialize: Callable[[str], V],
+        store: Optional[CacheStore] = None,
+        ttl_seconds: int = 900,
+        max_entries: int = 1000,
+    ) -> None:
+        self._l1 = l1
+        self._namespace = namespace
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+
+    async def get(self, key: str) -> Optional[V]:
+        value = self._l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+            return value
+        if self._store is None:
+            self._misses += 1
+            return None
+        try:
+            raw = await self._store.get_cache_entry(self._namespace, key)
+            if raw is None:
+                self._misses += 1
+                return None
+            value = self._deserialize(raw)
+        except Exception:
+            logger.warning("Persistent %s cache read failed for %s", self._namespace, key, exc_info=True)
+            self._misses += 1
+            return None
+        self._l2_hits += 1
+        self._l1.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"l1_hits": self._l1_hits, "l2_hits": self._l2_hits, "misses": self._misses}
+
+    async def set(self, key: str, value: V) -> None:
+        self._l1.set(key, value)
+        if self._store is None:
+            return
+        try:
+            await self._store.put_cache_entry(
+                self._namespace,
+                key,
+                self._serialize(value),
+                ttl_seconds=self._ttl_seconds,
+                max_entries=self._max_entries,
+            )
+        except Exception:
+            logger.warning("Persistent %s cache write failed for %s", self._namespace, key, exc_info=True)
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesce concurrent async calls that share a key into one execution.
+
+    The first caller for a key (the leader) schedules ``factory()`` as a task;
+    callers arriving while it is still running await the same task instead of
+    starting their own. The task is shielded so a leader that disconnects does
+    not cancel the work its followers are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[K, asyncio.Task[V]] = {}
+
+    def in_flight(self, key: K) -> bool:
+        return key in self._inflight
+
+    async def run(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome as retrieved so an exception nobody awaited (all
+        # callers cancelled) does not surface as an "unretrieved" warning.
+        if not task.cancelled():
+            task.exception()
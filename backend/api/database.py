@@ -6,7 +6,7 @@ import asyncio
 import hashlib
 import logging
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -150,6 +150,19 @@ class Database:
 
             DROP TABLE IF EXISTS transactions;
 
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL,
+                PRIMARY KEY (namespace, key)
+            );
+
+            CREATE INDEX IF NOT EXISTS cache_entries_access_idx
+                ON cache_entries(namespace, accessed_at);
+
             CREATE TABLE IF NOT EXISTS payments (
                 id TEXT PRIMARY KEY,
                 user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -336,6 +349,30 @@ class Database:
             redeemed_at=_parse_dt(row["redeemed_at"]),
         )
 
+    async def refresh_reservation(self, credit: Credit) -> Optional[Credit]:
+        """Restart the reservation TTL of a credit this caller still holds.
+
+        Returns ``None`` when the reservation lapsed and the credit was
+        reserved or redeemed by someone else in the meantime.
+        """
+
+        if credit.reserved_at is None:
+            return None
+        conn = self._ensure_conn()
+        now = utcnow()
+        async with self._lock:
+            cursor = await conn.execute(
+                """
+                UPDATE credits SET reserved_at = ?
+                WHERE id = ? AND redeemed_at IS NULL AND reserved_at = ?
+                """,
+                (_serialize_dt(now), credit.id, _serialize_dt(credit.reserved_at)),
+            )
+            await conn.commit()
+        if cursor.rowcount != 1:
+            return None
+        return replace(credit, reserved_at=now)
+
     async def release_credit(self, credit_id: str) -> None:
         conn = self._ensure_conn()
         await conn.execute(
@@ -344,12 +381,26 @@ class Database:
         )
         await conn.commit()
 
-    async def redeem_credit(self, credit_id: str) -> None:
+    async def redeem_credit(self, credit_id: str) -> bool:
+        """Mark a credit redeemed; ``False`` if another report already redeemed it."""
+
         conn = self._ensure_conn()
         now_iso = _serialize_dt(utcnow())
+        async with self._lock:
+            cursor = await conn.execute(
+                "UPDATE credits SET redeemed_at = ?, reserved_at = ? WHERE id = ? AND redeemed_at IS NULL",
+                (now_iso, now_iso, credit_id),
+            )
+            await conn.commit()
+        return cursor.rowcount == 1
+
+    async def refund_credit(self, credit_id: str) -> None:
+        """Undo :meth:`redeem_credit` when the report it paid for could not be recorded."""
+
+        conn = self._ensure_conn()
         await conn.execute(
-            "UPDATE credits SET redeemed_at = ?, reserved_at = ? WHERE id = ?",
-            (now_iso, now_iso, credit_id),
+            "UPDATE credits SET redeemed_at = NULL, reserved_at = NULL WHERE id = ?",
+            (credit_id,),
         )
         await conn.commit()
 
@@ -448,3 +499,73 @@ class Database:
         ) as cursor:
             row = await cursor.fetchone()
         return bool(row)
+
+    async def get_cache_entry(self, namespace: str, key: str) -> Optional[str]:
+        conn = self._ensure_conn()
+        now_iso = _serialize_dt(utcnow())
+        async with conn.execute(
+            "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, now_iso),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        await conn.execute(
+            "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+            (now_iso, namespace, key),
+        )
+        await conn.commit()
+        return row["value"]
+
+    async def put_cache_entry(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        *,
+        ttl_seconds: int,
+        max_entries: int,
+    ) -> None:
+        """Upsert a cache entry, then evict expired and least recently used rows."""
+
+        conn = self._ensure_conn()
+        now = utcnow()
+        now_iso = _serialize_dt(now)
+        async with self._lock:
+            await conn.execute(
+                """
+                INSERT INTO cache_entries (namespace, key, value, created_at, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(namespace, key) DO UPDATE SET
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (
+                    namespace,
+                    key,
+                    value,
+                    now_iso,
+                    _serialize_dt(now + timedelta(seconds=ttl_seconds)),
+                    now_iso,
+                ),
+            )
+            await conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+                (namespace, now_iso),
+            )
+            await conn.execute(
+                """
+                DELETE FROM cache_entries
+                WHERE namespace = ?
+                  AND key NOT IN (
+                      SELECT key FROM cache_entries
+                      WHERE namespace = ?
+                      ORDER BY accessed_at DESC, rowid DESC
+                      LIMIT ?
+                  )
+                """,
+                (namespace, namespace, max_entries),
+            )
+            await conn.commit()
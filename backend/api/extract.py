@@ -5,15 +5,31 @@ from __future__ import annotations
 import asyncio
 import json
 import re
-from dataclasses import dataclass, field
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 from playwright.async_api import Page, Response
 from trafilatura import extract as trafilatura_extract
+from trafilatura import load_html
 
 from .browser import BrowserManager
-from .utils import DEFAULT_USER_AGENT, extract_im_width, parse_srcset
+from .pdp import PayloadExtraction, extract_from_payload
+from .telemetry import span
+from .settle import (
+    NetworkMonitor,
+    settle,
+    wait_for_any_selector,
+    wait_for_dialog,
+    wait_for_dialog_closed,
+    wait_for_dom_quiet,
+)
+from .utils import extract_im_width, parse_srcset
 
 
 _GENERIC_ALT_PATTERNS = (
@@ -22,6 +38,15 @@ _GENERIC_ALT_PATTERNS = (
 )
 _BACKGROUND_URL_PATTERN = re.compile(r"url\((?:'|\")?(.*?)(?:'|\")?\)")
 _LEGACY_GALLERY_LABEL = re.compile(r"\b(?:listing\s+)?image\s*\d+(?:\s+of\s+\d+)?$", re.I)
+# Modals are parsed the way trafilatura parses pages: without comments or PIs.
+_FRAGMENT_PARSER = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+_LISTING_READY_SELECTORS = (
+    '[data-testid="title"]',
+    '[data-section-id="DESCRIPTION_DEFAULT"]',
+    '[data-section-id="AMENITIES_DEFAULT"]',
+    "h1",
+)
 
 
 @dataclass
@@ -51,18 +76,82 @@ class ListingContent:
     uses_legacy_gallery: bool = False
     debug: dict = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation (without debug data)."""
+        data = asdict(self)
+        data.pop("debug", None)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ListingContent":
+        photos = [PhotoMeta(**photo) for photo in data.get("photos") or []]
+        return cls(**{**data, "photos": photos})
+
+
+@dataclass
+class ListingCapture:
+    """Raw render artifacts for one listing.
+
+    Holds only strings, lists and JSON dicts so it can be pickled to a worker
+    process and fed to :func:`extract_listing` away from the event loop.
+    """
 
-async def render_listing(
+    url: str
+    html: str
+    photo_modal_html: Optional[str] = None
+    amenities_modal_html: Optional[str] = None
+    amenities_items: List[str] = field(default_factory=list)
+    preloaded_state: Optional[dict] = None
+    responses: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ListingCapture":
+        return cls(**data)
+
+    def extract(self) -> ListingContent:
+        return extract_listing(
+            self.html,
+            self.url,
+            photo_overlay_html=self.photo_modal_html,
+            amenities_html=self.amenities_modal_html,
+            amenities_items=self.amenities_items,
+            preloaded_state=self.preloaded_state,
+        )
+
+    def debug_info(self) -> dict:
+        return {
+            "preloaded_state": bool(self.preloaded_state),
+            "payload_fields": extract_from_payload(self.preloaded_state).found_fields(),
+            "photo_modal": bool(self.photo_modal_html),
+            "amenities_modal": bool(self.amenities_modal_html),
+            "raw_html": self.html,
+            "photo_modal_html": self.photo_modal_html,
+            "amenities_modal_html": self.amenities_modal_html,
+            "amenities_items": self.amenities_items,
+            "preloaded_state_raw": self.preloaded_state,
+            "responses": self.responses[:50],
+        }
+
+
+async def capture_listing(
     url: str,
     browser_manager: BrowserManager,
-    wait_after_load_ms: int = 1200,
-    scroll_timeout_ms: int = 500,
+    ready_timeout_ms: int = 5000,
+    scroll_pause_ms: int = 60,
+    settle_timeout_ms: int = 3000,
     capture_debug: bool = False,
-) -> ListingContent:
-    """Render a listing URL with Playwright and return structured content."""
+) -> ListingCapture:
+    """Render a listing URL with Playwright and collect the raw artifacts.
+
+    Waits are driven by page signals (listing markup present, PdpSections
+    payload received, network and DOM quiet); the ``*_timeout_ms`` values are
+    only upper bounds.
+    """
 
     async with browser_manager.page() as page:
-        await _prepare_page(page)
         captured_responses: List[str] = []
 
         if capture_debug:
@@ -78,70 +167,67 @@ async def render_listing(
 
             page.on("response", _store_response)
 
+        # Pages are pooled, so listeners and waiters must not outlive this render.
         payload_task = asyncio.create_task(_wait_for_listing_payload(page))
-        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        if wait_after_load_ms:
-            await page.wait_for_timeout(wait_after_load_ms)
-        await _auto_scroll(page, scroll_timeout_ms)
-        # Allow any lazy content to settle.
-        await page.wait_for_timeout(500)
-
-        html = await page.content()
-        preloaded_state = await _gather_listing_payload(payload_task)
-        if not preloaded_state:
-            preloaded_state = await _get_preloaded_state(page)
-        photo_modal_html = await _capture_photo_modal(page)
-        amenities_modal_html, amenities_items = await _capture_amenities_modal(page)
-
-    listing = extract_listing(
-        html,
-        url,
-        photo_overlay_html=photo_modal_html,
-        amenities_html=amenities_modal_html,
+        monitor = NetworkMonitor(page)
+        try:
+            with span("goto"):
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                await wait_for_any_selector(page, _LISTING_READY_SELECTORS, timeout_ms=ready_timeout_ms)
+            with span("auto_scroll"):
+                await _auto_scroll(page, scroll_pause_ms)
+            # Allow lazy sections revealed by scrolling to finish loading.
+            with span("settle"):
+                await settle(page, monitor, payload_task, timeout_ms=settle_timeout_ms)
+
+            html = await page.content()
+            preloaded_state = await _gather_listing_payload(payload_task)
+            if not preloaded_state:
+                preloaded_state = await _get_preloaded_state(page)
+            # Only open the (slow) modals for fields the payload did not cover.
+            structured = extract_from_payload(preloaded_state)
+            photo_modal_html = None
+            if not structured.photos:
+                with span("photo_modal"):
+                    photo_modal_html = await _capture_photo_modal(page)
+            amenities_modal_html: Optional[str] = None
+            amenities_items: List[str] = []
+            if not structured.amenities:
+                with span("amenities_modal"):
+                    amenities_modal_html, amenities_items = await _capture_amenities_modal(page)
+        finally:
+            monitor.detach()
+            if not payload_task.done():
+                payload_task.cancel()
+            if capture_debug:
+                page.remove_listener("response", _store_response)
+
+    return ListingCapture(
+        url=url,
+        html=html,
+        photo_modal_html=photo_modal_html,
+        amenities_modal_html=amenities_modal_html,
         amenities_items=amenities_items,
         preloaded_state=preloaded_state,
+        responses=captured_responses,
     )
 
-    if capture_debug:
-        listing.debug.update(
-            {
-                "preloaded_state": bool(preloaded_state),
-                "photo_modal": bool(photo_modal_html),
-                "amenities_modal": bool(amenities_modal_html),
-                "raw_html": html,
-                "photo_modal_html": photo_modal_html,
-                "amenities_modal_html": amenities_modal_html,
-                "amenities_items": amenities_items,
-                "preloaded_state_raw": preloaded_state,
-                "responses": captured_responses[:50],
-            }
-        )
-
-    return listing
-
-
-async def _prepare_page(page: Page) -> None:
-    await page.set_extra_http_headers({"user-agent": DEFAULT_USER_AGENT})
-    await page.set_viewport_size({"width": 1280, "height": 900})
 
-
-async def _auto_scroll(page: Page, scroll_timeout_ms: int) -> None:
+async def _auto_scroll(page: Page, pause_ms: int, max_steps: int = 60) -> None:
     await page.evaluate(
-        """async (pause) => {
-            await new Promise((resolve) => {
-                let totalHeight = 0;
-                const distance = 600;
-                const timer = setInterval(() => {
-                    window.scrollBy(0, distance);
-                    totalHeight += distance;
-                    if (totalHeight >= document.body.scrollHeight) {
-                        clearInterval(timer);
-                        resolve();
-                    }
-                }, pause);
-            });
+        """async ({pause, maxSteps}) => {
+            const distance = 800;
+            let position = 0;
+            for (let step = 0; step < maxSteps; step += 1) {
+                window.scrollBy(0, distance);
+                position += distance;
+                await new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, pause)));
+                if (position >= document.body.scrollHeight) {
+                    break;
+                }
+            }
         }""",
-        scroll_timeout_ms,
+        {"pause": pause_ms, "maxSteps": max_steps},
     )
 
 
@@ -212,16 +298,16 @@ async def _capture_photo_modal(page: Page) -> Optional[str]:
         opened = False
         try:
             await page.evaluate("(el) => el.click()", element)
-            await page.wait_for_timeout(600)
+            await wait_for_dialog(page)
             # Dismiss translation modal if it appears.
             translation_dialog = await page.query_selector('[data-testid=\"translation-announce-modal\"]')
             if translation_dialog:
                 close_btn = await translation_dialog.query_selector('button[aria-label=\"Close\"]')
                 if close_btn:
                     await page.evaluate("(el) => el.click()", close_btn)
-                    await page.wait_for_timeout(200)
+                    await wait_for_dialog_closed(page)
                     await page.evaluate("(el) => el.click()", element)
-                    await page.wait_for_timeout(600)
+                    await wait_for_dialog(page)
             dialog = await page.query_selector('div[role=\"dialog\"]')
             if not dialog:
                 continue
@@ -229,7 +315,7 @@ async def _capture_photo_modal(page: Page) -> Optional[str]:
                 close_btn = await dialog.query_selector('button[aria-label=\"Close\"]')
                 if close_btn:
                     await page.evaluate("(el) => el.click()", close_btn)
-                    await page.wait_for_timeout(200)
+                    await wait_for_dialog_closed(page)
                 continue
             opened = True
             await page.evaluate(
@@ -249,7 +335,7 @@ async def _capture_photo_modal(page: Page) -> Optional[str]:
                     });
                 }"""
             )
-            await page.wait_for_timeout(800)
+            await wait_for_dom_quiet(page, quiet_ms=250, timeout_ms=2000, root=dialog)
             html = await page.evaluate(
                 """() => {
                     const dialog = document.querySelector('div[role="dialog"]');
@@ -302,9 +388,8 @@ async def _capture_amenities_modal(page: Page) -> tuple[Optional[str], List[str]
             return None, []
         for _, button, _lowered in scored_buttons:
             await page.evaluate('(el) => el.scrollIntoView({block: "center"})', button)
-            await page.wait_for_timeout(150)
             await page.evaluate('(el) => el.click()', button)
-            await page.wait_for_timeout(600)
+            await wait_for_dialog(page)
             dialog = None
             dialogs = await page.query_selector_all('div[role="dialog"]')
             for candidate_dialog in reversed(dialogs):
@@ -316,7 +401,6 @@ async def _capture_amenities_modal(page: Page) -> tuple[Optional[str], List[str]
                     dialog = candidate_dialog
                     break
             if not dialog:
-                await page.wait_for_timeout(200)
                 continue
             translation_modal = await dialog.query_selector('[data-testid="translation-announce-modal"]')
             text_content = (await dialog.inner_text()) or ''
@@ -325,11 +409,10 @@ async def _capture_amenities_modal(page: Page) -> tuple[Optional[str], List[str]
                 close_btn = await dialog.query_selector('button[aria-label="Close"]')
                 if close_btn:
                     await page.evaluate('(el) => el.click()', close_btn)
-                    await page.wait_for_timeout(200)
+                    await wait_for_dialog_closed(page)
                 return await _open(selector, depth + 1)
             if 'amenit' not in lowered_content and 'what this place offers' not in lowered_content:
                 await _close_modal(page)
-                await page.wait_for_timeout(200)
                 continue
             await page.evaluate(
                 """(dialog) => {
@@ -345,7 +428,7 @@ async def _capture_amenities_modal(page: Page) -> tuple[Optional[str], List[str]
                 }""",
                 dialog,
             )
-            await page.wait_for_timeout(600)
+            await wait_for_dom_quiet(page, quiet_ms=250, timeout_ms=2000, root=dialog)
             html = await page.evaluate(
                 """(dialog) => dialog ? dialog.outerHTML : null""",
                 dialog,
@@ -369,7 +452,6 @@ async def _capture_amenities_modal(page: Page) -> tuple[Optional[str], List[str]
             cleaned = [item for item in items if item]
             if cleaned:
                 return html, cleaned
-            await page.wait_for_timeout(200)
         return None, []
 
     for selector in selectors:
@@ -384,13 +466,13 @@ async def _close_modal(page: Page) -> None:
         close_button = page.locator('button[aria-label="Close"], button:has-text("Close")')
         if await close_button.count():
             await close_button.first.click(force=True)
-            await page.wait_for_timeout(300)
+            await wait_for_dialog_closed(page)
             return
     except Exception:
         pass
     try:
         await page.keyboard.press("Escape")
-        await page.wait_for_timeout(200)
+        await wait_for_dialog_closed(page, timeout_ms=1000)
     except Exception:
         return
 
@@ -403,27 +485,42 @@ def extract_listing(
     amenities_items: Optional[List[str]] = None,
     preloaded_state: Optional[dict] = None,
 ) -> ListingContent:
-    """Parse rendered HTML into structured listing content."""
-    soup = BeautifulSoup(html, "html.parser")
-    overlay_soup = BeautifulSoup(photo_overlay_html, "html.parser") if photo_overlay_html else None
-    amenities_soup = BeautifulSoup(amenities_html, "html.parser") if amenities_html else None
-
-    title = _pick_text(
-        soup,
+    """Parse rendered HTML into structured listing content.
+
+    Fields present in the PdpSections payload (``preloaded_state``) are taken
+    from it directly; DOM and modal scraping only fill the gaps.
+    """
+    structured = extract_from_payload(preloaded_state)
+    # Each document is parsed once with lxml and the tree is shared by every
+    # field extractor below, including trafilatura's full-text pass.
+    page = load_html(html) if html.strip() else None
+    if page is not None:
+        # trafilatura prunes the tree it is given, so it works on a copy.
+        full_text = trafilatura_extract(deepcopy(page), include_comments=False, favor_precision=True) or ""
+    else:
+        # trafilatura rejects input that does not look like an HTML page.
+        full_text = ""
+        page = _parse_fragment(html)
+    overlay = _parse_fragment(photo_overlay_html) if photo_overlay_html else None
+    amenities_tree = _parse_fragment(amenities_html) if amenities_html else None
+
+    title = structured.title or _pick_text(
+        page,
         selectors=[
             '[data-testid="title"]',
             '[data-testid="photo-viewer-detail-title"]',
             "h1",
         ],
     )
-    summary = _pick_summary(soup)
-    description = _pick_description(soup)
-    full_text = trafilatura_extract(html, include_comments=False, favor_precision=True) or ""
-    amenities_listed = _extract_amenities(soup, amenities_soup, preloaded_state, amenities_items)
-    house_rules = _extract_house_rules(soup)
-    reviews = _extract_reviews(soup, limit=2)
-    uses_legacy_gallery = _detect_legacy_gallery(soup, overlay_soup)
-    photos = _extract_photos(soup, overlay_soup, preloaded_state)
+    summary = structured.summary or _pick_summary(page)
+    description = structured.description or _pick_description(page)
+    amenities_listed = structured.amenities or _extract_amenities(
+        page, amenities_tree, preloaded_state, amenities_items
+    )
+    house_rules = structured.house_rules or _extract_house_rules(page)
+    reviews = structured.reviews[:2] or _extract_reviews(page, limit=2)
+    uses_legacy_gallery = _detect_legacy_gallery(page, overlay)
+    photos = _payload_photos(structured) or _extract_photos(page, overlay, preloaded_state)
 
     return ListingContent(
         url=url,
@@ -439,17 +536,72 @@ def extract_listing(
     )
 
 
-def _pick_text(soup: BeautifulSoup, selectors: List[str]) -> str:
+def _parse_fragment(markup: str) -> HtmlElement:
+    """Parse a modal (or any partial markup) under a wrapper ``div``."""
+
+    if not markup.strip():
+        return lxml_html.Element("div")
+    try:
+        return lxml_html.fragment_fromstring(markup, create_parent="div", parser=_FRAGMENT_PARSER)
+    except ValueError:
+        # Unicode input may not carry an XML encoding declaration; parse the bytes.
+        return lxml_html.fragment_fromstring(markup.encode("utf-8"), create_parent="div", parser=_FRAGMENT_PARSER)
+
+
+@lru_cache(maxsize=None)
+def _css(selector: str) -> CSSSelector:
+    return CSSSelector(selector, translator="html")
+
+
+def _select(node: HtmlElement, selector: str) -> List[HtmlElement]:
+    return _css(selector)(node)
+
+
+def _select_one(node: HtmlElement, selector: str) -> Optional[HtmlElement]:
+    matches = _css(selector)(node)
+    return matches[0] if matches else None
+
+
+def _node_text(node: HtmlElement, separator: str = " ") -> str:
+    """Stripped text runs of ``node`` joined by ``separator``.
+
+    Comments and script, style and template contents are skipped.
+    """
+
+    parts: List[str] = []
+
+    def walk(element: HtmlElement) -> None:
+        if element.text:
+            parts.append(element.text)
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    if isinstance(node.tag, str) and node.tag not in _NON_TEXT_TAGS:
+        walk(node)
+    return separator.join(stripped for part in parts if (stripped := part.strip()))
+
+
+def _payload_photos(structured: PayloadExtraction) -> List[PhotoMeta]:
+    return [
+        PhotoMeta(url=photo.url, width=photo.width, alt=photo.alt, srcset=[photo.url])
+        for photo in structured.photos
+    ]
+
+
+def _pick_text(tree: HtmlElement, selectors: List[str]) -> str:
     for selector in selectors:
-        node = soup.select_one(selector)
-        if node and (text := node.get_text(" ", strip=True)):
+        node = _select_one(tree, selector)
+        if node is not None and (text := _node_text(node)):
             return text
     return ""
 
 
-def _pick_summary(soup: BeautifulSoup) -> str:
+def _pick_summary(tree: HtmlElement) -> str:
     summary = _pick_text(
-        soup,
+        tree,
         selectors=[
             '[data-testid="place_breadcrumb"]',
             '[data-testid="subtitle"]',
@@ -458,21 +610,21 @@ def _pick_summary(soup: BeautifulSoup) -> str:
     )
     if summary:
         return summary
-    meta = soup.find("meta", attrs={"name": "description"})
-    if meta and meta.get("content"):
-        return meta["content"].strip()
-    meta = soup.find("meta", attrs={"property": "og:description"})
-    return meta["content"].strip() if meta and meta.get("content") else ""
+    for xpath in ('//meta[@name="description"]', '//meta[@property="og:description"]'):
+        meta = tree.xpath(xpath)
+        if meta:
+            return (meta[0].get("content") or "").strip()
+    return ""
 
 
-def _pick_description(soup: BeautifulSoup) -> str:
-    section = soup.select_one('[data-section-id="DESCRIPTION_DEFAULT"]')
-    if not section:
-        section = soup.select_one('[data-testid="listing-description"]')
+def _pick_description(tree: HtmlElement) -> str:
+    section = _select_one(tree, '[data-section-id="DESCRIPTION_DEFAULT"]')
+    if section is None:
+        section = _select_one(tree, '[data-testid="listing-description"]')
     paragraphs: List[str] = []
-    if section:
-        for node in section.select("p, span"):
-            text = node.get_text(" ", strip=True)
+    if section is not None:
+        for node in _select(section, "p, span"):
+            text = _node_text(node)
             if text:
                 paragraphs.append(text)
     description = "\n".join(paragraphs)
@@ -480,8 +632,8 @@ def _pick_description(soup: BeautifulSoup) -> str:
 
 
 def _extract_amenities(
-    soup: BeautifulSoup,
-    amenities_soup: Optional[BeautifulSoup] = None,
+    tree: HtmlElement,
+    amenities_tree: Optional[HtmlElement] = None,
     preloaded_state: Optional[dict] = None,
     external_items: Optional[List[str]] = None,
 ) -> List[str]:
@@ -498,32 +650,32 @@ def _extract_amenities(
             return None
         return primary
 
-    def collect(container: Optional[BeautifulSoup]) -> None:
-        if not container:
+    def collect(container: Optional[HtmlElement]) -> None:
+        if container is None:
             return
-        section = container.select_one('[data-section-id="AMENITIES_DEFAULT"]')
-        if section:
-            for node in section.select('[data-testid="amenity-item"]'):
-                text = normalize_text(node.get_text("\n", strip=True))
+        section = _select_one(container, '[data-section-id="AMENITIES_DEFAULT"]')
+        if section is not None:
+            for node in _select(section, '[data-testid="amenity-item"]'):
+                text = normalize_text(_node_text(node, "\n"))
                 if text:
                     items.append(text)
-        for node in container.select('[itemprop="amenityFeature"] span'):
-            text = normalize_text(node.get_text("\n", strip=True))
+        for node in _select(container, '[itemprop="amenityFeature"] span'):
+            text = normalize_text(_node_text(node, "\n"))
             if text:
                 items.append(text)
-        for node in container.select('ul[role="list"] li'):
-            if "amenit" in (node.get_text(" ", strip=True) or "").lower():
+        for node in _select(container, 'ul[role="list"] li'):
+            if "amenit" in _node_text(node).lower():
                 continue
-            text = normalize_text(node.get_text("\n", strip=True))
+            text = normalize_text(_node_text(node, "\n"))
             if text:
                 items.append(text)
-        for node in container.select('[data-testid="pdp-section-amenities-item"]'):
-            text = normalize_text(node.get_text("\n", strip=True))
+        for node in _select(container, '[data-testid="pdp-section-amenities-item"]'):
+            text = normalize_text(_node_text(node, "\n"))
             if text:
                 items.append(text)
 
-    collect(soup)
-    collect(amenities_soup)
+    collect(tree)
+    collect(amenities_tree)
     if external_items:
         for item in external_items:
             text = normalize_text(item.replace("\r", "\n"))
@@ -533,7 +685,7 @@ def _extract_amenities(
     return list(dict.fromkeys(items))
 
 
-def _extract_house_rules(soup: BeautifulSoup) -> List[str]:
+def _extract_house_rules(tree: HtmlElement) -> List[str]:
     rules: List[str] = []
 
     def add_rule(text: Optional[str]) -> None:
@@ -545,41 +697,45 @@ def _extract_house_rules(soup: BeautifulSoup) -> List[str]:
             return
         rules.append(cleaned)
 
-    def drain(container: Optional[BeautifulSoup]) -> None:
-        if not container:
+    def drain(container: Optional[HtmlElement]) -> None:
+        if container is None:
             return
-        for node in container.select("li, p, span"):
-            if node.find_parent("button"):
+        for node in _select(container, "li, p, span"):
+            if next(node.iterancestors("button"), None) is not None:
                 continue
-            add_rule(node.get_text(" ", strip=True))
-
-    section = soup.select_one('[data-section-id="POLICIES_DEFAULT"]')
-    if section:
-        heading = section.find(
-            lambda tag: tag.name in {"h2", "h3"}
-            and "house rules" in tag.get_text(" ", strip=True).lower()
+            add_rule(_node_text(node))
+
+    section = _select_one(tree, '[data-section-id="POLICIES_DEFAULT"]')
+    if section is not None:
+        heading = next(
+            (
+                node
+                for node in section.iterdescendants("h2", "h3")
+                if "house rules" in _node_text(node).lower()
+            ),
+            None,
         )
-        if heading:
-            column = heading.parent.parent if heading.parent else None
-            drain(column)
+        if heading is not None:
+            parent = heading.getparent()
+            drain(parent.getparent() if parent is not None else None)
 
     if not rules:
-        legacy_section = soup.select_one('[data-section-id="HOUSE_RULES_DEFAULT"]')
+        legacy_section = _select_one(tree, '[data-section-id="HOUSE_RULES_DEFAULT"]')
         drain(legacy_section)
 
-    modal = soup.select_one('[aria-label="House rules"]')
+    modal = _select_one(tree, '[aria-label="House rules"]')
     drain(modal)
 
     # Preserve original order while removing duplicates.
     return list(dict.fromkeys(rules))
 
 
-def _extract_reviews(soup: BeautifulSoup, limit: int = 2) -> List[str]:
+def _extract_reviews(tree: HtmlElement, limit: int = 2) -> List[str]:
     reviews: List[str] = []
-    section = soup.select_one('[data-section-id="REVIEWS_DEFAULT"]')
-    if section:
-        for node in section.select('[data-testid="review-card"]'):
-            text = node.get_text(" ", strip=True)
+    section = _select_one(tree, '[data-section-id="REVIEWS_DEFAULT"]')
+    if section is not None:
+        for node in _select(section, '[data-testid="review-card"]'):
+            text = _node_text(node)
             if text:
                 reviews.append(text)
             if len(reviews) >= limit:
@@ -587,8 +743,8 @@ def _extract_reviews(soup: BeautifulSoup, limit: int = 2) -> List[str]:
     if reviews:
         return reviews[:limit]
     # Fallback to general review text.
-    for node in soup.select('[data-testid="review-item"], [data-testid="review-text"]'):
-        text = node.get_text(" ", strip=True)
+    for node in _select(tree, '[data-testid="review-item"], [data-testid="review-text"]'):
+        text = _node_text(node)
         if text:
             reviews.append(text)
         if len(reviews) >= limit:
@@ -597,8 +753,8 @@ def _extract_reviews(soup: BeautifulSoup, limit: int = 2) -> List[str]:
 
 
 def _extract_photos(
-    soup: BeautifulSoup,
-    overlay_soup: Optional[BeautifulSoup] = None,
+    tree: HtmlElement,
+    overlay: Optional[HtmlElement] = None,
     preloaded_state: Optional[dict] = None,
 ) -> List[PhotoMeta]:
     photos: List[PhotoMeta] = []
@@ -612,21 +768,18 @@ def _extract_photos(
             return True
         return any(pattern.search(normalized) for pattern in _GENERIC_ALT_PATTERNS)
 
-    def _aria_reference_text(ref: Optional[str], container: BeautifulSoup) -> Optional[str]:
+    def _aria_reference_text(ref: Optional[str], container: HtmlElement) -> Optional[str]:
         if not ref:
             return None
         for ref_id in ref.split():
-            target = container.find(id=ref_id)
-            if isinstance(target, Tag):
-                label = target.get_text(" ", strip=True)
+            matches = container.xpath(".//*[@id=$ref_id]", ref_id=ref_id)
+            if matches:
+                label = _node_text(matches[0])
                 if label and not _is_generic_alt(label):
                     return label
         return None
 
-    def _infer_photo_label(node: Optional[Tag], container: BeautifulSoup) -> str:
-        if not isinstance(node, Tag):
-            return ""
-
+    def _infer_photo_label(node: HtmlElement, container: HtmlElement) -> str:
         direct_alt = (node.get("alt") or "").strip()
         if direct_alt and not _is_generic_alt(direct_alt):
             return direct_alt
@@ -647,9 +800,7 @@ def _extract_photos(
         if describedby_text:
             return describedby_text
 
-        for ancestor in node.parents:
-            if not isinstance(ancestor, Tag):
-                continue
+        for ancestor in node.iterancestors():
             ancestor_aria = (ancestor.get("aria-label") or "").strip()
             if ancestor_aria and not _is_generic_alt(ancestor_aria):
                 return ancestor_aria
@@ -666,11 +817,11 @@ def _extract_photos(
             if ancestor_describedby:
                 return ancestor_describedby
 
-            if ancestor.name == "button":
+            if ancestor.tag == "button":
                 button_title = (ancestor.get("title") or "").strip()
                 if button_title and not _is_generic_alt(button_title):
                     return button_title
-                button_text = ancestor.get_text(" ", strip=True)
+                button_text = _node_text(ancestor)
                 if button_text and not _is_generic_alt(button_text):
                     return button_text
 
@@ -681,16 +832,15 @@ def _extract_photos(
 
         return direct_alt if direct_alt and not _is_generic_alt(direct_alt) else ""
 
-    def collect(container: BeautifulSoup) -> None:
-        for picture in container.find_all("picture"):
-            sources = picture.find_all("source")
+    def collect(container: HtmlElement) -> None:
+        for picture in container.iter("picture"):
             candidates = []
-            for source in sources:
+            for source in picture.iter("source"):
                 srcset = source.get("srcset")
                 if srcset:
                     candidates.extend(parse_srcset(srcset))
-            img = picture.find("img")
-            if img:
+            img = next(picture.iter("img"), None)
+            if img is not None:
                 src = img.get("src", "")
                 if not candidates and src:
                     width = extract_im_width(src)
@@ -698,10 +848,6 @@ def _extract_photos(
                 alt = _infer_photo_label(img, container)
             else:
                 alt = ""
-            if not candidates and img:
-                src = img.get("src", "")
-                if src:
-                    candidates.append((src, extract_im_width(src)))
             if not candidates:
                 continue
             url, width = max(candidates, key=lambda item: item[1])
@@ -717,8 +863,8 @@ def _extract_photos(
                 )
             )
 
-        for img in container.find_all("img"):
-            if img.find_parent("picture"):
+        for img in container.iter("img"):
+            if next(img.iterancestors("picture"), None) is not None:
                 continue
             src = img.get("src", "")
             srcset = img.get("srcset", "")
@@ -746,7 +892,7 @@ def _extract_photos(
                 )
             )
 
-        for role_img in container.select('[role="img"]'):
+        for role_img in _select(container, '[role="img"]'):
             style_attr = role_img.get("style") or ""
             match = _BACKGROUND_URL_PATTERN.search(style_attr)
             if not match:
@@ -766,28 +912,31 @@ def _extract_photos(
                 )
             )
 
-    collect(soup)
-    if overlay_soup:
-        collect(overlay_soup)
+    collect(tree)
+    if overlay is not None:
+        collect(overlay)
 
     return photos
 
 
-def _detect_legacy_gallery(
-    soup: BeautifulSoup, overlay_soup: Optional[BeautifulSoup] = None
-) -> bool:
-    def has_legacy_markers(container: Optional[BeautifulSoup]) -> bool:
-        if not container:
-            return False
-        attr_names = ("aria-label", "alt", "title")
+def _detect_legacy_gallery(tree: HtmlElement, overlay: Optional[HtmlElement] = None) -> bool:
+    attr_names = ("aria-label", "alt", "title")
+
+    def is_marker(node: HtmlElement) -> bool:
         for attr in attr_names:
-            node = container.find(attrs={attr: _LEGACY_GALLERY_LABEL})
-            if node:
+            value = node.get(attr)
+            if value and _LEGACY_GALLERY_LABEL.search(value):
                 return True
-        for button in container.select("button"):
-            label = button.get_text(" ", strip=True)
+        if node.tag == "button":
+            label = _node_text(node)
             if label and _LEGACY_GALLERY_LABEL.match(label):
                 return True
         return False
 
-    return has_legacy_markers(overlay_soup) or has_legacy_markers(soup)
+    def has_legacy_markers(container: Optional[HtmlElement]) -> bool:
+        if container is None:
+            return False
+        # One traversal covers the attribute labels and button text checks.
+        return any(is_marker(node) for node in container.iter(etree.Element))
+
+    return has_legacy_markers(overlay) or has_legacy_markers(tree)
@@ -9,9 +9,9 @@ from typing import List, Pattern, Set
 
 from textstat import textstat
 
-from .amenity_matcher import detect_amenity_mentions
+from .amenity_matcher import detect_amenity_mentions, embeddings_deferred
 from .extract import ListingContent, PhotoMeta
-from .models import AmenityAudit, CopyStats, PhotoStats, SectionScores, TopFix, TrustSignals
+from .models import AmenityAudit, AssessmentResponse, CopyStats, PhotoStats, SectionScores, TopFix, TrustSignals
 
 _IMPACT_PRIORITY = {"high": 0, "medium": 1, "low": 2}
 
@@ -70,6 +70,22 @@ class HeuristicResult:
     amenities: AmenityAudit
     trust_stats: TrustSignals
     recommendations: List[TopFix] = field(default_factory=list)
+    # Set when amenity matching ran without embeddings because the model was still loading.
+    provisional: bool = False
+
+
+def build_response(heuristics: HeuristicResult) -> AssessmentResponse:
+    """Wrap heuristic results in the report model, before any LLM refinement."""
+
+    return AssessmentResponse(
+        overall=heuristics.overall,
+        section_scores=heuristics.section_scores,
+        photo_stats=heuristics.photo_stats,
+        copy_stats=heuristics.copy_stats,
+        trust_signals=heuristics.trust_stats,
+        amenities=heuristics.amenities,
+        top_fixes=heuristics.recommendations,
+    )
 
 
 _LEGACY_IMAGE_LABEL = re.compile(r"\b(?:listing\s+)?image\s*\d+(?:\s+of\s+\d+)?$", re.I)
@@ -94,6 +110,7 @@ def _coerce_legacy_gallery_flag(photos: List[PhotoMeta], uses_legacy_gallery: bo
 
 def run_heuristics(content: ListingContent) -> HeuristicResult:
     """Compute deterministic metrics for a listing."""
+    provisional = embeddings_deferred()
     uses_legacy_gallery = _coerce_legacy_gallery_flag(
         content.photos, content.uses_legacy_gallery
     )
@@ -122,6 +139,7 @@ def run_heuristics(content: ListingContent) -> HeuristicResult:
         amenities=amenities_audit,
         trust_stats=trust_stats,
         recommendations=top_recos,
+        provisional=provisional,
     )
 
 
@@ -0,0 +1,192 @@
+"""In-memory background jobs for long-running assessments.
+
+``/assess`` keeps the HTTP request open for the whole render + LLM pipeline.
+Jobs let clients submit, get an id back immediately, and then poll or
+subscribe to stage updates while a fixed pool of workers runs the pipeline.
+Job state lives in process memory, so a job is only visible on the replica
+that accepted it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .database import utcnow
+from .models import AssessmentJobResponse, JobError, JobStage, JobState
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[JobStage], None]
+JobRunner = Callable[[ProgressCallback], Awaitable[Any]]
+CancelCallback = Callable[[], Awaitable[None]]
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when too many jobs are waiting for a worker."""
+
+
+@dataclass
+class Job:
+    id: str
+    owner_id: Optional[str]
+    runner: Optional[JobRunner] = None
+    on_cancel: Optional[CancelCallback] = None
+    state: JobState = JobState.queued
+    stage: JobStage = JobStage.queued
+    result: Any = None
+    error: Optional[JobError] = None
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)
+    _updated: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (JobState.succeeded, JobState.failed)
+
+    def update(self, **changes: Any) -> None:
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self.updated_at = utcnow()
+        waiter, self._updated = self._updated, asyncio.Event()
+        waiter.set()
+
+    def to_response(self) -> AssessmentJobResponse:
+        return AssessmentJobResponse(
+            job_id=self.id,
+            state=self.state,
+            stage=self.stage,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class JobManager:
+    """Queue assessment jobs and run them on a fixed number of worker tasks.
+
+    The worker count bounds how many pipelines run at once independently of
+    how many clients are connected; the browser pool still bounds renders.
+    Finished jobs are kept for ``ttl_seconds`` so clients can collect them.
+    """
+
+    def __init__(self, *, workers: int = 4, max_pending: int = 100, ttl_seconds: int = 3600) -> None:
+        self._worker_count = max(1, workers)
+        self._max_pending = max(1, max_pending)
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._jobs: Dict[str, Job] = {}
+        self._workers: List[asyncio.Task] = []
+        self._running = 0
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"assessment-job-worker-{index}")
+                for index in range(self._worker_count)
+            ]
+
+    async def close(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in list(self._jobs.values()):
+            if not job.finished:
+                on_cancel = job.on_cancel
+                job.update(
+                    state=JobState.failed,
+                    runner=None,
+                    on_cancel=None,
+                    error=JobError(status_code=503, detail="Server shutting down."),
+                )
+                if on_cancel is not None:
+                    try:
+                        await on_cancel()
+                    except Exception:
+                        logger.exception("Cleanup for cancelled job %s failed", job.id)
+
+    def submit(
+        self,
+        runner: JobRunner,
+        *,
+        owner_id: Optional[str] = None,
+        on_cancel: Optional[CancelCallback] = None,
+    ) -> Job:
+        """Queue ``runner``; ``on_cancel`` runs if the job is dropped before it starts."""
+
+        self._prune()
+        if self._queue.qsize() >= self._max_pending:
+            raise JobQueueFull("Too many assessments queued.")
+        job = Job(id=secrets.token_urlsafe(16), owner_id=owner_id, runner=runner, on_cancel=on_cancel)
+        self._jobs[job.id] = job
+        self._queue.put_nowait(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def watch(self, job: Job, *, heartbeat_seconds: float = 15.0) -> AsyncIterator[Optional[Job]]:
+        """Yield ``job`` on every change until it finishes; ``None`` marks a keep-alive."""
+
+        while True:
+            waiter = job._updated
+            yield job
+            if job.finished:
+                return
+            while not waiter.is_set():
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self._worker_count,
+            "queued": self._queue.qsize(),
+            "running": self._running,
+            "retained": len(self._jobs),
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        runner, job.runner, job.on_cancel = job.runner, None, None
+        if runner is None or job.finished:
+            return
+        self._running += 1
+        job.update(state=JobState.running)
+        try:
+            result = await runner(lambda stage: job.update(stage=stage))
+        except asyncio.CancelledError:
+            job.update(state=JobState.failed, error=JobError(status_code=503, detail="Job cancelled."))
+            raise
+        except Exception as exc:
+            status_code = getattr(exc, "status_code", None)
+            if status_code is None:
+                logger.exception("Assessment job %s failed", job.id)
+                status_code, detail = 500, "Unexpected error."
+            else:
+                detail = str(getattr(exc, "detail", "") or exc)
+            job.update(state=JobState.failed, error=JobError(status_code=status_code, detail=detail))
+        else:
+            job.update(state=JobState.succeeded, stage=JobStage.done, result=result)
+        finally:
+            self._running -= 1
+
+    def _prune(self) -> None:
+        cutoff = utcnow() - self._ttl
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.updated_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
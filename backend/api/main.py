@@ -8,32 +8,40 @@ import json
 import logging
 import os
 import warnings
+from contextlib import suppress
+from dataclasses import dataclass, replace
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from httpx import AsyncClient, HTTPStatusError
 from dotenv import load_dotenv
 from urllib3.exceptions import NotOpenSSLWarning
 from playwright.async_api import Error as PlaywrightError
 
+from .amenity_matcher import model_status, save_sentence_cache, start_model_warmup
 from .auth import MagicLinkService, SessionManager
-from .browser import BrowserManager
-from .cache import AssessmentCache
-from .database import Database, User, UserCreditSummary, utcnow
+from .browser import DEFAULT_BLOCKED_URL_PATTERNS, BrowserManager, ResourceBlockProfile
+from .cache import AssessmentCache, SingleFlight, TieredCache
+from .database import Credit, Database, User, UserCreditSummary, utcnow
 from .emails import ConsoleEmailClient, ResendClient
-from .extract import render_listing
-from .heuristics import run_heuristics
+from .extract import ListingContent, capture_listing
+from .heuristics import build_response
+from .jobs import Job, JobManager, JobQueueFull, ProgressCallback
 from .models import (
+    AssessmentJobResponse,
     AssessmentRequest,
     AssessmentResponse,
+    BatchAssessmentRequest,
     CheckoutConfirmRequest,
     CheckoutSessionRequest,
     CheckoutSessionResponse,
     CreditSummary,
+    JobStage,
+    JobState,
     MagicLinkRequest,
     ReportEnvelope,
     ReportMeta,
@@ -47,10 +55,14 @@ from .polar import (
     PolarService,
 )
 from .scorer import LLMSettings, generate_listing_overview, refine_assessment
-from .utils import build_cache_key, normalize_listing_url
+from .telemetry import ServerTimingMiddleware, span, stage_histograms
+from .utils import build_cache_key, build_listing_cache_key, normalize_listing_url
+from .workers import AnalysisExecutor
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 ROOT_DIR = Path(__file__).resolve().parents[2]
 load_dotenv(ROOT_DIR / ".env")
 warnings.filterwarnings("ignore", category=NotOpenSSLWarning)
@@ -90,17 +102,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(ServerTimingMiddleware)
 
 _startup_lock = asyncio.Lock()
 _is_ready = False
+_background_tasks: set[asyncio.Task] = set()
 
 _browser_manager: Optional[BrowserManager] = None
-_response_cache: Optional[AssessmentCache[str, AssessmentResponse]] = None
+_response_cache: Optional[TieredCache[AssessmentResponse]] = None
+_listing_cache: Optional[TieredCache["ListingAnalysis"]] = None
+_llm_cache: Optional[TieredCache[str]] = None
+_analysis_flights: SingleFlight[str, "ListingAnalysis"] = SingleFlight()
+# Heuristic result of each in-flight listing pipeline, shared with requests that join it.
+_preliminary_results: dict[str, "asyncio.Future[ListingAnalysis]"] = {}
+_analysis_executor: Optional[AnalysisExecutor] = None
+_job_manager: Optional[JobManager] = None
+_batch_max_urls = 100
+_batch_concurrency = 2
+# Latest pipeline stage per in-flight listing, fanned out to every waiting job.
+_listing_stages: dict[str, JobStage] = {}
+_stage_listeners: dict[str, set[ProgressCallback]] = {}
 _llm_settings: Optional[LLMSettings] = None
 _llm_client: Optional[AsyncClient] = None
 _overview_settings: Optional[LLMSettings] = None
 _overview_client: Optional[AsyncClient] = None
+_concurrent_overview = True
 _database: Optional[Database] = None
 _magic_links: Optional[MagicLinkService] = None
 _session_manager: Optional[SessionManager] = None
@@ -111,6 +139,37 @@ _post_login_redirect: str = ""
 _default_checkout_cancel: str = ""
 
 
+@dataclass
+class ListingAnalysis:
+    """Report-independent assessment of a listing shared across requests."""
+
+    content: ListingContent
+    assessment: AssessmentResponse
+    context: dict[str, object]
+    # Heuristic-only result produced before the embedding model was ready; never cached.
+    provisional: bool = False
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "content": self.content.to_dict(),
+                "assessment": self.assessment.model_dump(mode="json", by_alias=True),
+                "context": self.context,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ListingAnalysis":
+        data = json.loads(raw)
+        return cls(
+            content=ListingContent.from_dict(data["content"]),
+            assessment=AssessmentResponse.model_validate(data["assessment"]),
+            context=data.get("context") or {},
+        )
+
+
 def compose_bonus_summary(assessment: AssessmentResponse) -> str:
     """Derive a lightweight "bonus" summary for paid reports."""
 
@@ -156,7 +215,14 @@ async def require_user(user: Optional[User] = Depends(current_user)) -> User:
 
 
 def _ensure_ready() -> None:
-    if not _is_ready or _browser_manager is None or _response_cache is None:
+    if (
+        not _is_ready
+        or _browser_manager is None
+        or _analysis_executor is None
+        or _job_manager is None
+        or _response_cache is None
+        or _listing_cache is None
+    ):
         raise HTTPException(status_code=503, detail="Service initializing, try again.")
 
 
@@ -164,8 +230,10 @@ def _ensure_ready() -> None:
 async def on_startup() -> None:
     """Initialize global resources (Playwright, cache, persistence)."""
 
-    global _is_ready, _browser_manager, _response_cache, _llm_settings, _llm_client
-    global _overview_settings, _overview_client
+    global _is_ready, _browser_manager, _response_cache, _listing_cache, _llm_cache, _analysis_executor, _job_manager
+    global _batch_max_urls, _batch_concurrency
+    global _llm_settings, _llm_client
+    global _overview_settings, _overview_client, _concurrent_overview
     global _database, _magic_links, _session_manager, _email_sender, _polar_service
     global _auth_base_url, _post_login_redirect, _default_checkout_cancel
 
@@ -176,18 +244,58 @@ async def on_startup() -> None:
         max_concurrency = int(os.getenv("MAX_CONCURRENCY", "4"))
         ttl_seconds = int(os.getenv("CACHE_TTL_SECONDS", "900"))
         cache_maxsize = int(os.getenv("CACHE_MAXSIZE", "128"))
+        listing_ttl_seconds = int(os.getenv("LISTING_CACHE_TTL_SECONDS", str(ttl_seconds)))
+        listing_cache_maxsize = int(os.getenv("LISTING_CACHE_MAXSIZE", str(cache_maxsize)))
         headless = os.getenv("PLAYWRIGHT_HEADLESS", "true").lower() != "false"
         disable_sandbox = os.getenv("PLAYWRIGHT_DISABLE_SANDBOX", "true").lower() != "false"
+        max_page_uses = int(os.getenv("PLAYWRIGHT_PAGE_MAX_USES", "25"))
+        prewarm_pages = int(os.getenv("PLAYWRIGHT_PREWARM_PAGES", "0"))
+        upstream_override = os.getenv("PLAYWRIGHT_UPSTREAM_OVERRIDE") or None
+        if upstream_override:
+            logger.warning("Routing all browser traffic to %s (load-test mode).", upstream_override)
+        block_profile = None
+        if os.getenv("PLAYWRIGHT_BLOCK_RESOURCES", "true").lower() != "false":
+            blocked_types = os.getenv("PLAYWRIGHT_BLOCKED_RESOURCE_TYPES", "media,font")
+            extra_patterns = os.getenv("PLAYWRIGHT_BLOCKED_URL_PATTERNS", "")
+            max_image_width = int(os.getenv("PLAYWRIGHT_MAX_IMAGE_WIDTH", "720"))
+            block_profile = ResourceBlockProfile(
+                blocked_resource_types=frozenset(
+                    kind.strip() for kind in blocked_types.split(",") if kind.strip()
+                ),
+                blocked_url_patterns=DEFAULT_BLOCKED_URL_PATTERNS
+                + tuple(pattern.strip().lower() for pattern in extra_patterns.split(",") if pattern.strip()),
+                max_image_width=max_image_width if max_image_width > 0 else None,
+            )
 
         _browser_manager = BrowserManager(
             headless=headless,
             max_concurrency=max_concurrency,
             disable_sandbox=disable_sandbox,
+            max_page_uses=max_page_uses,
+            block_profile=block_profile,
+            upstream_override=upstream_override,
         )
-        _response_cache = AssessmentCache[str, AssessmentResponse](
-            maxsize=cache_maxsize,
-            ttl_seconds=ttl_seconds,
+        if prewarm_pages > 0:
+            _background_tasks.add(asyncio.create_task(_browser_manager.warm(prewarm_pages)))
+        extraction_workers = int(os.getenv("EXTRACTION_WORKERS", "0"))
+        warm_embeddings = os.getenv("AMENITY_EMBED_WARMUP", "true").lower() != "false"
+        if warm_embeddings and extraction_workers <= 0:
+            # Heuristics run in this process, so load the model here off the event loop.
+            start_model_warmup()
+        _analysis_executor = AnalysisExecutor(
+            max_workers=extraction_workers,
+            warm_embeddings=warm_embeddings,
+        )
+        if extraction_workers > 0:
+            _background_tasks.add(asyncio.create_task(_analysis_executor.warm()))
+        _job_manager = JobManager(
+            workers=int(os.getenv("ASSESS_JOB_WORKERS", str(max_concurrency))),
+            max_pending=int(os.getenv("ASSESS_JOB_MAX_PENDING", "100")),
+            ttl_seconds=int(os.getenv("ASSESS_JOB_TTL_SECONDS", "3600")),
         )
+        _job_manager.start()
+        _batch_max_urls = int(os.getenv("ASSESS_BATCH_MAX_URLS", "100"))
+        _batch_concurrency = max(1, int(os.getenv("ASSESS_BATCH_CONCURRENCY", "2")))
 
         db_path = os.getenv("HOSTSCORE_DATABASE_PATH")
         if db_path:
@@ -200,6 +308,44 @@ async def on_startup() -> None:
         _database = Database(db_path)
         await _database.connect()
 
+        persist_cache = os.getenv("CACHE_PERSIST", "false").lower() == "true"
+        persist_max_entries = int(os.getenv("CACHE_PERSIST_MAX_ENTRIES", "1000"))
+        cache_store = _database if persist_cache else None
+        _response_cache = TieredCache[AssessmentResponse](
+            AssessmentCache(maxsize=cache_maxsize, ttl_seconds=ttl_seconds),
+            namespace="report",
+            serialize=lambda value: value.model_dump_json(by_alias=True),
+            deserialize=AssessmentResponse.model_validate_json,
+            store=cache_store,
+            ttl_seconds=ttl_seconds,
+            max_entries=persist_max_entries,
+        )
+        _listing_cache = TieredCache[ListingAnalysis](
+            AssessmentCache(maxsize=listing_cache_maxsize, ttl_seconds=listing_ttl_seconds),
+            namespace="listing",
+            serialize=ListingAnalysis.to_json,
+            deserialize=ListingAnalysis.from_json,
+            store=cache_store,
+            ttl_seconds=listing_ttl_seconds,
+            max_entries=persist_max_entries,
+        )
+        if persist_cache:
+            logger.info("Persistent assessment cache enabled (%s entries per tier).", persist_max_entries)
+
+        if os.getenv("LLM_CACHE", "true").lower() != "false":
+            llm_cache_ttl = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+            _llm_cache = TieredCache[str](
+                AssessmentCache(maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "256")), ttl_seconds=llm_cache_ttl),
+                namespace="llm",
+                serialize=str,
+                deserialize=str,
+                store=_database,
+                ttl_seconds=llm_cache_ttl,
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+            )
+        else:
+            _llm_cache = None
+
         session_secret = (
             os.getenv("SESSION_SECRET")
             or os.getenv("MAGIC_LINK_SECRET")
@@ -327,6 +473,7 @@ async def on_startup() -> None:
             _overview_settings = None
             _overview_client = None
             logger.info("Sonnet overview disabled (missing credentials).")
+        _concurrent_overview = os.getenv("LLM_CONCURRENT_OVERVIEW", "true").lower() != "false"
 
         _is_ready = True
         logger.info("Backend startup complete.")
@@ -336,15 +483,30 @@ async def on_startup() -> None:
 async def on_shutdown() -> None:
     """Dispose of global resources."""
 
-    global _is_ready, _browser_manager, _llm_client, _overview_client, _database, _magic_links
-    global _session_manager, _email_sender, _polar_service
+    global _is_ready, _browser_manager, _analysis_executor, _job_manager, _llm_client, _overview_client
+    global _database, _magic_links, _session_manager, _email_sender, _polar_service
 
     _is_ready = False
 
+    for task in list(_background_tasks):
+        task.cancel()
+    _background_tasks.clear()
+
+    if _job_manager:
+        await _job_manager.close()
+        _job_manager = None
+
     if _browser_manager:
         await _browser_manager.close()
         _browser_manager = None
 
+    if _analysis_executor:
+        if not _analysis_executor.max_workers:
+            # Heuristics ran in this process; worker processes save their own cache on exit.
+            await asyncio.to_thread(save_sentence_cache)
+        _analysis_executor.shutdown()
+        _analysis_executor = None
+
     if _llm_client:
         await _llm_client.aclose()
         _llm_client = None
@@ -374,12 +536,186 @@ async def on_shutdown() -> None:
 def healthcheck() -> dict[str, str]:
     """Simple readiness probe for deployment targets."""
 
-    return {"status": "ok" if _is_ready else "initializing"}
+    if _analysis_executor is not None:
+        # Worker processes load their own model; the executor reports what they reached.
+        workers = _analysis_executor.status()
+    else:
+        workers = {"workers": "inline", "embeddings": model_status()}
+    return {"status": "ok" if _is_ready else "initializing", **workers}
+
+
+@app.get("/metrics")
+def metrics() -> dict[str, object]:
+    """Expose internal counters used to tune browser and cache settings."""
+
+    return {
+        "browser": _browser_manager.stats() if _browser_manager else None,
+        "jobs": _job_manager.stats() if _job_manager else None,
+        "caches": {
+            name: cache.stats()
+            for name, cache in (("report", _response_cache), ("listing", _listing_cache), ("llm", _llm_cache))
+            if cache is not None
+        },
+        "stages": stage_histograms(),
+    }
 
 
-@app.post("/assess", response_model=ReportEnvelope)
-async def assess_listing(payload: AssessmentRequest, request: Request) -> ReportEnvelope:
-    """Assess an Airbnb listing and return structured feedback."""
+async def _analyze_listing(
+    normalized_url: str,
+    *,
+    force: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    on_preliminary: Optional[Callable[[ListingAnalysis], None]] = None,
+) -> ListingAnalysis:
+    """Return the shared analysis for a listing, joining any in-flight run.
+
+    Results are cached in the listing tier, keyed only on the normalized URL,
+    so free, paid, and logged-in reports for the same listing reuse one
+    render. Render, heuristics, and LLM refinement run as one single-flighted
+    pipeline per listing, so a request arriving while refinement is still
+    running joins it instead of rendering again. The heuristic result is
+    published to every caller through ``on_preliminary`` as soon as it
+    exists. ``progress`` receives the shared pipeline's stages.
+    """
+
+    listing_key = build_listing_cache_key(normalized_url)
+    if not force and _listing_cache is not None:
+        cached = await _listing_cache.get(listing_key)
+        if cached is not None:
+            return cached
+
+    if _analysis_flights.in_flight(listing_key):
+        logger.info("Joining in-flight assessment for %s", normalized_url)
+    if progress is not None:
+        _stage_listeners.setdefault(listing_key, set()).add(progress)
+        if listing_key in _listing_stages:
+            progress(_listing_stages[listing_key])
+    # Whoever leads the flight resolves this future; joiners share the same one.
+    preliminary_ready = _preliminary_results.get(listing_key)
+    if preliminary_ready is None:
+        preliminary_ready = asyncio.get_running_loop().create_future()
+        _preliminary_results[listing_key] = preliminary_ready
+    flight = asyncio.ensure_future(
+        _analysis_flights.run(
+            listing_key,
+            lambda: _run_analysis_pipeline(normalized_url, listing_key, preliminary_ready),
+        )
+    )
+    try:
+        await asyncio.wait({preliminary_ready, flight}, return_when=asyncio.FIRST_COMPLETED)
+        if on_preliminary is not None and preliminary_ready.done() and not preliminary_ready.cancelled():
+            on_preliminary(preliminary_ready.result())
+        return await flight
+    finally:
+        # The pipeline itself is shielded; this only drops this caller's wait.
+        if not flight.done():
+            flight.cancel()
+        elif not preliminary_ready.done():
+            # Joined a pipeline in its last moments, after it had dropped its
+            # own future; don't leave this unused one behind for the next run.
+            if _preliminary_results.get(listing_key) is preliminary_ready:
+                del _preliminary_results[listing_key]
+            preliminary_ready.cancel()
+        if progress is not None:
+            listeners = _stage_listeners.get(listing_key)
+            if listeners is not None:
+                listeners.discard(progress)
+                if not listeners:
+                    del _stage_listeners[listing_key]
+
+
+async def _run_analysis_pipeline(
+    normalized_url: str,
+    listing_key: str,
+    preliminary_ready: "asyncio.Future[ListingAnalysis]",
+) -> ListingAnalysis:
+    try:
+        preliminary = await _build_preliminary_analysis(normalized_url, listing_key)
+        if not preliminary_ready.done():
+            preliminary_ready.set_result(preliminary)
+        return await _build_refined_analysis(normalized_url, listing_key, preliminary)
+    finally:
+        if _preliminary_results.get(listing_key) is preliminary_ready:
+            del _preliminary_results[listing_key]
+        if not preliminary_ready.done():
+            preliminary_ready.cancel()
+
+
+def _report_stage(listing_key: str, stage: JobStage) -> None:
+    _listing_stages[listing_key] = stage
+    for listener in list(_stage_listeners.get(listing_key, ())):
+        listener(stage)
+
+
+async def _build_preliminary_analysis(normalized_url: str, listing_key: str) -> ListingAnalysis:
+    """Render the listing and score it with the deterministic heuristics."""
+
+    logger.info("Assessing listing %s", normalized_url)
+    try:
+        _report_stage(listing_key, JobStage.rendering)
+        capture = await capture_listing(normalized_url, _browser_manager)  # type: ignore[arg-type]
+        _report_stage(listing_key, JobStage.extracting)
+        content, heuristics = await _analysis_executor.analyze(capture)  # type: ignore[union-attr]
+        _report_stage(listing_key, JobStage.scoring)
+    except BaseException:
+        _listing_stages.pop(listing_key, None)
+        raise
+    preliminary = build_response(heuristics)
+
+    context_payload: dict[str, object] = {
+        "summary": content.summary,
+        "description": content.description,
+        "house_rules": content.house_rules,
+        "reviews": content.reviews,
+        "amenities_listed": content.amenities_listed,
+    }
+    return ListingAnalysis(
+        content=content,
+        assessment=preliminary,
+        context=context_payload,
+        provisional=heuristics.provisional,
+    )
+
+
+async def _build_refined_analysis(
+    normalized_url: str,
+    listing_key: str,
+    preliminary: ListingAnalysis,
+) -> ListingAnalysis:
+    """Refine the heuristic result with the LLM and cache the shared analysis."""
+
+    try:
+        _report_stage(listing_key, JobStage.refining)
+        with span("refine"):
+            refined = await refine_assessment(
+                preliminary.assessment,
+                _llm_settings,
+                _llm_client,
+                context=preliminary.context,
+                cache=_llm_cache,
+            )
+    finally:
+        _listing_stages.pop(listing_key, None)
+    analysis = replace(preliminary, assessment=refined)
+    if analysis.provisional:
+        logger.info("Embedding model still loading; not caching heuristic-only result for %s", normalized_url)
+    elif _listing_cache is not None:
+        await _listing_cache.set(listing_key, analysis)
+    return analysis
+
+
+@dataclass
+class _AssessmentPlan:
+    """A validated assessment request with its user and reserved credit."""
+
+    payload: AssessmentRequest
+    normalized_url: str
+    user: Optional[User]
+    credit: Optional[Credit]
+
+
+async def _plan_assessment(payload: AssessmentRequest, request: Request) -> _AssessmentPlan:
+    """Validate the request and reserve a credit for paid reports."""
 
     _ensure_ready()
 
@@ -405,117 +741,193 @@ async def assess_listing(payload: AssessmentRequest, request: Request) -> Report
                 headers={"Location": "/not-enough-credits"},
             )
 
-    cache_key = build_cache_key(
-        normalized_url,
-        report_type=payload.report_type.value,
-        user_id=user.id if user else None,
-        credit_id=credit.id if credit else None,
-    )
+    return _AssessmentPlan(payload=payload, normalized_url=normalized_url, user=user, credit=credit)
 
-    cache_miss = False
-    full_response = None
-    if not payload.force:
-        full_response = _response_cache.get(cache_key)
 
-    if full_response is None:
-        logger.info("Assessing listing %s", normalized_url)
-        try:
-            content = await render_listing(normalized_url, _browser_manager)  # type: ignore[arg-type]
-        except PlaywrightError as exc:
-            if credit:
-                await _database.release_credit(credit.id)
-            logger.exception("Playwright failed to render %s", normalized_url)
-            raise HTTPException(status_code=502, detail="Failed to render Airbnb listing.") from exc
-        except Exception as exc:  # pragma: no cover - catch-all for resiliency
-            if credit:
-                await _database.release_credit(credit.id)
-            logger.exception("Unexpected error rendering %s", normalized_url)
-            raise HTTPException(status_code=500, detail="Unexpected error rendering listing.") from exc
-
-        heuristics = run_heuristics(content)
-        preliminary = AssessmentResponse(
-            overall=heuristics.overall,
-            section_scores=heuristics.section_scores,
-            photo_stats=heuristics.photo_stats,
-            copy_stats=heuristics.copy_stats,
-            amenities=heuristics.amenities,
-            trust_signals=heuristics.trust_stats,
-            top_fixes=heuristics.recommendations,
-        )
+ReportUpdateCallback = Callable[[str, dict], None]
 
-        context_payload = {
-            "summary": content.summary,
-            "description": content.description,
-            "house_rules": content.house_rules,
-            "reviews": content.reviews,
-            "amenities_listed": content.amenities_listed,
-        }
 
-        refined = await refine_assessment(
-            preliminary,
-            _llm_settings,
-            _llm_client,
-            context=context_payload,
+async def _generate_overview(analysis: ListingAnalysis) -> Optional[str]:
+    with span("overview"):
+        return await generate_listing_overview(
+            analysis.assessment,
+            _overview_settings,
+            _overview_client,
+            context=analysis.context,
+            cache=_llm_cache,
         )
 
-        overview_text = None
-        if payload.report_type is ReportType.paid:
-            overview_text = await generate_listing_overview(
-                refined,
-                _overview_settings,
-                _overview_client,
-                context=context_payload,
-            )
 
-        summary = compose_bonus_summary(refined)
-        full_response = refined.model_copy(update={"bonus_summary": summary, "owner_overview": overview_text})
-        cache_miss = True
-    else:
-        cache_miss = False
+class _ClientDisconnected(Exception):
+    pass
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    # The body has already been read, so the next ASGI message is the disconnect.
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
 
-    top_fixes = list(full_response.top_fixes)
-    top_fixes_limited = top_fixes[:5]
-    full_response = full_response.model_copy(update={"top_fixes": top_fixes_limited})
-    if payload.report_type is ReportType.paid:
-        public_response = full_response
-    else:
-        hidden_limit = min(3, len(top_fixes_limited))
-        public_response = full_response.model_copy(
-            update={
-                "top_fixes": top_fixes_limited[hidden_limit:],
-                "bonus_summary": None,
-                "owner_overview": None,
-            }
-        )
 
-    hidden_count = max(0, len(top_fixes_limited) - len(public_response.top_fixes))
+async def _cancel_on_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable``, cancelling it if the client goes away first.
 
-    if cache_miss:
-        _response_cache.set(cache_key, full_response)
+    Shared single-flight work is shielded and keeps running for other
+    waiters; only this request's own work (such as its overview call) stops.
+    """
 
-    payload_json = json.dumps(
-        full_response.model_dump(mode="json"),
-        ensure_ascii=False,
-        separators=(",", ":"),
+    work = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not work.done():
+            work.cancel()
+            with suppress(asyncio.CancelledError):
+                await work
+    if work.cancelled():
+        raise _ClientDisconnected()
+    return work.result()
+
+
+def _public_report(full_response: AssessmentResponse, report_type: ReportType) -> tuple[AssessmentResponse, int]:
+    """Trim a full report to what ``report_type`` may see; return it with the hidden fix count."""
+
+    top_fixes_limited = list(full_response.top_fixes)[:5]
+    full_response = full_response.model_copy(update={"top_fixes": top_fixes_limited})
+    if report_type is ReportType.paid:
+        return full_response, 0
+    hidden_limit = min(3, len(top_fixes_limited))
+    public_response = full_response.model_copy(
+        update={
+            "top_fixes": top_fixes_limited[hidden_limit:],
+            "bonus_summary": None,
+            "owner_overview": None,
+        }
     )
-    payload_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+    return public_response, hidden_limit
+
+
+async def _execute_assessment(
+    plan: _AssessmentPlan,
+    progress: Optional[ProgressCallback] = None,
+    on_update: Optional[ReportUpdateCallback] = None,
+) -> ReportEnvelope:
+    """Run the pipeline for a planned assessment, record it, and build the envelope.
+
+    ``on_update`` receives partial reports as they become available: the
+    heuristic report, the LLM-refined report, and (paid) the owner overview.
+    The reserved credit is released if the pipeline or persistence fails,
+    or if the request is cancelled before the credit is redeemed.
+    """
+
+    payload, normalized_url, user, credit = plan.payload, plan.normalized_url, plan.user, plan.credit
+
+    def publish(event: str, report: AssessmentResponse) -> None:
+        if on_update is not None:
+            summary = compose_bonus_summary(report)
+            public, _ = _public_report(report.model_copy(update={"bonus_summary": summary}), payload.report_type)
+            on_update(event, {"report": public.model_dump(mode="json")})
 
+    redeemed = False
+    # Everything up to redemption runs under one handler, so a failure or a
+    # cancellation at any await (the L2 cache read included) frees the credit.
     try:
-        await _database.log_report(
-            user_id=user.id if user else None,
-            listing_url=normalized_url,
+        cache_key = build_cache_key(
+            normalized_url,
             report_type=payload.report_type.value,
+            user_id=user.id if user else None,
             credit_id=credit.id if credit else None,
-            payload_hash=payload_hash,
-            payload=payload_json,
         )
-        if credit:
-            await _database.redeem_credit(credit.id)
-    except Exception as exc:  # pragma: no cover - persistence failure
-        if credit:
-            await _database.release_credit(credit.id)
-        logger.exception("Failed to persist report for %s", normalized_url)
-        raise HTTPException(status_code=500, detail="Failed to record report.") from exc
+        cache_miss = False
+        full_response = None
+        if not payload.force:
+            full_response = await _response_cache.get(cache_key)
+
+        if full_response is None:
+            wants_overview = payload.report_type is ReportType.paid
+            overview_task: Optional[asyncio.Task] = None
+
+            def on_preliminary(preliminary: ListingAnalysis) -> None:
+                nonlocal overview_task
+                publish("heuristics", preliminary.assessment)
+                if wants_overview and _concurrent_overview:
+                    # The overview only needs the heuristic snapshot, so start it alongside refinement.
+                    overview_task = asyncio.create_task(_generate_overview(preliminary))
+
+            try:
+                try:
+                    analysis = await _analyze_listing(
+                        normalized_url,
+                        force=payload.force,
+                        progress=progress,
+                        on_preliminary=on_preliminary,
+                    )
+                except PlaywrightError as exc:
+                    logger.exception("Playwright failed to render %s", normalized_url)
+                    raise HTTPException(status_code=502, detail="Failed to render Airbnb listing.") from exc
+                except Exception as exc:  # pragma: no cover - catch-all for resiliency
+                    logger.exception("Unexpected error rendering %s", normalized_url)
+                    raise HTTPException(status_code=500, detail="Unexpected error rendering listing.") from exc
+
+                refined = analysis.assessment
+                publish("refinement", refined)
+                overview_text = None
+                if wants_overview:
+                    if progress is not None:
+                        progress(JobStage.refining)
+                    if overview_task is None:
+                        overview_task = asyncio.create_task(_generate_overview(analysis))
+                    overview_text = await overview_task
+                    if on_update is not None:
+                        on_update("overview", {"owner_overview": overview_text})
+            finally:
+                if overview_task is not None and not overview_task.done():
+                    overview_task.cancel()
+
+            summary = compose_bonus_summary(refined)
+            full_response = refined.model_copy(update={"bonus_summary": summary, "owner_overview": overview_text})
+            cache_miss = not analysis.provisional
+        else:
+            cache_miss = False
+
+        full_response = full_response.model_copy(update={"top_fixes": list(full_response.top_fixes)[:5]})
+        public_response, hidden_count = _public_report(full_response, payload.report_type)
+
+        if cache_miss:
+            await _response_cache.set(cache_key, full_response)
+
+        payload_json = json.dumps(
+            full_response.model_dump(mode="json"),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        payload_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+
+        try:
+            if credit:
+                credit = await _redeem_credit(user, credit)  # type: ignore[arg-type]
+                redeemed = True
+            with span("log_report"):
+                await _database.log_report(
+                    user_id=user.id if user else None,
+                    listing_url=normalized_url,
+                    report_type=payload.report_type.value,
+                    credit_id=credit.id if credit else None,
+                    payload_hash=payload_hash,
+                    payload=payload_json,
+                )
+        except HTTPException:
+            raise
+        except Exception as exc:  # pragma: no cover - persistence failure
+            if redeemed:
+                await _database.refund_credit(credit.id)  # type: ignore[union-attr]
+            logger.exception("Failed to persist report for %s", normalized_url)
+            raise HTTPException(status_code=500, detail="Failed to record report.") from exc
+    except (Exception, asyncio.CancelledError):
+        if credit and not redeemed:
+            await _database.release_credit(credit.id)  # type: ignore[union-attr]
+        raise
 
     credit_summary: Optional[UserCreditSummary] = None
     if user:
@@ -533,6 +945,291 @@ async def assess_listing(payload: AssessmentRequest, request: Request) -> Report
     return ReportEnvelope(report=public_response, meta=meta)
 
 
+async def _redeem_credit(user: User, credit: Credit) -> Credit:
+    """Redeem the reserved credit, falling back to a fresh one if it was already spent.
+
+    A reservation lapses after the database's reservation TTL, so a slow
+    render can find its credit taken and redeemed by another request.
+    """
+
+    if await _database.redeem_credit(credit.id):  # type: ignore[union-attr]
+        return credit
+    logger.warning("Reserved credit %s was redeemed elsewhere; reserving another", credit.id)
+    replacement = await _database.reserve_credit(user.id)  # type: ignore[union-attr]
+    if replacement is None or not await _database.redeem_credit(replacement.id):  # type: ignore[union-attr]
+        if replacement is not None:
+            await _database.release_credit(replacement.id)  # type: ignore[union-attr]
+        raise HTTPException(
+            status_code=status.HTTP_302_FOUND,
+            detail="Not enough credits.",
+            headers={"Location": "/not-enough-credits"},
+        )
+    return replacement
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@app.post("/assess", response_model=ReportEnvelope)
+async def assess_listing(payload: AssessmentRequest, request: Request) -> ReportEnvelope | StreamingResponse:
+    """Assess an Airbnb listing and return structured feedback.
+
+    With ``Accept: application/x-ndjson`` the response streams one JSON
+    object per line: ``heuristics`` as soon as scoring finishes, then
+    ``refinement`` and (paid) ``overview`` as the LLM calls complete, and
+    finally ``complete`` with the same envelope the plain endpoint returns,
+    or ``error``.
+    """
+
+    plan = await _plan_assessment(payload, request)
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_assessment(plan),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    try:
+        return await _cancel_on_disconnect(request, _execute_assessment(plan))
+    except _ClientDisconnected:
+        logger.info("Client disconnected; cancelled assessment of %s", plan.normalized_url)
+        return Response(status_code=499)
+
+
+async def _stream_assessment(plan: _AssessmentPlan) -> AsyncIterator[str]:
+    updates: asyncio.Queue[Optional[dict]] = asyncio.Queue()
+
+    def on_update(event: str, data: dict) -> None:
+        updates.put_nowait({"event": event, **data})
+
+    task = asyncio.create_task(_execute_assessment(plan, on_update=on_update))
+    task.add_done_callback(lambda _: updates.put_nowait(None))
+    try:
+        while (update := await updates.get()) is not None:
+            yield json.dumps(update, ensure_ascii=False, separators=(",", ":")) + "\n"
+        try:
+            envelope = task.result()
+        except HTTPException as exc:
+            final = {"event": "error", "status_code": exc.status_code, "detail": exc.detail}
+        except Exception:  # pragma: no cover - _execute_assessment maps known failures
+            logger.exception("Streaming assessment failed for %s", plan.normalized_url)
+            final = {"event": "error", "status_code": 500, "detail": "Unexpected error."}
+        else:
+            final = {"event": "complete", **envelope.model_dump(mode="json")}
+        yield json.dumps(final, ensure_ascii=False, separators=(",", ":")) + "\n"
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+@app.post("/assess/batch")
+async def assess_batch(payload: BatchAssessmentRequest, request: Request) -> StreamingResponse:
+    """Assess several listings and stream one NDJSON line per listing as it completes.
+
+    URLs are normalized and de-duplicated first; a URL that fails to
+    normalize gets an ``error`` line instead of failing the batch. Paid
+    batches are refused up front when the user holds fewer credits than
+    unique listings; each listing then reserves its credit when it starts,
+    so reservations never sit idle while earlier listings render.
+    Each line is a ``result`` (the usual envelope plus ``url``) or an
+    ``error``, and the stream ends with a ``complete`` summary.
+    """
+
+    _ensure_ready()
+
+    if _database is None:
+        raise HTTPException(status_code=503, detail="Database unavailable.")
+    if len(payload.urls) > _batch_max_urls:
+        raise HTTPException(status_code=422, detail=f"A batch accepts at most {_batch_max_urls} URLs.")
+
+    unique_urls: dict[str, None] = {}
+    invalid: list[dict] = []
+    for url in payload.urls:
+        try:
+            unique_urls.setdefault(normalize_listing_url(str(url)))
+        except ValueError as exc:
+            invalid.append({"event": "error", "url": str(url), "status_code": 422, "detail": str(exc)})
+
+    user = await current_user(request)
+    if payload.report_type is ReportType.paid and unique_urls:
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Login required for paid reports.")
+        credit_summary = await _database.get_credit_summary(user.id)
+        if credit_summary.available < len(unique_urls):
+            raise HTTPException(
+                status_code=status.HTTP_302_FOUND,
+                detail="Not enough credits.",
+                headers={"Location": "/not-enough-credits"},
+            )
+
+    plans = [
+        _AssessmentPlan(
+            payload=AssessmentRequest(url=url, report_type=payload.report_type, force=payload.force),
+            normalized_url=url,
+            user=user,
+            credit=None,
+        )
+        for url in unique_urls
+    ]
+    return StreamingResponse(
+        _stream_batch(plans, invalid),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_batch(plans: list[_AssessmentPlan], invalid: list[dict]) -> AsyncIterator[str]:
+    # A per-batch cap keeps one large portfolio from filling every browser
+    # slot; single requests and other batches queue on the pool alongside it.
+    slots = asyncio.Semaphore(_batch_concurrency)
+
+    async def run_one(plan: _AssessmentPlan) -> dict:
+        try:
+            async with slots:
+                if plan.payload.report_type is ReportType.paid:
+                    # Reserved only now, so the reservation cannot lapse while
+                    # the listing waits behind the rest of the batch.
+                    credit = await _database.reserve_credit(plan.user.id)  # type: ignore[union-attr]
+                    if credit is None:
+                        raise HTTPException(status_code=status.HTTP_302_FOUND, detail="Not enough credits.")
+                    plan = replace(plan, credit=credit)
+                # From here on _execute_assessment releases the credit on failure.
+                envelope = await _execute_assessment(plan)
+        except HTTPException as exc:
+            return {"event": "error", "url": plan.normalized_url, "status_code": exc.status_code, "detail": exc.detail}
+        except Exception:  # pragma: no cover - _execute_assessment maps known failures
+            logger.exception("Batch assessment failed for %s", plan.normalized_url)
+            return {"event": "error", "url": plan.normalized_url, "status_code": 500, "detail": "Unexpected error."}
+        return {"event": "result", "url": plan.normalized_url, **envelope.model_dump(mode="json")}
+
+    tasks = [asyncio.create_task(run_one(plan)) for plan in plans]
+    succeeded = 0
+    try:
+        for line in invalid:
+            yield json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for next_done in asyncio.as_completed(tasks):
+            line = await next_done
+            succeeded += line["event"] == "result"
+            yield json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n"
+        total = len(plans) + len(invalid)
+        summary = {"event": "complete", "total": total, "succeeded": succeeded, "failed": total - succeeded}
+        yield json.dumps(summary, separators=(",", ":")) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _renew_credit(plan: _AssessmentPlan) -> _AssessmentPlan:
+    """Refresh a queued job's reservation as it starts, or reserve a new credit if it lapsed."""
+
+    if plan.credit is None:
+        return plan
+    credit = await _database.refresh_reservation(plan.credit)  # type: ignore[union-attr]
+    if credit is None:
+        logger.info("Reservation for credit %s lapsed while queued; reserving another", plan.credit.id)
+        credit = await _database.reserve_credit(plan.user.id)  # type: ignore[union-attr]
+        if credit is None:
+            raise HTTPException(status_code=status.HTTP_302_FOUND, detail="Not enough credits.")
+    return replace(plan, credit=credit)
+
+
+@app.post(
+    "/assess/jobs",
+    response_model=AssessmentJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_assessment_job(
+    payload: AssessmentRequest,
+    request: Request,
+    response: Response,
+) -> AssessmentJobResponse:
+    """Queue an assessment and return its job id without waiting for the pipeline."""
+
+    plan = await _plan_assessment(payload, request)
+
+    async def release_credit() -> None:
+        if plan.credit:
+            await _database.release_credit(plan.credit.id)  # type: ignore[union-attr]
+
+    async def run_job(progress: ProgressCallback) -> ReportEnvelope:
+        # The reservation may have lapsed while the job sat in the queue.
+        try:
+            job_plan = await _renew_credit(plan)
+        except asyncio.CancelledError:
+            await release_credit()
+            raise
+        return await _execute_assessment(job_plan, progress)
+
+    try:
+        job = _job_manager.submit(  # type: ignore[union-attr]
+            run_job,
+            owner_id=plan.user.id if plan.user else None,
+            on_cancel=release_credit,
+        )
+    except JobQueueFull as exc:
+        await release_credit()
+        raise HTTPException(
+            status_code=503,
+            detail="Too many assessments queued, try again shortly.",
+            headers={"Retry-After": "5"},
+        ) from exc
+    response.headers["Location"] = f"/assess/jobs/{job.id}"
+    return job.to_response()
+
+
+async def _get_job(job_id: str, request: Request) -> Job:
+    """Return a job visible to the caller; jobs owned by a user are private to them."""
+
+    job = _job_manager.get(job_id) if _job_manager else None
+    if job is not None and job.owner_id is not None:
+        user = await current_user(request)
+        if user is None or user.id != job.owner_id:
+            job = None
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@app.get("/assess/jobs/{job_id}", response_model=AssessmentJobResponse)
+async def get_assessment_job(job_id: str, request: Request) -> AssessmentJobResponse:
+    """Poll a job's state, stage, and (once finished) result or error."""
+
+    job = await _get_job(job_id, request)
+    return job.to_response()
+
+
+@app.get("/assess/jobs/{job_id}/events")
+async def stream_assessment_job(job_id: str, request: Request) -> StreamingResponse:
+    """Stream job updates as Server-Sent Events.
+
+    ``stage`` events carry the job snapshot as it moves through rendering,
+    extracting, scoring, and refining; the stream ends with a ``result`` or
+    ``error`` event. Comment lines are sent as keep-alives.
+    """
+
+    job = await _get_job(job_id, request)
+
+    async def events() -> AsyncIterator[str]:
+        async for snapshot in _job_manager.watch(job):  # type: ignore[union-attr]
+            if await request.is_disconnected():
+                return
+            if snapshot is None:
+                yield ": keep-alive\n\n"
+                continue
+            if snapshot.state is JobState.succeeded:
+                event = "result"
+            elif snapshot.state is JobState.failed:
+                event = "error"
+            else:
+                event = "stage"
+            yield f"event: {event}\ndata: {snapshot.to_response().model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/auth/magic-link", status_code=status.HTTP_204_NO_CONTENT)
 async def request_magic_link(payload: MagicLinkRequest) -> Response:
     if _magic_links is None or _email_sender is None:
@@ -50,6 +50,17 @@ class AssessmentRequest(BaseModel):
     )
 
 
+class BatchAssessmentRequest(BaseModel):
+    """Incoming payload for assessing several listings in one call."""
+
+    urls: List[AnyHttpUrl] = Field(..., min_length=1, description="Public Airbnb listing URLs.")
+    report_type: ReportType = Field(
+        default=ReportType.free,
+        description="Report type applied to every listing; paid batches reserve one credit per unique listing.",
+    )
+    force: bool = Field(default=False, description="Skip cache when true.")
+
+
 class SectionScores(BaseModel):
     """Individual section scores."""
 
@@ -221,6 +232,45 @@ class ReportEnvelope(BaseModel):
     meta: ReportMeta
 
 
+class JobState(str, Enum):
+    """Lifecycle of a background assessment job."""
+
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class JobStage(str, Enum):
+    """Pipeline stage reported while an assessment job runs."""
+
+    queued = "queued"
+    rendering = "rendering"
+    extracting = "extracting"
+    scoring = "scoring"
+    refining = "refining"
+    done = "done"
+
+
+class JobError(BaseModel):
+    """Failure recorded for a job, mirroring the HTTP error ``/assess`` would return."""
+
+    status_code: int
+    detail: str
+
+
+class AssessmentJobResponse(BaseModel):
+    """Snapshot of a background assessment job."""
+
+    job_id: str
+    state: JobState
+    stage: JobStage
+    created_at: datetime
+    updated_at: datetime
+    result: Optional[ReportEnvelope] = None
+    error: Optional[JobError] = None
+
+
 class MagicLinkRequest(BaseModel):
     """User request to receive a magic link email."""
 
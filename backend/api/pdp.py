@@ -0,0 +1,220 @@
+"""Structured extraction from Airbnb's PdpSections payload.
+
+``StaysPdpSections`` (and the ``__PRELOADED_STATE__`` fallback) carry most of
+what the DOM scrapers look for as plain JSON. Reading it directly lets
+``capture_listing`` skip the photo and amenities modals when the payload is
+complete, and lets ``extract_listing`` avoid DOM work for those fields.
+"""
+
+from __future__ import annotations
+
+import html as html_lib
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from .utils import extract_im_width
+
+_GENERIC_LABEL = re.compile(
+    r"\b(?:(?:listing\s+)?image|photo)\s*\d+(?:\s+of\s+\d+)?$", re.I
+)
+_BREAK_PATTERN = re.compile(r"<br\s*/?>", re.I)
+_BLOCK_END_PATTERN = re.compile(r"</(?:p|div|li|h\d)>", re.I)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Only the photo tour lists every photo; HERO_DEFAULT previews are a handful
+# of them and would hide the modal and DOM gallery.
+_PHOTO_SECTION_TYPES = ("PHOTO_TOUR_SCROLLABLE_MODAL", "PHOTO_TOUR_SCROLLABLE")
+_SUMMARY_SECTION_TYPES = ("OVERVIEW_DEFAULT", "OVERVIEW_DEFAULT_V2", "LOCATION_DEFAULT")
+_MAX_DEPTH = 12
+
+
+@dataclass
+class PayloadPhoto:
+    url: str
+    width: Optional[int]
+    alt: str
+
+
+@dataclass
+class PayloadExtraction:
+    """Listing fields recovered from the payload; empty values mean "not found".
+
+    ``photos`` and ``amenities`` are only filled from the complete lists, so an
+    empty value sends callers to the modals and DOM scrapers.
+    """
+
+    title: str = ""
+    summary: str = ""
+    description: str = ""
+    amenities: List[str] = field(default_factory=list)
+    photos: List[PayloadPhoto] = field(default_factory=list)
+    house_rules: List[str] = field(default_factory=list)
+    reviews: List[str] = field(default_factory=list)
+
+    def found_fields(self) -> List[str]:
+        return [name for name, value in self.__dict__.items() if value]
+
+
+def extract_from_payload(payload: Optional[dict]) -> PayloadExtraction:
+    """Build a :class:`PayloadExtraction` from a PdpSections-style payload."""
+
+    result = PayloadExtraction()
+    if not isinstance(payload, dict):
+        return result
+
+    sections: Dict[str, List[dict]] = {}
+    for entry in _iter_sections(payload):
+        kind = str(entry.get("sectionComponentType") or entry.get("sectionId") or "")
+        section = entry.get("section")
+        if kind and isinstance(section, dict):
+            sections.setdefault(kind, []).append(section)
+
+    for section in sections.get("TITLE_DEFAULT", []):
+        if title := _text(section.get("title")):
+            result.title = title
+            break
+
+    for kind in _SUMMARY_SECTION_TYPES:
+        for section in sections.get(kind, []):
+            if summary := _text(section.get("title")) or _text(section.get("subtitle")):
+                result.summary = summary
+                break
+        if result.summary:
+            break
+
+    for section in sections.get("DESCRIPTION_DEFAULT", []):
+        description = _html_to_text(_dig(section, "htmlDescription", "htmlText"))
+        if description:
+            result.description = description
+            break
+
+    for section in sections.get("AMENITIES_DEFAULT", []):
+        # previewAmenitiesGroups is the short list shown on the page, not the full set.
+        groups = section.get("seeAllAmenitiesGroups") or []
+        result.amenities = _amenities_from_groups(groups)
+        if result.amenities:
+            break
+
+    for kind in _PHOTO_SECTION_TYPES:
+        for section in sections.get(kind, []):
+            items = section.get("mediaItems") or []
+            result.photos = _photos_from_media(items)
+            if result.photos:
+                break
+        if result.photos:
+            break
+
+    for section in sections.get("POLICIES_DEFAULT", []):
+        result.house_rules = _house_rules(section)
+        if result.house_rules:
+            break
+
+    for section in sections.get("REVIEWS_DEFAULT", []):
+        reviews = []
+        for review in section.get("reviews") or []:
+            if isinstance(review, dict) and (comment := _html_to_text(review.get("comments"))):
+                reviews.append(comment)
+        if reviews:
+            result.reviews = reviews
+            break
+
+    return result
+
+
+def _iter_sections(node: Any, depth: int = 0) -> Iterator[dict]:
+    if depth > _MAX_DEPTH:
+        return
+    if isinstance(node, dict):
+        if "section" in node and ("sectionComponentType" in node or "sectionId" in node):
+            yield node
+            return
+        for value in node.values():
+            yield from _iter_sections(value, depth + 1)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_sections(value, depth + 1)
+
+
+def _dig(node: Any, *keys: str) -> Any:
+    for key in keys:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        return ""
+    return " ".join(value.split())
+
+
+def _html_to_text(value: Any) -> str:
+    if not isinstance(value, str) or not value.strip():
+        return ""
+    text = _BREAK_PATTERN.sub("\n", value)
+    text = _BLOCK_END_PATTERN.sub("\n", text)
+    text = html_lib.unescape(_TAG_PATTERN.sub("", text))
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    collapsed = "\n".join(lines).strip()
+    return re.sub(r"\n{3,}", "\n\n", collapsed)
+
+
+def _amenities_from_groups(groups: Any) -> List[str]:
+    items: List[str] = []
+    if not isinstance(groups, list):
+        return items
+    for group in groups:
+        if not isinstance(group, dict):
+            continue
+        for amenity in group.get("amenities") or []:
+            if not isinstance(amenity, dict) or amenity.get("available") is False:
+                continue
+            title = _text(amenity.get("title"))
+            if title and not title.lower().startswith("unavailable:"):
+                items.append(title)
+    return list(dict.fromkeys(items))
+
+
+def _is_generic_label(label: str) -> bool:
+    return not label or bool(_GENERIC_LABEL.search(label))
+
+
+def _photos_from_media(items: Any) -> List[PayloadPhoto]:
+    photos: List[PayloadPhoto] = []
+    seen = set()
+    if not isinstance(items, list):
+        return photos
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        url = item.get("baseUrl") or item.get("url")
+        if not isinstance(url, str) or not url or url in seen:
+            continue
+        seen.add(url)
+        alt = ""
+        for candidate in (
+            _text(_dig(item, "imageMetadata", "caption")),
+            _text(item.get("caption")),
+            _text(item.get("accessibilityLabel")),
+        ):
+            if not _is_generic_label(candidate):
+                alt = candidate
+                break
+        photos.append(PayloadPhoto(url=url, width=extract_im_width(url) or None, alt=alt))
+    return photos
+
+
+def _house_rules(section: dict) -> List[str]:
+    rules: List[str] = []
+    for rule in section.get("houseRules") or []:
+        if isinstance(rule, dict) and (title := _text(rule.get("title"))):
+            rules.append(title)
+    for group in section.get("houseRulesSections") or []:
+        if not isinstance(group, dict):
+            continue
+        for rule in group.get("items") or []:
+            if isinstance(rule, dict) and (title := _text(rule.get("title"))):
+                rules.append(title)
+    return list(dict.fromkeys(rules))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import json
 import textwrap
@@ -11,6 +12,7 @@ from httpx import AsyncClient, HTTPStatusError
 from pydantic import BaseModel, ConfigDict
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_fixed
 
+from .cache import TieredCache
 from .heuristics import sort_top_fixes
 from .models import AssessmentResponse, TopFix
 
@@ -137,13 +139,32 @@ class LLMSettings(BaseModel):
 logger = logging.getLogger(__name__)
 
 
+def llm_cache_key(payload: dict[str, object]) -> str:
+    """Content address of an LLM request: model, prompts, temperature, and token cap."""
+
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _response_text(data: object) -> Optional[str]:
+    try:
+        return data["content"][0]["text"]  # type: ignore[index]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
 async def refine_assessment(
     heuristics: AssessmentResponse,
     settings: Optional[LLMSettings],
     client: Optional[AsyncClient] = None,
     context: Optional[dict[str, object]] = None,
+    cache: Optional[TieredCache[str]] = None,
 ) -> AssessmentResponse:
-    """Call the LLM to refine heuristics and produce final response."""
+    """Call the LLM to refine heuristics and produce final response.
+
+    With ``cache``, an identical request (same model, prompts, temperature,
+    and token cap) reuses the earlier response text instead of calling the API.
+    """
     if settings is None or not settings.api_key:
         return heuristics
 
@@ -169,53 +190,58 @@ async def refine_assessment(
         ],
     }
 
-    headers = {
-        "x-api-key": settings.api_key,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json",
-    }
-
-    http_client = client or AsyncClient(timeout=settings.timeout_seconds)
-    data = None
-    try:
-        async for attempt in AsyncRetrying(
-            reraise=True,
-            stop=stop_after_attempt(3),
-            wait=wait_fixed(0.8),
-            retry=retry_if_exception_type(HTTPStatusError),
-        ):
-            with attempt:
-                response = await http_client.post(
-                    settings.endpoint,
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
-    except HTTPStatusError as exc:
-        logger.warning(
-            "LLM refinement failed with status %s; returning heuristic output.",
-            exc.response.status_code if exc.response else "unknown",
-        )
-        return heuristics
-    except Exception as exc:
-        logger.exception("LLM refinement error; returning heuristic output.")
-        return heuristics
-    finally:
-        if client is None:
-            await http_client.aclose()
-
-    if not data:
-        return heuristics
+    cache_key = llm_cache_key(payload)
+    cached = await cache.get(cache_key) if cache is not None else None
+    content = cached
+    if cached is None:
+        headers = {
+            "x-api-key": settings.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        }
+
+        http_client = client or AsyncClient(timeout=settings.timeout_seconds)
+        data = None
+        try:
+            async for attempt in AsyncRetrying(
+                reraise=True,
+                stop=stop_after_attempt(3),
+                wait=wait_fixed(0.8),
+                retry=retry_if_exception_type(HTTPStatusError),
+            ):
+                with attempt:
+                    response = await http_client.post(
+                        settings.endpoint,
+                        headers=headers,
+                        json=payload,
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+        except HTTPStatusError as exc:
+            logger.warning(
+                "LLM refinement failed with status %s; returning heuristic output.",
+                exc.response.status_code if exc.response else "unknown",
+            )
+            return heuristics
+        except Exception as exc:
+            logger.exception("LLM refinement error; returning heuristic output.")
+            return heuristics
+        finally:
+            if client is None:
+                await http_client.aclose()
+
+        if not data:
+            return heuristics
+        content = _response_text(data)
 
     top_fixes: list[TopFix] = sort_top_fixes(heuristics.top_fixes.copy())
     overall = heuristics.overall
 
     amenities = heuristics.amenities.model_copy()
 
+    parsed = False
     try:
-        content = data["content"][0]["text"]
-        llm_payload = json.loads(content)
+        llm_payload = json.loads(content)  # type: ignore[arg-type]
         adjustment = int(llm_payload.get("overall_adjustment", 0))
         adjustment = max(-5, min(5, adjustment))
         overall = max(0, min(100, overall + adjustment))
@@ -260,10 +286,14 @@ async def refine_assessment(
                         ]
                     }
                 )
+        parsed = True
     except Exception:
         # Fall back to heuristic-only output on parse errors.
         pass
 
+    if parsed and cached is None and cache is not None:
+        await cache.set(cache_key, content)  # type: ignore[arg-type]
+
     enriched = heuristics.model_copy(
         update={"overall": overall, "top_fixes": top_fixes, "amenities": amenities}
     )
@@ -275,8 +305,9 @@ async def generate_listing_overview(
     settings: Optional[LLMSettings],
     client: Optional[AsyncClient] = None,
     context: Optional[dict[str, object]] = None,
+    cache: Optional[TieredCache[str]] = None,
 ) -> Optional[str]:
-    """Produce a high-level paid-report overview via Sonnet 4.5."""
+    """Produce a high-level paid-report overview via Sonnet 4.5, reusing cached text for identical prompts."""
 
     if settings is None or not settings.api_key:
         return None
@@ -307,6 +338,12 @@ async def generate_listing_overview(
         ],
     }
 
+    cache_key = llm_cache_key(payload)
+    if cache is not None:
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     headers = {
         "x-api-key": settings.api_key,
         "anthropic-version": "2023-06-01",
@@ -346,10 +383,14 @@ async def generate_listing_overview(
     if not data:
         return None
 
-    try:
-        overview_text = data["content"][0]["text"].strip()
-    except (KeyError, IndexError, TypeError):
+    overview_text = _response_text(data)
+    if not isinstance(overview_text, str):
         logger.warning("LLM overview response missing text content.")
         return None
+    overview_text = overview_text.strip()
+    if not overview_text:
+        return None
 
-    return overview_text if overview_text else None
+    if cache is not None:
+        await cache.set(cache_key, overview_text)
+    return overview_text
@@ -0,0 +1,163 @@
+"""Signal-based settle detection for Playwright renders.
+
+Each helper waits on a concrete page signal (selector present, network quiet,
+DOM mutations quiet) and treats its timeout purely as an upper bound, so a
+fast page is never held back by a fixed sleep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, Sequence
+
+from playwright.async_api import ElementHandle, Page, Request
+
+_DOM_QUIET_SCRIPT = """({root, quietMs, timeoutMs}) => new Promise((resolve) => {
+    const target = root || document.body || document.documentElement;
+    if (!target) {
+        resolve(false);
+        return;
+    }
+    let quietTimer = null;
+    let deadline = null;
+    let observer = null;
+    const finish = (quiet) => {
+        if (observer) observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(quiet);
+    };
+    observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(target, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['src', 'srcset', 'style', 'aria-hidden'],
+    });
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    deadline = setTimeout(() => finish(false), timeoutMs);
+})"""
+
+
+class NetworkMonitor:
+    """Track in-flight requests on a page so callers can await a quiet network."""
+
+    def __init__(self, page: Page) -> None:
+        self._page = page
+        self._inflight: set[Request] = set()
+        self._loop = asyncio.get_running_loop()
+        self._last_activity = self._loop.time()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _on_request(self, request: Request) -> None:
+        self._inflight.add(request)
+        self._last_activity = self._loop.time()
+
+    def _on_done(self, request: Request) -> None:
+        self._inflight.discard(request)
+        self._last_activity = self._loop.time()
+
+    async def wait_for_idle(self, idle_ms: int = 400, timeout_ms: int = 3000) -> bool:
+        """Return ``True`` once no request has been in flight for ``idle_ms``."""
+        idle_s = idle_ms / 1000
+        deadline = self._loop.time() + timeout_ms / 1000
+        while True:
+            now = self._loop.time()
+            if not self._inflight and now - self._last_activity >= idle_s:
+                return True
+            if now >= deadline:
+                return False
+            await asyncio.sleep(min(0.05, max(0.0, deadline - now)))
+
+    def detach(self) -> None:
+        self._page.remove_listener("request", self._on_request)
+        self._page.remove_listener("requestfinished", self._on_done)
+        self._page.remove_listener("requestfailed", self._on_done)
+        self._inflight.clear()
+
+
+async def wait_for_any_selector(
+    page: Page,
+    selectors: Sequence[str],
+    timeout_ms: int = 5000,
+    state: str = "attached",
+) -> Optional[str]:
+    """Return the first selector that reaches ``state``, or ``None`` on timeout."""
+    if not selectors:
+        return None
+    combined = ", ".join(selectors)
+    try:
+        await page.wait_for_selector(combined, state=state, timeout=timeout_ms)
+    except Exception:
+        return None
+    for selector in selectors:
+        try:
+            if await page.query_selector(selector):
+                return selector
+        except Exception:
+            continue
+    return combined
+
+
+async def wait_for_dom_quiet(
+    page: Page,
+    quiet_ms: int = 300,
+    timeout_ms: int = 3000,
+    root: Optional[ElementHandle] = None,
+) -> bool:
+    """Wait until ``root`` (default ``document.body``) stops mutating for ``quiet_ms``."""
+    try:
+        return bool(
+            await page.evaluate(
+                _DOM_QUIET_SCRIPT,
+                {"root": root, "quietMs": quiet_ms, "timeoutMs": timeout_ms},
+            )
+        )
+    except Exception:
+        return False
+
+
+async def wait_for_dialog(page: Page, timeout_ms: int = 2500) -> Optional[ElementHandle]:
+    """Wait for a visible dialog and for its contents to stop rendering."""
+    try:
+        dialog = await page.wait_for_selector('div[role="dialog"]', state="visible", timeout=timeout_ms)
+    except Exception:
+        return None
+    if dialog:
+        await wait_for_dom_quiet(page, quiet_ms=200, timeout_ms=timeout_ms, root=dialog)
+    return dialog
+
+
+async def wait_for_dialog_closed(page: Page, timeout_ms: int = 1500) -> bool:
+    try:
+        await page.wait_for_selector('div[role="dialog"]', state="hidden", timeout=timeout_ms)
+    except Exception:
+        return False
+    return True
+
+
+async def settle(
+    page: Page,
+    monitor: Optional[NetworkMonitor] = None,
+    payload_task: Optional[asyncio.Task] = None,
+    *,
+    idle_ms: int = 400,
+    quiet_ms: int = 300,
+    timeout_ms: int = 3000,
+) -> None:
+    """Wait for network idle, a DOM quiet window, and the listing payload.
+
+    All three signals are awaited concurrently and each is capped at
+    ``timeout_ms``, so the total settle time never exceeds that bound.
+    """
+    waiters = [wait_for_dom_quiet(page, quiet_ms=quiet_ms, timeout_ms=timeout_ms)]
+    if monitor is not None:
+        waiters.append(monitor.wait_for_idle(idle_ms=idle_ms, timeout_ms=timeout_ms))
+    if payload_task is not None and not payload_task.done():
+        waiters.append(asyncio.wait({payload_task}, timeout=timeout_ms / 1000))
+    await asyncio.gather(*waiters, return_exceptions=True)
@@ -0,0 +1,161 @@
+"""Per-stage timing for the assessment pipeline.
+
+:func:`span` times a stage three ways:
+
+- it records the duration in a process-wide histogram, served from ``/metrics``;
+- it appends the duration to the current request's timings, which
+  :class:`ServerTimingMiddleware` sends back as a ``Server-Timing`` header;
+- it opens an OpenTelemetry span when ``opentelemetry-api`` is installed.
+  Without an SDK configured, those spans are no-ops.
+
+Timings follow ``contextvars``. Work started from a request is attributed to
+it, including single-flight tasks and ``asyncio.to_thread`` calls.
+Requests that join work already in flight see no stage timings.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:  # optional dependency
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - depends on runtime env
+    trace = None  # type: ignore[assignment]
+
+_tracer = trace.get_tracer("hostscore.assessor") if trace is not None else None
+
+# Upper bounds in milliseconds, from a fast parse to a slow render.
+BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+Timings = List[Tuple[str, float]]
+
+_request_timings: ContextVar[Optional[Timings]] = ContextVar("request_timings", default=None)
+
+
+class StageHistogram:
+    """Fixed-bucket latency histogram; safe to update from worker threads."""
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS_MS) -> None:
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float) -> None:
+        index = bisect.bisect_left(self._buckets, duration_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += duration_ms
+            self._max = max(self._max, duration_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts, count, total, largest = list(self._counts), self._count, self._sum, self._max
+        cumulative, running = {}, 0
+        for bound, bucket in zip((*self._buckets, math.inf), counts):
+            running += bucket
+            cumulative["+Inf" if bound == math.inf else f"{bound:g}"] = running
+        return {
+            "count": count,
+            "sum_ms": round(total, 1),
+            "mean_ms": round(total / count, 1) if count else None,
+            "max_ms": round(largest, 1),
+            "le_ms": cumulative,
+        }
+
+
+_histograms: Dict[str, StageHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def record(stage: str, duration_ms: float) -> None:
+    """Add a measured duration to the stage histogram and the current request."""
+
+    histogram = _histograms.get(stage)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(stage, StageHistogram())
+    histogram.observe(duration_ms)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.append((stage, duration_ms))
+
+
+@contextmanager
+def span(stage: str, **attributes: object) -> Iterator[None]:
+    """Time the enclosed block as ``stage``; usable from sync and async code."""
+
+    started = time.perf_counter()
+    try:
+        if _tracer is None:
+            yield
+        else:
+            with _tracer.start_as_current_span(stage, attributes=attributes or None):
+                yield
+    finally:
+        record(stage, (time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Timings]:
+    """Collect the timings recorded inside the block (e.g. in a worker process)."""
+
+    timings: Timings = []
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def stage_histograms() -> Dict[str, dict]:
+    with _histograms_lock:
+        items = sorted(_histograms.items())
+    return {stage: histogram.snapshot() for stage, histogram in items}
+
+
+def server_timing_header(timings: Timings, total_ms: Optional[float] = None) -> str:
+    """Format timings as a ``Server-Timing`` value, summing repeated stages."""
+
+    totals: Dict[str, float] = {}
+    for stage, duration_ms in timings:
+        totals[stage] = totals.get(stage, 0.0) + duration_ms
+    entries = [f"{stage};dur={duration:.1f}" for stage, duration in totals.items()]
+    if total_ms is not None:
+        entries.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware that adds a ``Server-Timing`` header to HTTP responses.
+
+    The header is written when the response starts, so streamed responses
+    only report the stages that finished before their first byte.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                header = server_timing_header(timings, (time.perf_counter() - started) * 1000)
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]}
+            await send(message)
+
+        with collect_timings() as timings:
+            await self.app(scope, receive, send_with_timing)
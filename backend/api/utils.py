@@ -35,6 +35,12 @@ def normalize_listing_url(raw_url: str) -> str:
     return normalized
 
 
+def build_listing_cache_key(url: str) -> str:
+    """Return a cache key for report-independent listing content."""
+
+    return normalize_listing_url(url).lower()
+
+
 def build_cache_key(
     url: str,
     *,
@@ -44,8 +50,7 @@ def build_cache_key(
 ) -> str:
     """Return a deterministic cache key scoped to user/report context."""
 
-    normalized = normalize_listing_url(url)
-    parts = [normalized.lower(), report_type.lower()]
+    parts = [build_listing_cache_key(url), report_type.lower()]
     if user_id:
         parts.append(user_id.lower())
     if credit_id:
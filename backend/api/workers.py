@@ -0,0 +1,151 @@
+"""Off-loop execution stage for CPU-bound extraction and scoring."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional, Tuple
+
+from .amenity_matcher import load_model, model_status, save_sentence_cache, start_model_warmup
+from .extract import ListingCapture, ListingContent
+from .heuristics import HeuristicResult, run_heuristics
+from .telemetry import collect_timings, record, span
+
+logger = logging.getLogger(__name__)
+
+
+_warm_barrier = None
+
+
+def _init_worker(warm_embeddings: bool, warm_barrier=None) -> None:
+    global _warm_barrier
+    _warm_barrier = warm_barrier
+    if warm_embeddings:
+        start_model_warmup()
+    # atexit does not run in pool children; Finalize hooks do.
+    Finalize(None, save_sentence_cache, exitpriority=10)
+
+
+def _warm_worker(load_embeddings: bool, timeout: float) -> Tuple[int, str]:
+    # Every warm-up task waits at the barrier until all workers hold one, so
+    # no worker can take two of them and leave another process cold.
+    if _warm_barrier is not None:
+        try:
+            _warm_barrier.wait(timeout)
+        except threading.BrokenBarrierError:
+            pass
+    if load_embeddings:
+        load_model()
+    return os.getpid(), model_status()
+
+
+def analyze_capture(capture: ListingCapture) -> Tuple[ListingContent, HeuristicResult]:
+    """Parse a capture and score it. Module-level so worker processes can import it."""
+
+    with span("extract"):
+        content = capture.extract()
+    with span("heuristics"):
+        heuristics = run_heuristics(content)
+    return content, heuristics
+
+
+def _analyze_capture_timed(capture: ListingCapture) -> Tuple[ListingContent, HeuristicResult, List[Tuple[str, float]]]:
+    # Stage timings recorded in a worker process are shipped back with the result.
+    with collect_timings() as timings:
+        content, heuristics = analyze_capture(capture)
+    return content, heuristics, timings
+
+
+class AnalysisExecutor:
+    """Run :func:`analyze_capture` without blocking the event loop.
+
+    With ``max_workers > 0`` the work is sent to a process pool so lxml parsing,
+    trafilatura, textstat and rapidfuzz run in parallel with other requests.
+    With ``max_workers == 0`` it falls back to a worker thread, which keeps the
+    loop responsive but still shares the GIL. ``warm_embeddings`` starts the
+    embedding model load in each worker process as it is spawned.
+
+    The pool spawns workers lazily, so :meth:`warm` runs a warm-up task on
+    each of them at startup; :meth:`status` reports how far that has got.
+    """
+
+    def __init__(self, max_workers: int = 0, *, warm_embeddings: bool = False) -> None:
+        self._max_workers = max(0, max_workers)
+        self._warm_embeddings = warm_embeddings
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._worker_states: Dict[int, str] = {}
+        self._warm_failed = False
+        if self._max_workers:
+            # Spawn rather than fork: the parent runs an event loop and
+            # Playwright's driver threads, which are unsafe to fork.
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(warm_embeddings, context.Barrier(self._max_workers)),
+            )
+            logger.info("Extraction process pool enabled (%s workers).", self._max_workers)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def warm(self, timeout: float = 60.0) -> None:
+        """Spawn every worker and wait for each to import the pipeline (and load the model)."""
+
+        if self._pool is None:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._pool, _warm_worker, self._warm_embeddings, timeout)
+                    for _ in range(self._max_workers)
+                )
+            )
+        except Exception:
+            self._warm_failed = True
+            logger.warning("Extraction worker warm-up failed.", exc_info=True)
+            return
+        self._worker_states.update(results)
+        logger.info("Extraction workers warmed: %s of %s.", len(self._worker_states), self._max_workers)
+
+    def status(self) -> Dict[str, str]:
+        """Worker readiness and the embedding model state the workers reported."""
+
+        if self._pool is None:
+            return {"workers": "inline", "embeddings": model_status()}
+        warmed = len(self._worker_states)
+        if self._warm_failed:
+            workers = "failed"
+        else:
+            workers = "ready" if warmed >= self._max_workers else f"warming ({warmed}/{self._max_workers})"
+        states = set(self._worker_states.values())
+        if not states:
+            embeddings = "loading" if self._warm_embeddings else "idle"
+        elif len(states) == 1:
+            embeddings = states.pop()
+        else:
+            # Mixed states: report the least ready one.
+            embeddings = next(state for state in ("unavailable", "loading", "idle", "ready") if state in states)
+        return {"workers": workers, "embeddings": embeddings}
+
+    async def analyze(self, capture: ListingCapture) -> Tuple[ListingContent, HeuristicResult]:
+        if self._pool is None:
+            return await asyncio.to_thread(analyze_capture, capture)
+        loop = asyncio.get_running_loop()
+        content, heuristics, timings = await loop.run_in_executor(self._pool, _analyze_capture_timed, capture)
+        for stage, duration_ms in timings:
+            record(stage, duration_ms)
+        return content, heuristics
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,35 @@
+import pytest
+
+from backend.api.extract import _extract_photos, _parse_fragment, extract_listing
+from backend.benchmarks.corpus import synthetic_capture
+
+
+@pytest.mark.benchmark(group="extract_listing")
+def bench_extract_listing(benchmark, capture):
+    content = benchmark(capture.extract)
+
+    assert content.photos
+
+
+@pytest.mark.benchmark(group="extract_photos")
+def bench_extract_photos_from_modal(benchmark, size):
+    capture = synthetic_capture(*size, shape="dom")
+    page = _parse_fragment(capture.html)
+    overlay = _parse_fragment(capture.photo_modal_html)
+
+    photos = benchmark(_extract_photos, page, overlay)
+
+    assert len(photos) == size[0]
+
+
+@pytest.mark.benchmark(group="recorded")
+def bench_extract_recorded_listing(benchmark, recorded):
+    benchmark(
+        extract_listing,
+        recorded.html,
+        recorded.url,
+        photo_overlay_html=recorded.photo_modal_html,
+        amenities_html=recorded.amenities_modal_html,
+        amenities_items=recorded.amenities_items,
+        preloaded_state=recorded.preloaded_state,
+    )
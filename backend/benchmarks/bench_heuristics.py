@@ -0,0 +1,34 @@
+"""Scoring benchmarks.
+
+Amenity matching caches sentence embeddings, so after the first round these
+measure the steady state where a listing's sentences have been seen before.
+"""
+
+import pytest
+
+from backend.api.amenity_matcher import detect_amenity_mentions
+from backend.api.heuristics import _score_copy, run_heuristics
+
+
+@pytest.mark.benchmark(group="detect_amenity_mentions")
+def bench_detect_amenity_mentions(benchmark, content):
+    present, missing = benchmark(detect_amenity_mentions, content.amenities_listed, content.description)
+
+    assert len(present) + len(missing) == len(content.amenities_listed)
+
+
+@pytest.mark.benchmark(group="score_copy")
+def bench_score_copy(benchmark, content):
+    benchmark(_score_copy, content)
+
+
+@pytest.mark.benchmark(group="run_heuristics")
+def bench_run_heuristics(benchmark, content):
+    result = benchmark(run_heuristics, content)
+
+    assert result.section_scores
+
+
+@pytest.mark.benchmark(group="recorded")
+def bench_score_recorded_listing(benchmark, recorded):
+    benchmark(run_heuristics, recorded.extract())
@@ -0,0 +1,55 @@
+import pytest
+
+from backend.api import amenity_matcher
+from backend.benchmarks.corpus import SHAPES, SIZES, recorded_captures, synthetic_capture
+
+# A --benchmark-compare run fails when any median regresses by more than this.
+# pytest-benchmark rejects --benchmark-compare-fail without --benchmark-compare,
+# so it cannot live in pytest.ini's addopts; an explicit flag still wins.
+REGRESSION_THRESHOLD = "median:15%"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # A plain `python -m pytest` from the repo root loads this conftest too,
+    # where pytest-benchmark may not be installed; only import it when comparing.
+    if config.getoption("benchmark_compare", None) and not config.getoption("benchmark_compare_fail", None):
+        from pytest_benchmark.utils import parse_compare_fail
+
+        config.option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def embedding_model():
+    # Load (or rule out) the embedding model up front so no benchmark times it.
+    return amenity_matcher.load_model()
+
+
+@pytest.fixture(params=SIZES, ids=[f"{photos}p-{amenities}a" for photos, amenities in SIZES])
+def size(request):
+    return request.param
+
+
+@pytest.fixture(params=SHAPES)
+def shape(request):
+    return request.param
+
+
+@pytest.fixture
+def capture(size, shape):
+    photos, amenities = size
+    return synthetic_capture(photos, amenities, shape)
+
+
+@pytest.fixture
+def content(size):
+    photos, amenities = size
+    return synthetic_capture(photos, amenities, "payload").extract()
+
+
+_RECORDED = recorded_captures()
+
+
+@pytest.fixture(params=sorted(_RECORDED) or [pytest.param(None, marks=pytest.mark.skip(reason="no recorded bundles"))])
+def recorded(request):
+    return _RECORDED[request.param]
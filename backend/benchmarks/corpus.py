@@ -0,0 +1,181 @@
+"""Deterministic synthetic listings for the benchmark suite.
+
+Each listing comes in two shapes: ``dom``, where photos and amenities must be
+scraped from the page and modal markup (the slow path), and ``payload``,
+where the PdpSections payload carries them. Recorded captures saved with
+``scripts/assess.py --dump-bundle`` are picked up from ``BENCH_CORPUS_DIR``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from backend.api.bundle import find_bundles, read_bundle
+from backend.api.extract import ListingCapture
+
+# (photos, amenities): the span of real listings, from sparse to very rich.
+SIZES: List[Tuple[int, int]] = [(10, 5), (50, 40), (200, 150)]
+SHAPES = ("dom", "payload")
+
+CORPUS_DIR = Path(os.getenv("BENCH_CORPUS_DIR", Path(__file__).resolve().parent / "corpus"))
+
+_AMENITIES = [
+    "Wifi", "Kitchen", "Free parking on premises", "Hot tub", "Pool", "Washer", "Dryer",
+    "Air conditioning", "Heating", "Dedicated workspace", "TV", "Hair dryer", "Iron",
+    "Smoke alarm", "Carbon monoxide alarm", "Fire extinguisher", "First aid kit", "Crib",
+    "High chair", "Dishwasher", "Microwave", "Coffee maker", "Refrigerator", "Oven", "Stove",
+    "BBQ grill", "Patio or balcony", "Backyard", "Fire pit", "Indoor fireplace", "EV charger",
+    "Gym", "Sauna", "Self check-in", "Lockbox", "Pets allowed", "Long term stays allowed",
+    "Beach access", "Lake access", "Ski-in/Ski-out", "Bathtub", "Shampoo", "Hot water",
+    "Bed linens", "Extra pillows and blankets", "Room-darkening shades", "Ethernet connection",
+    "Game console", "Board games", "Books and reading material",
+]
+_ROOMS = ["living room", "primary bedroom", "guest bedroom", "kitchen", "bathroom", "terrace", "garden"]
+_FILLER = [
+    "The flat sits on a quiet street a short walk from cafes and the market.",
+    "Natural light fills the space through tall windows facing south.",
+    "Guests love the easy access to public transport and the old town.",
+    "We refreshed the interior last spring with new floors and furniture.",
+    "Check-in is flexible and we are always a message away.",
+]
+
+
+def amenity_names(count: int) -> List[str]:
+    names = list(_AMENITIES[:count])
+    index = 0
+    while len(names) < count:
+        names.append(f"{_AMENITIES[index % len(_AMENITIES)]} in the {_ROOMS[index % len(_ROOMS)]}")
+        index += 1
+    return names
+
+
+def _description(rng: random.Random, amenities: List[str]) -> str:
+    sentences = list(_FILLER)
+    mentioned = rng.sample(amenities, k=len(amenities) // 2)
+    for name in mentioned:
+        sentences.append(f"You will find {name.lower()} ready for your stay.")
+    sentences.append("There is no smoking anywhere on the property.")
+    rng.shuffle(sentences)
+    return " ".join(sentences)
+
+
+def _photo_url(index: int) -> str:
+    return f"https://a0.muscache.com/im/pictures/listing-{index}.jpg"
+
+
+def _photo_label(rng: random.Random, index: int) -> str:
+    # Mix descriptive captions with the generic labels the scraper must see past.
+    if rng.random() < 0.3:
+        return f"Listing image {index + 1}"
+    return f"{_ROOMS[index % len(_ROOMS)].capitalize()} view {index + 1}"
+
+
+def _photo_button(rng: random.Random, index: int) -> str:
+    return (
+        f'<button aria-label="{escape(_photo_label(rng, index))}"><picture>'
+        f'<source srcset="{_photo_url(index)}?im_w=720 1x, {_photo_url(index)}?im_w=1200 2x">'
+        f'<img alt="Listing image {index + 1}" src="{_photo_url(index)}?im_w=720"></picture></button>'
+    )
+
+
+def _page_html(title: str, description: str, photos: int, rng: random.Random) -> str:
+    # The page shows the first few photos; the modal repeats them with the rest.
+    gallery = "".join(_photo_button(rng, index) for index in range(min(photos, 5)))
+    return (
+        "<html><body><main>"
+        f'<h1 data-testid="title">{escape(title)}</h1>'
+        f'<div data-section-id="OVERVIEW_DEFAULT"><h2>Entire rental unit in Lisbon, Portugal</h2></div>'
+        f'<div data-section-id="DESCRIPTION_DEFAULT"><p>{escape(description)}</p></div>'
+        f"<div>{gallery}</div>"
+        '<div data-section-id="POLICIES_DEFAULT"><h2>House rules</h2>'
+        "<ul><li>Check-in after 3:00 PM</li><li>No parties or events</li><li>No smoking</li></ul></div>"
+        "</main></body></html>"
+    )
+
+
+def _photo_modal_html(photos: int, rng: random.Random) -> str:
+    items = "".join(f"<div>{_photo_button(rng, index)}</div>" for index in range(photos))
+    return f'<div role="dialog">{items}</div>'
+
+
+def _amenities_modal_html(amenities: List[str]) -> str:
+    groups = [amenities[start : start + 10] for start in range(0, len(amenities), 10)]
+    sections = "".join(
+        f"<section><h2>Group {number}</h2><ul role=\"list\">"
+        + "".join(f"<li><div><div>{escape(name)}</div></div></li>" for name in group)
+        + "</ul></section>"
+        for number, group in enumerate(groups, start=1)
+    )
+    return f'<div role="dialog"><section><h1>What this place offers</h1>{sections}</section></div>'
+
+
+def _payload(title: str, description: str, photos: int, amenities: List[str], rng: random.Random) -> dict:
+    sections = [
+        ("TITLE_DEFAULT", {"title": title}),
+        ("OVERVIEW_DEFAULT", {"title": "Entire rental unit in Lisbon, Portugal"}),
+        ("DESCRIPTION_DEFAULT", {"htmlDescription": {"htmlText": escape(description)}}),
+        (
+            "AMENITIES_DEFAULT",
+            {
+                "seeAllAmenitiesGroups": [
+                    {"title": "Amenities", "amenities": [{"title": name, "available": True} for name in amenities]}
+                ]
+            },
+        ),
+        (
+            "PHOTO_TOUR_SCROLLABLE_MODAL",
+            {
+                "mediaItems": [
+                    {
+                        "baseUrl": _photo_url(index),
+                        "accessibilityLabel": f"Listing image {index + 1}",
+                        "imageMetadata": {"caption": _photo_label(rng, index)},
+                    }
+                    for index in range(photos)
+                ]
+            },
+        ),
+        ("POLICIES_DEFAULT", {"houseRules": [{"title": "No parties or events"}, {"title": "No smoking"}]}),
+    ]
+    return {
+        "data": {
+            "presentation": {
+                "stayProductDetailPage": {
+                    "sections": {
+                        "sections": [{"sectionComponentType": kind, "section": body} for kind, body in sections]
+                    }
+                }
+            }
+        }
+    }
+
+
+def synthetic_capture(photos: int, amenities: int, shape: str = "dom", seed: int = 0) -> ListingCapture:
+    """Build a reproducible capture with ``photos`` photos and ``amenities`` amenities."""
+
+    rng = random.Random(f"{seed}-{photos}-{amenities}")
+    names = amenity_names(amenities)
+    title = f"Sunny loft with {photos} photos and {amenities} amenities"
+    description = _description(rng, names)
+    url = f"https://www.airbnb.com/rooms/{photos * 1000 + amenities}"
+    html = _page_html(title, description, photos, rng)
+    if shape == "payload":
+        return ListingCapture(url=url, html=html, preloaded_state=_payload(title, description, photos, names, rng))
+    return ListingCapture(
+        url=url,
+        html=html,
+        photo_modal_html=_photo_modal_html(photos, rng),
+        amenities_modal_html=_amenities_modal_html(names),
+    )
+
+
+def recorded_captures() -> Dict[str, ListingCapture]:
+    """Recorded bundles in ``CORPUS_DIR`` keyed by file name; empty when none are present."""
+
+    if not CORPUS_DIR.is_dir():
+        return {}
+    return {path.name: read_bundle(path) for path in find_bundles([CORPUS_DIR])}
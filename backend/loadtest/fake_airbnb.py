@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""Local stand-in for Airbnb listing pages, for load tests.
+
+Serves ``/rooms/{id}`` pages that behave like the real ones as far as
+``capture_listing`` is concerned: the page fetches a PdpSections XHR on load
+and has "Show all photos" / "Show all amenities" buttons that open dialogs.
+Listings come from capture bundles (``--bundles``) or the synthetic benchmark
+corpus. Point the backend at it with
+``PLAYWRIGHT_UPSTREAM_OVERRIDE=http://127.0.0.1:8900``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi import FastAPI, HTTPException, Response  # noqa: E402
+from fastapi.responses import HTMLResponse, JSONResponse  # noqa: E402
+
+from backend.api.bundle import find_bundles, read_bundle  # noqa: E402
+from backend.api.extract import ListingCapture  # noqa: E402
+from backend.benchmarks.corpus import SIZES, synthetic_capture  # noqa: E402
+
+# 1x1 transparent GIF served for every image so pages never reach the internet.
+_PIXEL = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+_PAGE_SCRIPT = """
+<script>
+(() => {
+  const listingId = %(listing_id)s;
+  fetch(`/api/v3/StaysPdpSections?id=${listingId}`).catch(() => {});
+  const openModal = async (kind) => {
+    const response = await fetch(`/__modal/${kind}/${listingId}`);
+    const holder = document.createElement("div");
+    holder.innerHTML = await response.text();
+    const dialog = holder.firstElementChild;
+    if (!dialog) return;
+    const close = document.createElement("button");
+    close.setAttribute("aria-label", "Close");
+    close.textContent = "Close";
+    close.addEventListener("click", () => dialog.remove());
+    dialog.prepend(close);
+    document.body.appendChild(dialog);
+  };
+  document.addEventListener("keydown", (event) => {
+    if (event.key === "Escape") document.querySelectorAll('div[role="dialog"]').forEach((node) => node.remove());
+  });
+  document.querySelector('[data-testid="photo-tour-button"]').addEventListener("click", () => openModal("photos"));
+  document.querySelector('[data-testid="pdp-show-all-amenities-button"]').addEventListener("click", () => openModal("amenities"));
+})();
+</script>
+"""
+
+_BUTTONS = (
+    '<button data-testid="photo-tour-button">Show all photos</button>'
+    '<button data-testid="pdp-show-all-amenities-button">Show all amenities</button>'
+)
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Server-side delays in milliseconds; each is stretched by up to ``jitter``."""
+
+    page_ms: int = 300
+    xhr_ms: int = 150
+    modal_ms: int = 100
+    jitter: float = 0.25
+
+    async def wait(self, base_ms: int) -> None:
+        if base_ms > 0:
+            await asyncio.sleep(base_ms * (1 + random.uniform(-self.jitter, self.jitter)) / 1000)
+
+
+class ListingSource:
+    """Maps listing ids to captures: recorded bundles first, then synthetic listings."""
+
+    def __init__(self, bundles: Optional[List[ListingCapture]] = None, payload_ratio: float = 0.5) -> None:
+        self._bundles = list(bundles or [])
+        self._payload_ratio = payload_ratio
+        self._synthetic: Dict[int, ListingCapture] = {}
+
+    @classmethod
+    def from_dir(cls, path: Path, payload_ratio: float = 0.5) -> "ListingSource":
+        return cls([read_bundle(bundle) for bundle in find_bundles([path])], payload_ratio)
+
+    def get(self, listing_id: int) -> ListingCapture:
+        if self._bundles:
+            return self._bundles[listing_id % len(self._bundles)]
+        if listing_id not in self._synthetic:
+            photos, amenities = SIZES[listing_id % len(SIZES)]
+            # Spread ids over both shapes so some renders need the modals.
+            shape = "payload" if (listing_id * 0.618) % 1 < self._payload_ratio else "dom"
+            self._synthetic[listing_id] = synthetic_capture(photos, amenities, shape, seed=listing_id)
+        return self._synthetic[listing_id]
+
+
+def _page_html(capture: ListingCapture, listing_id: int) -> str:
+    html = capture.html
+    extras = _BUTTONS + _PAGE_SCRIPT % {"listing_id": json.dumps(listing_id)}
+    if "</body>" in html:
+        return html.replace("</body>", f"{extras}</body>", 1)
+    return html + extras
+
+
+def create_app(source: ListingSource, latency: LatencyProfile = LatencyProfile()) -> FastAPI:
+    app = FastAPI(title="Fake Airbnb")
+
+    @app.get("/rooms/{listing_id}", response_class=HTMLResponse)
+    async def listing_page(listing_id: int) -> str:
+        await latency.wait(latency.page_ms)
+        return _page_html(source.get(listing_id), listing_id)
+
+    @app.get("/api/v3/StaysPdpSections")
+    async def pdp_sections(id: int) -> JSONResponse:  # noqa: A002 - mirrors Airbnb's query parameter
+        await latency.wait(latency.xhr_ms)
+        capture = source.get(id)
+        # Listings without a recorded payload still answer the XHR, like the real
+        # site does, just without the sections the modals provide.
+        return JSONResponse(capture.preloaded_state or {"data": {}})
+
+    @app.get("/__modal/{kind}/{listing_id}", response_class=HTMLResponse)
+    async def modal(kind: str, listing_id: int) -> str:
+        await latency.wait(latency.modal_ms)
+        capture = source.get(listing_id)
+        if kind == "photos":
+            markup = capture.photo_modal_html
+        elif kind == "amenities":
+            markup = capture.amenities_modal_html
+        else:
+            raise HTTPException(status_code=404)
+        return markup or '<div role="dialog"></div>'
+
+    @app.get("/{path:path}")
+    async def static_asset(path: str) -> Response:
+        if path.startswith("im/") or path.endswith((".jpg", ".jpeg", ".png", ".webp", ".gif")):
+            return Response(content=_PIXEL, media_type="image/gif")
+        return Response(status_code=204)
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve fake Airbnb listings for load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--bundles", type=Path, help="Directory of capture bundles to serve instead of synthetic listings.")
+    parser.add_argument(
+        "--payload-ratio",
+        type=float,
+        default=0.5,
+        help="Share of synthetic listings whose XHR carries photos and amenities (the rest need the modals).",
+    )
+    parser.add_argument("--page-latency-ms", type=int, default=300)
+    parser.add_argument("--xhr-latency-ms", type=int, default=150)
+    parser.add_argument("--modal-latency-ms", type=int, default=100)
+    parser.add_argument("--jitter", type=float, default=0.25, help="Relative latency jitter, 0 for fixed delays.")
+    args = parser.parse_args()
+
+    source = ListingSource.from_dir(args.bundles, args.payload_ratio) if args.bundles else ListingSource(
+        payload_ratio=args.payload_ratio
+    )
+    latency = LatencyProfile(args.page_latency_ms, args.xhr_latency_ms, args.modal_latency_ms, args.jitter)
+    uvicorn.run(create_app(source, latency), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
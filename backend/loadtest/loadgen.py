@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Drive ``POST /assess`` at a fixed concurrency and report latency and saturation.
+
+Run the backend with ``PLAYWRIGHT_UPSTREAM_OVERRIDE`` pointing at
+``fake_airbnb.py`` so renders never leave the machine. While requests run,
+``/metrics`` is sampled to show how busy the browser pool was: pages in use
+against ``MAX_CONCURRENCY`` and renders queued for a page.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; ``None`` for an empty sample."""
+
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadResult:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    pool_samples: List[dict] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    def summary(self) -> dict:
+        ok = self.statuses.get(200, 0)
+        pool: Dict[str, object] = {}
+        if self.pool_samples:
+            capacity = max(sample.get("max_concurrency") or 1 for sample in self.pool_samples)
+            in_use = [sample.get("pages_in_use", 0) for sample in self.pool_samples]
+            waiting = [sample.get("pages_waiting", 0) for sample in self.pool_samples]
+            pool = {
+                "max_concurrency": capacity,
+                "mean_utilization": round(sum(in_use) / len(in_use) / capacity, 3),
+                "saturated_fraction": round(sum(1 for value in in_use if value >= capacity) / len(in_use), 3),
+                "mean_waiting": round(sum(waiting) / len(waiting), 2),
+                "max_waiting": max(waiting),
+            }
+        return {
+            "requests": sum(self.statuses.values()),
+            "succeeded": ok,
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items(), key=lambda item: str(item[0]))},
+            "elapsed_s": round(self.elapsed_s, 2),
+            "throughput_rps": round(ok / self.elapsed_s, 3) if self.elapsed_s else None,
+            "latency_ms": {
+                name: round(value, 1) if value is not None else None
+                for name, value in (
+                    ("p50", percentile(self.latencies_ms, 50)),
+                    ("p95", percentile(self.latencies_ms, 95)),
+                    ("p99", percentile(self.latencies_ms, 99)),
+                    ("max", max(self.latencies_ms, default=None)),
+                )
+            },
+            "browser_pool": pool,
+        }
+
+
+async def _sample_metrics(client: httpx.AsyncClient, result: LoadResult, interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            response = await client.get("/metrics")
+            browser = response.json().get("browser")
+            if browser:
+                result.pool_samples.append(browser)
+        except (httpx.HTTPError, ValueError):
+            pass
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load(
+    target: str,
+    *,
+    requests: int,
+    concurrency: int,
+    listings: int,
+    force: bool,
+    timeout: float,
+    metrics_interval: float,
+) -> LoadResult:
+    result = LoadResult()
+    remaining = iter(range(requests))
+    stop = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=target, timeout=timeout) as client:
+
+        async def worker() -> None:
+            for index in remaining:
+                body = {"url": f"https://www.airbnb.com/rooms/{index % listings + 1}", "force": force}
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/assess", json=body)
+                    status = response.status_code
+                except httpx.HTTPError as exc:
+                    status = type(exc).__name__
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                result.statuses[status] += 1
+                if status == 200:
+                    result.latencies_ms.append(elapsed_ms)
+
+        sampler = asyncio.create_task(_sample_metrics(client, result, metrics_interval, stop))
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        finally:
+            result.elapsed_s = time.perf_counter() - started
+            stop.set()
+            await sampler
+    return result
+
+
+def _print_report(summary: dict) -> None:
+    latency = summary["latency_ms"]
+    print(f"requests   {summary['requests']} ({summary['succeeded']} ok) in {summary['elapsed_s']}s")
+    print(f"statuses   {summary['statuses']}")
+    print(f"throughput {summary['throughput_rps']} req/s")
+    print(f"latency    p50 {latency['p50']} ms  p95 {latency['p95']} ms  p99 {latency['p99']} ms  max {latency['max']} ms")
+    pool = summary["browser_pool"]
+    if pool:
+        print(
+            f"browser    {pool['mean_utilization']:.0%} of {pool['max_concurrency']} pages in use on average, "
+            f"saturated {pool['saturated_fraction']:.0%} of the time, "
+            f"{pool['mean_waiting']} renders waiting on average (max {pool['max_waiting']})"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the /assess endpoint.")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="Backend base URL.")
+    parser.add_argument("--requests", type=int, default=200, help="Total /assess calls.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once.")
+    parser.add_argument("--listings", type=int, default=50, help="Distinct listing ids to cycle through.")
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Let repeat listings hit the caches; by default every request forces a fresh render.",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--metrics-interval", type=float, default=0.5, help="Seconds between /metrics samples.")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run_load(
+            args.target,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            listings=max(1, args.listings),
+            force=not args.cached,
+            timeout=args.timeout,
+            metrics_interval=args.metrics_interval,
+        )
+    )
+    summary = result.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        _print_report(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
 #!/usr/bin/env python
-"""Manual assessment runner to aid interactive debugging."""
+"""Manual assessment runner to aid interactive debugging.
+
+With ``--batch`` it assesses every URL in a file (or stdin) over one shared
+browser and appends one NDJSON record per listing as it finishes, so large
+audits run without the web service. ``--resume`` skips listings that already
+have a successful record in the output file. ``--dump-bundle`` and
+``--bundle-dir`` save capture bundles for ``scripts/replay.py``.
+"""
 
 from __future__ import annotations
 
@@ -8,8 +15,9 @@ import asyncio
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterator, List, Optional, Set
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 API_DIR = PROJECT_ROOT / "api"
@@ -19,10 +27,11 @@ if str(API_DIR) not in sys.path:
     sys.path.insert(0, str(API_DIR))
 
 from api.browser import BrowserManager  # type: ignore  # noqa: E402
-from api.extract import render_listing  # type: ignore  # noqa: E402
-from api.heuristics import run_heuristics  # type: ignore  # noqa: E402
-from api.models import AssessmentResponse  # type: ignore  # noqa: E402
+from api.bundle import bundle_filename, write_bundle  # type: ignore  # noqa: E402
+from api.extract import capture_listing  # type: ignore  # noqa: E402
+from api.heuristics import build_response, run_heuristics  # type: ignore  # noqa: E402
 from api.utils import normalize_listing_url  # type: ignore  # noqa: E402
+from api.workers import AnalysisExecutor  # type: ignore  # noqa: E402
 
 
 async def assess(
@@ -34,25 +43,20 @@ async def assess(
     dump_html: Optional[Path],
     dump_photo_modal: Optional[Path],
     dump_amenities_modal: Optional[Path],
+    dump_bundle: Optional[Path] = None,
 ) -> None:
     manager = BrowserManager(headless=headless, max_concurrency=max_concurrency)
     try:
         normalized = normalize_listing_url(url)
-        content = await render_listing(
+        capture = await capture_listing(
             normalized,
             manager,
             capture_debug=debug,
         )
-        heuristics = run_heuristics(content)
-        response = AssessmentResponse(
-            overall=heuristics.overall,
-            section_scores=heuristics.section_scores,
-            photo_stats=heuristics.photo_stats,
-            copy_stats=heuristics.copy_stats,
-            trust_signals=heuristics.trust_stats,
-            amenities=heuristics.amenities,
-            top_fixes=heuristics.recommendations,
-        )
+        content = capture.extract()
+        if debug:
+            content.debug.update(capture.debug_info())
+        response = build_response(run_heuristics(content))
         print(json.dumps(response.model_dump(), indent=2))
         if debug:
             debug_info = {
@@ -92,13 +96,161 @@ async def assess(
             amenities_html = content.debug.get("amenities_modal_html", "")
             dump_amenities_modal.write_text(amenities_html or "", encoding="utf-8")
             print(f"Wrote amenities modal HTML to {dump_amenities_modal}")
+        if dump_bundle:
+            write_bundle(capture, dump_bundle)
+            print(f"Wrote capture bundle to {dump_bundle}")
+    finally:
+        await manager.close()
+
+
+def read_urls(source: str) -> List[str]:
+    """Read one URL per line from ``source`` (``-`` for stdin), skipping blanks and ``#`` comments."""
+
+    handle = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        return [line.strip() for line in handle if line.strip() and not line.lstrip().startswith("#")]
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def load_checkpoint(path: Path) -> Set[str]:
+    """Return the URLs that already have a successful record in ``path``."""
+
+    done: Set[str] = set()
+    if not path.exists():
+        return done
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # The last line of an interrupted run may be cut short.
+                continue
+            if record.get("status") == "ok":
+                done.add(record["url"])
+    return done
+
+
+def _open_output(output: Optional[Path], resume: bool) -> IO[str]:
+    if output is None:
+        return sys.stdout
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if not resume:
+        return output.open("w", encoding="utf-8")
+    needs_newline = output.exists() and output.stat().st_size > 0 and not output.read_bytes().endswith(b"\n")
+    sink = output.open("a", encoding="utf-8")
+    if needs_newline:
+        sink.write("\n")
+    return sink
+
+
+async def _assess_record(
+    url: str,
+    manager: BrowserManager,
+    executor: AnalysisExecutor,
+    bundle_dir: Optional[Path],
+) -> dict:
+    started = time.perf_counter()
+    try:
+        capture = await capture_listing(url, manager)
+        if bundle_dir is not None:
+            await asyncio.to_thread(write_bundle, capture, bundle_dir / bundle_filename(url))
+        _, heuristics = await executor.analyze(capture)
+    except Exception as exc:
+        return {"url": url, "status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "url": url,
+        "status": "ok",
+        "elapsed_ms": round((time.perf_counter() - started) * 1000),
+        "report": build_response(heuristics).model_dump(mode="json"),
+    }
+
+
+async def assess_batch(
+    urls: List[str],
+    output: Optional[Path],
+    resume: bool,
+    headless: bool,
+    max_concurrency: int,
+    extraction_workers: int,
+    bundle_dir: Optional[Path] = None,
+) -> int:
+    """Assess ``urls`` over one browser and write NDJSON records; return the failure count."""
+
+    sink = _open_output(output, resume)
+    done = load_checkpoint(output) if resume and output is not None else set()
+    failures = 0
+
+    def write(record: dict) -> None:
+        sink.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        sink.flush()
+
+    pending: List[str] = []
+    seen: Set[str] = set()
+    for url in urls:
+        try:
+            normalized = normalize_listing_url(url)
+        except ValueError as exc:
+            failures += 1
+            write({"url": url, "status": "error", "error": str(exc)})
+            continue
+        if normalized not in seen and normalized not in done:
+            seen.add(normalized)
+            pending.append(normalized)
+    if done:
+        print(f"Resuming: {len(done)} listings already assessed.", file=sys.stderr)
+
+    manager = BrowserManager(headless=headless, max_concurrency=max_concurrency)
+    executor = AnalysisExecutor(max_workers=extraction_workers)
+    queue: Iterator[str] = iter(pending)
+    completed = 0
+
+    async def worker() -> None:
+        nonlocal completed, failures
+        # Workers share one iterator, so each URL is taken exactly once.
+        for url in queue:
+            record = await _assess_record(url, manager, executor, bundle_dir)
+            completed += 1
+            failures += record["status"] != "ok"
+            write(record)
+            print(f"[{completed}/{len(pending)}] {record['status']} {url}", file=sys.stderr)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, max_concurrency))))
     finally:
+        executor.shutdown()
         await manager.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return failures
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Assess an Airbnb listing manually.")
-    parser.add_argument("url", help="Listing URL")
+    parser.add_argument("url", nargs="?", help="Listing URL")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Assess every URL in FILE (one per line, '-' for stdin) instead of a single URL.",
+    )
+    parser.add_argument("--output", type=Path, help="Batch mode: append NDJSON records here instead of stdout.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Batch mode: skip URLs that already have an 'ok' record in --output.",
+    )
+    parser.add_argument(
+        "--bundle-dir",
+        type=Path,
+        help="Batch mode: also save each listing's capture bundle in this directory.",
+    )
+    parser.add_argument(
+        "--extraction-workers",
+        type=int,
+        default=0,
+        help="Batch mode: processes for parsing and scoring; 0 uses a worker thread.",
+    )
     parser.add_argument(
         "--headed",
         action="store_true",
@@ -114,8 +266,34 @@ def main() -> None:
     parser.add_argument("--dump-html", type=Path, help="Write rendered HTML to path (debug only).")
     parser.add_argument("--dump-photo-modal", type=Path, help="Write captured photo modal HTML to path.")
     parser.add_argument("--dump-amenities-modal", type=Path, help="Write captured amenities modal HTML to path.")
+    parser.add_argument(
+        "--dump-bundle",
+        type=Path,
+        help="Write every render artifact to a capture bundle (.capture.json.gz) for scripts/replay.py.",
+    )
     args = parser.parse_args()
 
+    if args.batch is not None:
+        dumps = [args.dump_state, args.dump_html, args.dump_photo_modal, args.dump_amenities_modal, args.dump_bundle]
+        if args.url or args.debug or any(dump is not None for dump in dumps):
+            parser.error("--batch cannot be combined with a URL or the debug/dump options")
+        if args.resume and args.output is None:
+            parser.error("--resume needs --output to read the checkpoint from")
+        failures = asyncio.run(
+            assess_batch(
+                read_urls(args.batch),
+                output=args.output,
+                resume=args.resume,
+                headless=not args.headed,
+                max_concurrency=args.max_concurrency,
+                extraction_workers=args.extraction_workers,
+                bundle_dir=args.bundle_dir,
+            )
+        )
+        sys.exit(1 if failures else 0)
+    if args.url is None:
+        parser.error("a listing URL or --batch is required")
+
     asyncio.run(
         assess(
             args.url,
@@ -134,6 +312,7 @@ def main() -> None:
             dump_html=args.dump_html,
             dump_photo_modal=args.dump_photo_modal,
             dump_amenities_modal=args.dump_amenities_modal,
+            dump_bundle=args.dump_bundle,
         )
     )
 
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Export the amenity embedding model to ONNX and quantize it to int8.
+
+Writes ``model.onnx`` (fp32), ``model_int8.onnx`` and ``tokenizer.json`` to the
+output directory, which is what ``AMENITY_EMBED_BACKEND=onnx`` loads. Needs the
+export-time extras (``torch``, ``transformers``, ``onnx``, ``onnxruntime``);
+the serving image only needs ``onnxruntime`` and ``tokenizers``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_OUTPUT = Path(__file__).resolve().parents[1] / "data" / "embedding-onnx"
+
+
+def export(model_name: str, output_dir: Path, opset: int) -> None:
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModel, AutoTokenizer
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name).eval()
+
+    sample = tokenizer(["a sample sentence for tracing"], return_tensors="pt")
+    input_names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    fp32_path = output_dir / "model.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+    print(f"Wrote {fp32_path}")
+
+    int8_path = output_dir / "model_int8.onnx"
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    print(f"Wrote {int8_path}")
+
+    tokenizer.backend_tokenizer.save(str(output_dir / "tokenizer.json"))
+    print(f"Wrote {output_dir / 'tokenizer.json'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the amenity embedding model to int8 ONNX.")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Hugging Face model id to export.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Directory for the exported files.")
+    parser.add_argument("--opset", type=int, default=17, help="ONNX opset version.")
+    args = parser.parse_args()
+    export(args.model, args.output, args.opset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Re-score recorded capture bundles without a browser.
+
+Feeds ``.capture.json.gz`` bundles (written by ``assess.py --dump-bundle`` or
+``--bundle-dir``) through extraction and the heuristics across a process
+pool, writing one NDJSON record per bundle in input order so two runs can be
+diffed after a heuristics change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+API_DIR = PROJECT_ROOT / "api"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(API_DIR) not in sys.path:
+    sys.path.insert(0, str(API_DIR))
+
+from api.bundle import find_bundles, read_bundle  # type: ignore  # noqa: E402
+from api.heuristics import build_response  # type: ignore  # noqa: E402
+from api.workers import analyze_capture  # type: ignore  # noqa: E402
+
+
+def replay_bundle(path: str) -> dict:
+    """Score one bundle. Module-level so pool workers can import it."""
+
+    started = time.perf_counter()
+    try:
+        capture = read_bundle(path)
+        _, heuristics = analyze_capture(capture)
+    except Exception as exc:
+        return {"bundle": path, "status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "url": capture.url,
+        "bundle": path,
+        "status": "ok",
+        "elapsed_ms": round((time.perf_counter() - started) * 1000),
+        "report": build_response(heuristics).model_dump(mode="json"),
+    }
+
+
+def replay(paths: List[str], workers: int, chunksize: int) -> Iterator[dict]:
+    if workers <= 0:
+        yield from map(replay_bundle, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(replay_bundle, paths, chunksize=max(1, chunksize))
+
+
+def write_records(records: Iterable[dict], output: Optional[Path], total: int) -> int:
+    """Write records as NDJSON and return how many failed."""
+
+    sink = sys.stdout
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        sink = output.open("w", encoding="utf-8")
+    failures = 0
+    try:
+        for index, record in enumerate(records, start=1):
+            failures += record["status"] != "ok"
+            sink.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            if record["status"] != "ok":
+                print(f"[{index}/{total}] {record['error']}", file=sys.stderr)
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score capture bundles offline.")
+    parser.add_argument("paths", nargs="+", help="Bundle files or directories to search for *.capture.json.gz.")
+    parser.add_argument("--output", type=Path, help="Write NDJSON records here instead of stdout.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Scoring processes; 0 runs in this process (useful under a profiler).",
+    )
+    parser.add_argument("--chunksize", type=int, default=4, help="Bundles handed to a worker at a time.")
+    args = parser.parse_args()
+
+    paths = [str(path) for path in find_bundles(args.paths)]
+    if not paths:
+        parser.error("no capture bundles found")
+
+    started = time.perf_counter()
+    failures = write_records(replay(paths, args.workers, args.chunksize), args.output, len(paths))
+    elapsed = time.perf_counter() - started
+    print(
+        f"Replayed {len(paths)} bundles ({failures} failed) in {elapsed:.1f}s "
+        f"({len(paths) / elapsed:.1f}/s) with {args.workers} workers.",
+        file=sys.stderr,
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.api import amenity_matcher
+
+
+class _ConceptModel:
+    """Deterministic stand-in for SentenceTransformer keyed on a few concepts."""
+
+    concepts = (("fire pit", "bonfire"), ("sauna",))
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        rows = []
+        for text in texts:
+            row = [float(any(word in text.lower() for word in words)) for words in self.concepts]
+            row.append(0.0 if any(row) else 1.0)
+            rows.append(row)
+        return np.asarray(rows, dtype=np.float32)
+
+
+@pytest.fixture
+def concept_model(monkeypatch, tmp_path):
+    model = _ConceptModel()
+    monkeypatch.setattr(amenity_matcher, "_get_model", lambda: model)
+    monkeypatch.setattr(amenity_matcher, "ALIAS_VECTORS_DIR", tmp_path)
+    monkeypatch.setattr(amenity_matcher, "_alias_store", None)
+    return model
+
+
+def test_embedding_stage_scores_unresolved_tags_in_one_batch(concept_model, tmp_path):
+    present, missing = amenity_matcher.detect_amenity_mentions(
+        ["Fire pit", "Sauna", "Wifi"],
+        "Roast marshmallows by the bonfire. Fast wifi everywhere.",
+    )
+
+    assert present == ["Fire pit", "Wifi"]
+    assert missing == ["Sauna"]
+    assert len(list(tmp_path.glob("amenity-aliases-*.npy"))) == 1
+    # "sauna" is not a static alias, so it is the only alias encoded on demand.
+    assert concept_model.encoded[-1:] == ["sauna"]
+
+
+def test_alias_vectors_are_reused_from_disk_and_negation_is_respected(concept_model, monkeypatch):
+    amenity_matcher._alias_vector_store()
+    monkeypatch.setattr(amenity_matcher, "_alias_store", None)
+    concept_model.encoded.clear()
+
+    present, missing = amenity_matcher.detect_amenity_mentions(
+        ["Fire pit"], "Sorry, there is no bonfire area."
+    )
+
+    assert present == []
+    assert missing == ["Fire pit"]
+    assert concept_model.encoded == ["Sorry, there is no bonfire area."]
+
+
+def test_failed_alias_encode_is_retried_instead_of_cached(concept_model, monkeypatch, tmp_path):
+    def failing_encode(texts, **kwargs):
+        raise RuntimeError("out of memory")
+
+    encode = concept_model.encode
+    monkeypatch.setattr(concept_model, "encode", failing_encode)
+
+    assert amenity_matcher._alias_vector_store() is None
+
+    monkeypatch.setattr(concept_model, "encode", encode)
+    texts, matrix = amenity_matcher._alias_vector_store()
+
+    assert matrix.shape[0] == len(texts)
+    assert amenity_matcher._alias_vector_store()[1] is matrix
+    # Only the vector file is left behind; the temp file was renamed into place.
+    assert [path.suffix for path in tmp_path.iterdir()] == [".npy"]
+
+
+def test_sentence_cache_only_encodes_new_or_edited_sentences(concept_model, monkeypatch, tmp_path):
+    cache = amenity_matcher.SentenceEmbeddingCache(maxsize=16)
+    monkeypatch.setattr(amenity_matcher, "_sentence_cache", cache)
+
+    first = amenity_matcher._encode_sentences(["Cosy sauna.", "Bonfire nights."])
+    concept_model.encoded.clear()
+    second = amenity_matcher._encode_sentences(["Cosy   sauna.", "Bonfire nights!", "Cosy sauna."])
+
+    assert concept_model.encoded == ["Bonfire nights!"]
+    np.testing.assert_array_equal(second[0], first[0])
+    np.testing.assert_array_equal(second[2], first[0])
+
+    path = tmp_path / "sentences.npz"
+    assert cache.save(path) == 3
+    restored = amenity_matcher.SentenceEmbeddingCache(maxsize=2)
+    assert restored.load(path) == 2
+    assert len(restored) == 2
@@ -0,0 +1,38 @@
+from backend.api.amenity_matcher import _AliasAutomaton, _find_fuzzy_hits, detect_amenity_mentions
+
+
+def test_alias_automaton_reports_overlapping_word_matches():
+    automaton = _AliasAutomaton(["hot tub", "tub", "central heat", "heat"])
+
+    matches = sorted(automaton.find("a hot tub and central heat".split()))
+
+    assert matches == [
+        (1, "hot tub", 2),
+        (2, "tub", 1),
+        (4, "central heat", 2),
+        (5, "heat", 1),
+    ]
+    # Whole-word semantics: "heater" must not match "heat".
+    assert list(automaton.find("electric heater".split())) == []
+
+
+def test_detect_amenity_mentions_uses_aliases_and_negation_windows():
+    text = (
+        "Unwind in the jacuzzi after a day outside. "
+        "There is no parking on site. "
+        "Fast wi-fi throughout the flat."
+    )
+
+    present, missing = detect_amenity_mentions(["Hot tub", "Parking", "Wifi", "Crib"], text)
+
+    assert present == ["Hot tub", "Wifi"]
+    assert missing == ["Parking", "Crib"]
+
+
+def test_fuzzy_hits_score_every_alias_in_one_pass_and_skip_negated_sentences():
+    sentences = ["dishwaser", "no microwve"]
+
+    hits = _find_fuzzy_hits(["dishwasher", "microwave", "sauna"], sentences)
+
+    assert hits == {"dishwasher"}
+    assert _find_fuzzy_hits([], sentences) == set()
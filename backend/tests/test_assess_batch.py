@@ -0,0 +1,142 @@
+import asyncio
+import json
+from datetime import timedelta
+
+from fastapi import HTTPException
+
+from backend.api import main
+from backend.api.database import Database, utcnow
+from backend.api.models import AssessmentRequest, ReportType
+
+
+class _Envelope:
+    def __init__(self, overall):
+        self.overall = overall
+
+    def model_dump(self, mode="json"):
+        return {"report": {"overall": self.overall}, "meta": {"report_type": "free"}}
+
+
+def _plan(url, report_type=ReportType.free, user=None):
+    payload = AssessmentRequest(url=f"https://www.airbnb.com/rooms/{url}", report_type=report_type)
+    return main._AssessmentPlan(payload=payload, normalized_url=url, user=user, credit=None)
+
+
+def test_batch_streams_results_as_they_complete_within_its_concurrency_cap(monkeypatch):
+    delays = {"a": 0.03, "b": 0.01, "c": 0.0}
+    running = []
+    peak = []
+
+    async def fake_execute(plan, progress=None, on_update=None):
+        running.append(plan.normalized_url)
+        peak.append(len(running))
+        await asyncio.sleep(delays[plan.normalized_url])
+        running.remove(plan.normalized_url)
+        if plan.normalized_url == "c":
+            raise HTTPException(status_code=502, detail="Failed to render Airbnb listing.")
+        return _Envelope(80)
+
+    monkeypatch.setattr(main, "_execute_assessment", fake_execute)
+    monkeypatch.setattr(main, "_batch_concurrency", 2)
+    invalid = [{"event": "error", "url": "bad", "status_code": 422, "detail": "Not an Airbnb listing URL."}]
+
+    async def run():
+        stream = main._stream_batch([_plan("a"), _plan("b"), _plan("c")], invalid)
+        return [json.loads(line) async for line in stream]
+
+    lines = asyncio.run(run())
+
+    assert [(line["event"], line["url"]) for line in lines[:-1]] == [
+        ("error", "bad"),
+        ("result", "b"),
+        ("error", "c"),
+        ("result", "a"),
+    ]
+    assert lines[-1] == {"event": "complete", "total": 4, "succeeded": 2, "failed": 2}
+    assert max(peak) == 2
+
+
+def test_paid_batch_reserves_each_credit_when_its_listing_starts(tmp_path, monkeypatch):
+    credits_used = []
+    spare_while_running = []
+
+    async def fake_execute(plan, progress=None, on_update=None):
+        # Queued listings hold no reservation, so another request can still reserve a credit.
+        spare = await main._database.reserve_credit(plan.user.id)
+        spare_while_running.append(spare is not None)
+        if spare is not None:
+            await main._database.release_credit(spare.id)
+        credits_used.append(plan.credit.id)
+        assert await main._database.redeem_credit(plan.credit.id)
+        return _Envelope(80)
+
+    monkeypatch.setattr(main, "_execute_assessment", fake_execute)
+    monkeypatch.setattr(main, "_batch_concurrency", 1)
+
+    async def scenario():
+        db = Database(str(tmp_path / "credits.sqlite3"))
+        await db.connect()
+        monkeypatch.setattr(main, "_database", db)
+        try:
+            user = await db.upsert_user("host@example.com")
+            for _ in range(2):
+                await db.create_credit(user.id, utcnow() + timedelta(days=30))
+            plans = [_plan(url, ReportType.paid, user) for url in ("a", "b", "c")]
+            return [json.loads(line) async for line in main._stream_batch(plans, [])]
+        finally:
+            await db.close()
+
+    lines = asyncio.run(scenario())
+
+    assert [line["event"] for line in lines] == ["result", "result", "error", "complete"]
+    assert lines[2]["status_code"] == 302
+    assert spare_while_running == [True, False]
+    assert len(set(credits_used)) == 2
+
+
+def test_redeem_credit_succeeds_only_once(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "credits.sqlite3"))
+        await db.connect()
+        try:
+            user = await db.upsert_user("host@example.com")
+            await db.create_credit(user.id, utcnow() + timedelta(days=30))
+            credit = await db.reserve_credit(user.id)
+            first = await db.redeem_credit(credit.id)
+            second = await db.redeem_credit(credit.id)
+            summary = await db.get_credit_summary(user.id)
+            return first, second, summary.available
+        finally:
+            await db.close()
+
+    assert asyncio.run(scenario()) == (True, False, 0)
+
+
+def test_cancel_during_the_cache_lookup_releases_the_reserved_credit(tmp_path, monkeypatch):
+    class _StalledCache:
+        async def get(self, key):
+            await asyncio.Event().wait()  # an L2 read that never returns
+
+    monkeypatch.setattr(main, "_response_cache", _StalledCache())
+
+    async def scenario():
+        db = Database(str(tmp_path / "credits.sqlite3"))
+        await db.connect()
+        monkeypatch.setattr(main, "_database", db)
+        try:
+            user = await db.upsert_user("host@example.com")
+            await db.create_credit(user.id, utcnow() + timedelta(days=30))
+            payload = AssessmentRequest(url="https://www.airbnb.com/rooms/1", report_type=ReportType.paid)
+            credit = await db.reserve_credit(user.id)
+            plan = main._AssessmentPlan(
+                payload=payload, normalized_url="https://www.airbnb.com/rooms/1", user=user, credit=credit
+            )
+            task = asyncio.create_task(main._execute_assessment(plan))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return await db.reserve_credit(user.id)
+        finally:
+            await db.close()
+
+    assert asyncio.run(scenario()) is not None
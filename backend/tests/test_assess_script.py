@@ -0,0 +1,102 @@
+import asyncio
+import importlib.util
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "assess.py"
+
+
+@pytest.fixture(scope="module")
+def assess_script():
+    spec = importlib.util.spec_from_file_location("assess_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+URLS = """
+# portfolio
+https://www.airbnb.com/rooms/1
+
+  https://www.airbnb.com/rooms/2?check_in=2024-01-01
+   # indented comment
+"""
+
+
+def test_read_urls_skips_blank_lines_and_comments_from_a_file(assess_script, tmp_path):
+    source = tmp_path / "urls.txt"
+    source.write_text(URLS, encoding="utf-8")
+
+    assert assess_script.read_urls(str(source)) == [
+        "https://www.airbnb.com/rooms/1",
+        "https://www.airbnb.com/rooms/2?check_in=2024-01-01",
+    ]
+
+
+def test_read_urls_reads_stdin_for_dash(assess_script, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(URLS))
+
+    assert assess_script.read_urls("-") == [
+        "https://www.airbnb.com/rooms/1",
+        "https://www.airbnb.com/rooms/2?check_in=2024-01-01",
+    ]
+
+
+def test_load_checkpoint_keeps_successes_and_tolerates_a_truncated_last_line(assess_script, tmp_path):
+    output = tmp_path / "results.ndjson"
+    output.write_text(
+        json.dumps({"url": "https://www.airbnb.com/rooms/1", "status": "ok"})
+        + "\n"
+        + json.dumps({"url": "https://www.airbnb.com/rooms/2", "status": "error", "error": "boom"})
+        + "\n"
+        + '{"url": "https://www.airbnb.com/rooms/3", "sta',
+        encoding="utf-8",
+    )
+
+    assert assess_script.load_checkpoint(output) == {"https://www.airbnb.com/rooms/1"}
+    assert assess_script.load_checkpoint(tmp_path / "missing.ndjson") == set()
+
+
+def test_resume_skips_done_and_duplicate_urls_and_appends_after_a_cut_line(assess_script, tmp_path, monkeypatch):
+    assessed = []
+
+    async def fake_record(url, manager, executor, bundle_dir):
+        assessed.append(url)
+        return {"url": url, "status": "ok"}
+
+    monkeypatch.setattr(assess_script, "_assess_record", fake_record)
+    output = tmp_path / "results.ndjson"
+    output.write_text(
+        json.dumps({"url": "https://www.airbnb.com/rooms/1", "status": "ok"})
+        + "\n"
+        + json.dumps({"url": "https://www.airbnb.com/rooms/2", "status": "error", "error": "boom"})
+        + "\n"
+        + '{"url": "https://www.airbnb.com/rooms/3", "sta',
+        encoding="utf-8",
+    )
+    urls = [
+        "https://www.airbnb.com/rooms/1",
+        "https://www.airbnb.com/rooms/2",
+        "https://www.airbnb.com/rooms/2?adults=2",
+        "https://www.airbnb.com/rooms/3",
+    ]
+
+    failures = asyncio.run(
+        assess_script.assess_batch(
+            urls, output, resume=True, headless=True, max_concurrency=2, extraction_workers=0
+        )
+    )
+
+    assert failures == 0
+    assert sorted(assessed) == ["https://www.airbnb.com/rooms/2", "https://www.airbnb.com/rooms/3"]
+    lines = output.read_text(encoding="utf-8").splitlines()
+    # The cut line stays on its own, and the new records start on fresh lines.
+    assert lines[2] == '{"url": "https://www.airbnb.com/rooms/3", "sta'
+    assert assess_script.load_checkpoint(output) == {
+        "https://www.airbnb.com/rooms/1",
+        "https://www.airbnb.com/rooms/2",
+        "https://www.airbnb.com/rooms/3",
+    }
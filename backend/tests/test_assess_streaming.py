@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api import main
+
+
+class _Envelope:
+    def model_dump(self, mode="json"):
+        return {"report": {"overall": 81}, "meta": {"report_type": "free"}}
+
+
+def _collect(plan=None):
+    async def run():
+        return [json.loads(line) async for line in main._stream_assessment(plan)]
+
+    return asyncio.run(run())
+
+
+def test_stream_emits_partial_reports_before_the_final_envelope(monkeypatch):
+    async def fake_execute(plan, progress=None, on_update=None):
+        on_update("heuristics", {"report": {"overall": 78}})
+        await asyncio.sleep(0)
+        on_update("refinement", {"report": {"overall": 81}})
+        return _Envelope()
+
+    monkeypatch.setattr(main, "_execute_assessment", fake_execute)
+
+    lines = _collect()
+
+    assert [line["event"] for line in lines] == ["heuristics", "refinement", "complete"]
+    assert lines[0]["report"]["overall"] == 78
+    assert lines[-1]["report"]["overall"] == 81
+
+
+def test_stream_reports_pipeline_errors_inline(monkeypatch):
+    async def fake_execute(plan, progress=None, on_update=None):
+        on_update("heuristics", {"report": {"overall": 78}})
+        raise HTTPException(status_code=502, detail="Failed to render Airbnb listing.")
+
+    monkeypatch.setattr(main, "_execute_assessment", fake_execute)
+
+    lines = _collect()
+
+    assert lines[-1] == {"event": "error", "status_code": 502, "detail": "Failed to render Airbnb listing."}
+
+
+class _FakeRequest:
+    def __init__(self, disconnect_after):
+        self._disconnect_after = disconnect_after
+
+    async def receive(self):
+        await asyncio.sleep(self._disconnect_after)
+        return {"type": "http.disconnect"}
+
+
+def test_cancel_on_disconnect_stops_the_request_work():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        with pytest.raises(main._ClientDisconnected):
+            await main._cancel_on_disconnect(_FakeRequest(0.01), slow())
+        return await main._cancel_on_disconnect(_FakeRequest(10), asyncio.sleep(0, result="done"))
+
+    assert asyncio.run(run()) == "done"
+    assert cancelled == [True]
+
+
+def test_caller_arriving_during_refinement_joins_the_pipeline(monkeypatch):
+    renders = []
+    refining = None
+    release_refinement = None
+
+    async def fake_preliminary(normalized_url, listing_key):
+        renders.append(normalized_url)
+        return f"preliminary-{len(renders)}"
+
+    async def fake_refined(normalized_url, listing_key, preliminary):
+        refining.set()
+        await release_refinement.wait()
+        return f"refined-from-{preliminary}"
+
+    monkeypatch.setattr(main, "_listing_cache", None)
+    monkeypatch.setattr(main, "_build_preliminary_analysis", fake_preliminary)
+    monkeypatch.setattr(main, "_build_refined_analysis", fake_refined)
+
+    async def run():
+        nonlocal refining, release_refinement
+        refining, release_refinement = asyncio.Event(), asyncio.Event()
+        url = "https://www.airbnb.com/rooms/1"
+        seen = []
+        first = asyncio.create_task(main._analyze_listing(url, on_preliminary=seen.append))
+        await refining.wait()
+        late = asyncio.create_task(main._analyze_listing(url, on_preliminary=seen.append))
+        await asyncio.sleep(0.01)
+        release_refinement.set()
+        return await asyncio.gather(first, late), seen
+
+    results, seen = asyncio.run(run())
+
+    assert renders == ["https://www.airbnb.com/rooms/1"]
+    assert seen == ["preliminary-1", "preliminary-1"]
+    assert results == ["refined-from-preliminary-1", "refined-from-preliminary-1"]
+    assert main._preliminary_results == {}
@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+
+from backend.api.browser import BrowserManager
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+        self.visited = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, script):
+        return None
+
+    async def goto(self, url):
+        self.visited.append(url)
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+        self.cookies_cleared = 0
+        self.page = _FakePage()
+
+    async def new_page(self):
+        return self.page
+
+    async def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    async def route(self, pattern, handler):
+        return None
+
+    async def close(self):
+        self.closed = True
+        self.page.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def _manager(**kwargs):
+    manager = BrowserManager(**kwargs)
+    browser = _FakeBrowser()
+    manager._browser = browser
+
+    async def ensure_browser():
+        return browser
+
+    manager._ensure_browser = ensure_browser
+    return manager, browser
+
+
+async def _use(manager):
+    async with manager.page() as page:
+        return page
+
+
+def test_clean_checkin_returns_the_page_to_the_pool_for_reuse():
+    manager, browser = _manager()
+
+    async def scenario():
+        first = await _use(manager)
+        second = await _use(manager)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert len(browser.contexts) == 1
+    assert browser.contexts[0].cookies_cleared == 2
+    assert first.visited == ["about:blank", "about:blank"]
+    assert manager.stats()["idle_pages"] == 1
+
+
+def test_page_is_discarded_when_the_body_raises():
+    manager, browser = _manager()
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            async with manager.page():
+                raise RuntimeError("render failed")
+        return await _use(manager)
+
+    page = asyncio.run(scenario())
+
+    assert browser.contexts[0].closed
+    assert page is browser.contexts[1].page
+
+
+def test_page_is_recycled_after_max_page_uses():
+    manager, browser = _manager(max_page_uses=2)
+
+    async def scenario():
+        return [await _use(manager) for _ in range(3)]
+
+    pages = asyncio.run(scenario())
+
+    assert pages[0] is pages[1] is not pages[2]
+    assert browser.contexts[0].closed
+    assert not browser.contexts[1].closed
+
+
+def test_unhealthy_idle_page_is_dropped_at_checkout():
+    manager, browser = _manager()
+
+    async def scenario():
+        first = await _use(manager)
+        first.closed = True  # the tab crashed while idle
+        return first, await _use(manager)
+
+    first, second = asyncio.run(scenario())
+
+    assert second is not first
+    assert browser.contexts[0].closed
+    assert len(browser.contexts) == 2
+
+
+def test_idle_page_from_a_replaced_browser_is_not_reused():
+    manager, old_browser = _manager()
+
+    async def scenario():
+        first = await _use(manager)
+        new_browser = _FakeBrowser()
+        manager._browser = new_browser
+
+        async def ensure_browser():
+            return new_browser
+
+        manager._ensure_browser = ensure_browser
+        return first, await _use(manager), new_browser
+
+    first, second, new_browser = asyncio.run(scenario())
+
+    assert second is not first
+    assert old_browser.contexts[0].closed
+    assert second is new_browser.contexts[0].page
+
+
+def test_stats_count_pages_in_use_and_waiting():
+    manager, _ = _manager(max_concurrency=1)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def hold():
+            async with manager.page():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        busy = manager.stats()
+        release.set()
+        await asyncio.gather(holder, waiter)
+        return busy, manager.stats()
+
+    busy, idle = asyncio.run(scenario())
+
+    assert (busy["pages_in_use"], busy["pages_waiting"], busy["idle_pages"]) == (1, 1, 0)
+    assert (idle["pages_in_use"], idle["pages_waiting"], idle["idle_pages"]) == (0, 0, 1)
+
+
+def test_warm_counts_checked_out_pages_and_skips_when_every_slot_is_busy():
+    manager, browser = _manager(max_concurrency=2)
+
+    async def scenario():
+        release = asyncio.Event()
+        entered = asyncio.Event()
+
+        async def hold():
+            async with manager.page():
+                entered.set()
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await entered.wait()
+        await manager.warm()
+        await manager.warm()
+        warmed = manager.stats()
+
+        # With both slots checked out there is nothing to warm, and warm() must not block.
+        async with manager.page():
+            await asyncio.wait_for(manager.warm(), timeout=1)
+        release.set()
+        await holder
+        return warmed
+
+    warmed = asyncio.run(scenario())
+
+    assert (warmed["pages_in_use"], warmed["idle_pages"]) == (1, 1)
+    assert len(browser.contexts) == 2
@@ -0,0 +1,20 @@
+from backend.api.utils import build_cache_key, build_listing_cache_key
+
+
+def test_listing_cache_key_ignores_report_scope():
+    url = "https://www.airbnb.com/rooms/123/?adults=2"
+
+    listing_key = build_listing_cache_key(url)
+
+    assert listing_key == "https://www.airbnb.com/rooms/123"
+    assert build_listing_cache_key("HTTPS://WWW.AIRBNB.COM/rooms/123") == listing_key
+
+
+def test_report_cache_key_builds_on_listing_key():
+    url = "https://www.airbnb.com/rooms/123"
+
+    free_key = build_cache_key(url, report_type="free")
+    paid_key = build_cache_key(url, report_type="paid", user_id="U1", credit_id="C1")
+
+    assert free_key == "https://www.airbnb.com/rooms/123::free"
+    assert paid_key == "https://www.airbnb.com/rooms/123::paid::u1::c1"
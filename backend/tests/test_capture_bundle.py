@@ -0,0 +1,32 @@
+import gzip
+
+import pytest
+
+from backend.api.bundle import BundleError, bundle_filename, find_bundles, read_bundle, write_bundle
+from backend.api.extract import ListingCapture
+
+
+def test_bundle_round_trips_every_render_artifact(tmp_path):
+    capture = ListingCapture(
+        url="https://www.airbnb.com/rooms/123",
+        html="<html><h1>Loft</h1></html>",
+        photo_modal_html="<div>photos</div>",
+        amenities_items=["Wifi", "Hot tub"],
+        preloaded_state={"niobeMinimalClientData": [["PdpSections", {"title": "Loft"}]]},
+    )
+    path = write_bundle(capture, tmp_path / "nested" / bundle_filename(capture.url))
+
+    assert read_bundle(path) == capture
+    assert list(find_bundles([tmp_path])) == [path]
+
+
+def test_read_bundle_rejects_other_files(tmp_path):
+    plain = tmp_path / "state.json"
+    plain.write_text("{}", encoding="utf-8")
+    foreign = tmp_path / "other.capture.json.gz"
+    with gzip.open(foreign, "wt", encoding="utf-8") as fh:
+        fh.write('{"format": "something-else"}')
+
+    for path in (plain, foreign):
+        with pytest.raises(BundleError):
+            read_bundle(path)
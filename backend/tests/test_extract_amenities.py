@@ -1,6 +1,4 @@
-from bs4 import BeautifulSoup
-
-from backend.api.extract import _extract_amenities
+from backend.api.extract import _extract_amenities, _parse_fragment
 
 
 def test_extract_amenities_from_modal_markup():
@@ -26,9 +24,9 @@ def test_extract_amenities_from_modal_markup():
         </div>
     """
 
-    soup = BeautifulSoup("<main></main>", "html.parser")
-    dialog = BeautifulSoup(html, "html.parser")
+    page = _parse_fragment("<main></main>")
+    dialog = _parse_fragment(html)
 
-    amenities = _extract_amenities(soup, dialog)
+    amenities = _extract_amenities(page, dialog)
 
     assert amenities == ["Hair dryer", "Shampoo", "Self check-in", "Lockbox"]
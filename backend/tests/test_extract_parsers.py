@@ -0,0 +1,52 @@
+from trafilatura import extract as trafilatura_extract
+
+from backend.api.extract import (
+    _detect_legacy_gallery,
+    _extract_amenities,
+    _extract_house_rules,
+    _extract_photos,
+    _parse_fragment,
+    extract_listing,
+)
+
+LISTING_HTML = """
+<html><body>
+    <main><h1 data-testid="title">Harbour loft</h1><p>A bright loft above the harbour with a long balcony, a full kitchen and fast wifi for remote work.</p></main>
+    <section data-section-id="AMENITIES_DEFAULT">
+        <div data-testid="amenity-item">Wifi</div>
+        <div data-testid="amenity-item">Free parking on premises</div>
+    </section>
+    <section data-section-id="POLICIES_DEFAULT">
+        <div><div><h3>House rules</h3></div><ul><li>No pets</li><li>Quiet hours after 10pm</li></ul></div>
+    </section>
+    <button aria-label="Kitchen with island">
+        <picture>
+            <source srcset="https://example.com/k.jpg?im_w=720 720w, https://example.com/k-lg.jpg?im_w=1200 1200w">
+            <img alt="Listing image 3" src="https://example.com/k.jpg?im_w=320">
+        </picture>
+    </button>
+    <img src="https://example.com/bath.jpg?im_w=960" alt="Bathroom with soaking tub">
+</body></html>
+"""
+
+
+def test_field_extractors_read_the_lxml_tree():
+    tree = _parse_fragment(LISTING_HTML)
+
+    assert _extract_amenities(tree) == ["Wifi", "Free parking on premises"]
+    assert _extract_house_rules(tree) == ["No pets", "Quiet hours after 10pm"]
+    assert [(photo.url, photo.alt) for photo in _extract_photos(tree)] == [
+        ("https://example.com/k-lg.jpg?im_w=1200", "Kitchen with island"),
+        ("https://example.com/bath.jpg?im_w=960", "Bathroom with soaking tub"),
+    ]
+    assert _detect_legacy_gallery(tree) is True
+
+
+def test_shared_tree_gives_the_same_full_text_and_survives_trafilatura():
+    content = extract_listing(LISTING_HTML, "https://www.airbnb.com/rooms/1")
+
+    assert content.full_text == trafilatura_extract(LISTING_HTML, include_comments=False, favor_precision=True)
+    # trafilatura prunes the tree it reads; the field extractors still see the whole page.
+    assert content.title == "Harbour loft"
+    assert content.house_rules == ["No pets", "Quiet hours after 10pm"]
+    assert len(content.photos) == 2
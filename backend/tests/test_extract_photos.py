@@ -1,6 +1,4 @@
-from bs4 import BeautifulSoup
-
-from backend.api.extract import _extract_photos, extract_listing
+from backend.api.extract import _extract_photos, _parse_fragment, extract_listing
 
 
 def test_extract_photos_older_layout_labels():
@@ -20,8 +18,7 @@ def test_extract_photos_older_layout_labels():
         </div>
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    photos = _extract_photos(soup)
+    photos = _extract_photos(_parse_fragment(html))
 
     assert [photo.url for photo in photos] == [
         "https://example.com/photo-lg.jpg?im_w=960",
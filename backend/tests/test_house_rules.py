@@ -1,13 +1,7 @@
-from bs4 import BeautifulSoup
-
-from backend.api.extract import ListingContent, _extract_house_rules
+from backend.api.extract import ListingContent, _extract_house_rules, _parse_fragment
 from backend.api.heuristics import _score_trust
 
 
-def _soup(html: str) -> BeautifulSoup:
-    return BeautifulSoup(html, "html.parser")
-
-
 def test_extract_house_rules_from_policies_section():
     html = """
     <section data-section-id="POLICIES_DEFAULT">
@@ -26,9 +20,7 @@ def test_extract_house_rules_from_policies_section():
         </div>
     </section>
     """
-    soup = _soup(html)
-
-    rules = _extract_house_rules(soup)
+    rules = _extract_house_rules(_parse_fragment(html))
 
     assert rules == ["No pets", "No parties", "Check-out before 10am"]
 
@@ -47,9 +39,7 @@ def test_extract_house_rules_from_modal_dialog():
         </div>
     </div>
     """
-    soup = _soup(html)
-
-    rules = _extract_house_rules(soup)
+    rules = _extract_house_rules(_parse_fragment(html))
 
     assert rules == ["No smoking", "Quiet hours after 10pm"]
 
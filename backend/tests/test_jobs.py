@@ -0,0 +1,129 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from backend.api.database import Database, utcnow
+from backend.api.jobs import JobManager, JobQueueFull
+from backend.api.models import JobStage, JobState
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code, detail):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def test_job_reports_stages_to_watchers_and_stores_the_result():
+    async def scenario():
+        manager = JobManager(workers=1)
+        manager.start()
+        release = asyncio.Event()
+
+        async def runner(progress):
+            progress(JobStage.rendering)
+            await release.wait()
+            progress(JobStage.refining)
+            return {"ok": True}
+
+        job = manager.submit(runner, owner_id="user-1")
+        seen = []
+
+        async def watch():
+            async for snapshot in manager.watch(job, heartbeat_seconds=0.01):
+                seen.append(None if snapshot is None else (snapshot.state, snapshot.stage))
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.wait_for(watcher, timeout=1)
+        await manager.close()
+        return job, seen
+
+    job, seen = asyncio.run(scenario())
+
+    assert job.state is JobState.succeeded
+    assert job.result == {"ok": True}
+    states = [entry for entry in seen if entry is not None]
+    assert (JobState.running, JobStage.rendering) in states
+    assert states[-1] == (JobState.succeeded, JobStage.done)
+    assert None in seen  # keep-alives while the runner was blocked
+
+
+def test_job_failures_keep_http_status_and_queue_is_bounded():
+    async def scenario():
+        manager = JobManager(workers=1, max_pending=1)
+        manager.start()
+
+        async def failing(progress):
+            raise _HTTPError(502, "Failed to render Airbnb listing.")
+
+        job = manager.submit(failing)
+        await asyncio.sleep(0.01)
+        blocker = asyncio.Event()
+
+        async def blocked(progress):
+            await blocker.wait()
+
+        manager.submit(blocked)
+        await asyncio.sleep(0.01)
+        manager.submit(blocked)
+        with pytest.raises(JobQueueFull):
+            manager.submit(blocked)
+        await manager.close()
+        return job
+
+    job = asyncio.run(scenario())
+
+    assert job.state is JobState.failed
+    assert job.error.status_code == 502
+    assert job.error.detail == "Failed to render Airbnb listing."
+
+
+def test_close_runs_the_cancel_callback_of_jobs_that_never_started():
+    async def scenario():
+        manager = JobManager(workers=1)
+        manager.start()
+        blocker = asyncio.Event()
+        released = []
+
+        async def blocked(progress):
+            await blocker.wait()
+
+        async def release(name):
+            released.append(name)
+
+        running = manager.submit(blocked, on_cancel=lambda: release("running"))
+        await asyncio.sleep(0.01)
+        queued = manager.submit(blocked, on_cancel=lambda: release("queued"))
+        await manager.close()
+        return running, queued, released
+
+    running, queued, released = asyncio.run(scenario())
+
+    assert released == ["queued"]
+    assert running.state is JobState.failed
+    assert queued.error.status_code == 503
+
+
+def test_refresh_reservation_fails_once_the_credit_was_taken(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "credits.sqlite3"), reservation_ttl_minutes=0)
+        await db.connect()
+        try:
+            user = await db.upsert_user("host@example.com")
+            await db.create_credit(user.id, utcnow() + timedelta(days=30))
+            held = await db.reserve_credit(user.id)
+            refreshed = await db.refresh_reservation(held)
+            # With a zero TTL the reservation lapses at once and anyone can take it.
+            taken = await db.reserve_credit(user.id)
+            return held, refreshed, taken, await db.refresh_reservation(refreshed)
+        finally:
+            await db.close()
+
+    held, refreshed, taken, lost = asyncio.run(scenario())
+
+    assert refreshed is not None and refreshed.reserved_at >= held.reserved_at
+    assert taken.id == held.id
+    assert lost is None
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+from backend.api.cache import AssessmentCache, TieredCache
+from backend.api.models import AssessmentResponse
+from backend.api.scorer import LLMSettings, generate_listing_overview, llm_cache_key, refine_assessment
+
+EXAMPLE = AssessmentResponse.model_validate(AssessmentResponse.model_config["json_schema_extra"]["example"])
+
+
+class _Response:
+    def __init__(self, text):
+        self._text = text
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"content": [{"text": self._text}]}
+
+
+class _Client:
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    async def post(self, endpoint, headers, json):
+        self.calls += 1
+        return _Response(self.text)
+
+
+def _cache():
+    return TieredCache[str](AssessmentCache(maxsize=8, ttl_seconds=60), namespace="llm", serialize=str, deserialize=str)
+
+
+def test_identical_refinement_prompts_hit_the_cache():
+    settings = LLMSettings(api_key="test")
+    client = _Client(json.dumps({"overall_adjustment": 3, "top_fixes": []}))
+    cache = _cache()
+
+    async def run():
+        first = await refine_assessment(EXAMPLE, settings, client, context={"summary": "Loft"}, cache=cache)
+        second = await refine_assessment(EXAMPLE, settings, client, context={"summary": "Loft"}, cache=cache)
+        changed = await refine_assessment(EXAMPLE, settings, client, context={"summary": "Barn"}, cache=cache)
+        return first, second, changed
+
+    first, second, changed = asyncio.run(run())
+
+    assert client.calls == 2
+    assert first == second
+    assert first.overall == EXAMPLE.overall + 3
+    assert changed.overall == first.overall
+    assert cache.stats() == {"l1_hits": 1, "l2_hits": 0, "misses": 2}
+
+
+def test_overview_cache_skips_unusable_responses():
+    settings = LLMSettings(api_key="test")
+    client = _Client("   ")
+    cache = _cache()
+
+    async def run():
+        assert await generate_listing_overview(EXAMPLE, settings, client, cache=cache) is None
+        client.text = "Lean into the loft's light."
+        first = await generate_listing_overview(EXAMPLE, settings, client, cache=cache)
+        second = await generate_listing_overview(EXAMPLE, settings, client, cache=cache)
+        return first, second
+
+    assert asyncio.run(run()) == ("Lean into the loft's light.", "Lean into the loft's light.")
+    assert client.calls == 2
+
+
+def test_cache_key_depends_on_temperature_and_model():
+    payload = {"model": "a", "temperature": 0.2, "max_output_tokens": 10, "messages": []}
+
+    assert llm_cache_key(payload) == llm_cache_key(dict(reversed(list(payload.items()))))
+    assert llm_cache_key(payload) != llm_cache_key({**payload, "temperature": 0.4})
+    assert llm_cache_key(payload) != llm_cache_key({**payload, "model": "b"})
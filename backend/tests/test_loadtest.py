@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from backend.api.browser import BrowserManager, rewrite_upstream_url
+from backend.loadtest.fake_airbnb import LatencyProfile, ListingSource, create_app
+from backend.loadtest.loadgen import percentile
+
+
+def test_fake_airbnb_serves_pages_payloads_and_modals():
+    client = TestClient(create_app(ListingSource(payload_ratio=0.0), LatencyProfile(0, 0, 0, 0)))
+
+    page = client.get("/rooms/3")
+    payload = client.get("/api/v3/StaysPdpSections", params={"id": 3})
+    photos = client.get("/__modal/photos/3")
+
+    assert page.status_code == 200
+    assert 'data-testid="photo-tour-button"' in page.text and "StaysPdpSections" in page.text
+    assert payload.json() == {"data": {}}
+    assert photos.text.startswith('<div role="dialog">')
+    assert client.get("/im/pictures/listing-1.jpg").headers["content-type"] == "image/gif"
+
+
+class _FakeRoute:
+    def __init__(self, url):
+        self.request = SimpleNamespace(url=url, resource_type="document")
+        self.calls = []
+
+    async def fetch(self, url):
+        self.calls.append(("fetch", url))
+        return "response"
+
+    async def fulfill(self, response):
+        self.calls.append(("fulfill", response))
+
+    async def continue_(self):
+        self.calls.append(("continue", None))
+
+
+def test_upstream_override_replays_requests_against_the_local_server():
+    manager = BrowserManager(upstream_override="http://127.0.0.1:8900")
+    route = _FakeRoute("https://www.airbnb.com/rooms/3?adults=2")
+    data_route = _FakeRoute("data:image/png;base64,AAAA")
+
+    async def scenario():
+        await manager._route_request(route)
+        await manager._route_request(data_route)
+
+    asyncio.run(scenario())
+
+    assert route.calls == [("fetch", "http://127.0.0.1:8900/rooms/3?adults=2"), ("fulfill", "response")]
+    assert data_route.calls == [("continue", None)]
+    assert rewrite_upstream_url("blob:https://www.airbnb.com/x", "http://127.0.0.1:8900") is None
+
+
+def test_percentile_uses_nearest_rank():
+    samples = list(range(1, 101))
+
+    assert [percentile(samples, pct) for pct in (50, 95, 99)] == [50, 95, 99]
+    assert percentile([], 50) is None
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from backend.api import amenity_matcher
+
+
+class _FakeSentenceTransformer:
+    release = threading.Event()
+
+    def __init__(self, name):
+        self.name = name
+        self.release.wait(timeout=5)
+
+    def encode(self, texts, normalize_embeddings=True, show_progress_bar=False):
+        return [[1.0, 0.0] for _ in texts]
+
+
+@pytest.fixture
+def fresh_model_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(amenity_matcher, "SentenceTransformer", _FakeSentenceTransformer)
+    monkeypatch.setattr(amenity_matcher, "ALIAS_VECTORS_DIR", tmp_path)
+    monkeypatch.setattr(amenity_matcher, "_model", None)
+    monkeypatch.setattr(amenity_matcher, "_model_state", "idle")
+    monkeypatch.setattr(amenity_matcher, "_warmup_thread", None)
+    monkeypatch.setattr(amenity_matcher, "_alias_store", None)
+    _FakeSentenceTransformer.release.clear()
+    yield
+    _FakeSentenceTransformer.release.set()
+
+
+def test_deferred_mode_skips_embeddings_until_background_load_finishes(monkeypatch, fresh_model_state):
+    monkeypatch.setattr(amenity_matcher, "DEFER_UNTIL_READY", True)
+
+    assert amenity_matcher._get_model() is None
+    assert amenity_matcher.model_status() == "loading"
+    assert amenity_matcher.embeddings_deferred()
+
+    _FakeSentenceTransformer.release.set()
+    amenity_matcher._warmup_thread.join(timeout=5)
+
+    assert amenity_matcher.model_status() == "ready"
+    assert not amenity_matcher.embeddings_deferred()
+    assert isinstance(amenity_matcher._get_model(), _FakeSentenceTransformer)
+
+
+def test_blocking_mode_loads_once_on_first_use(monkeypatch, fresh_model_state):
+    monkeypatch.setattr(amenity_matcher, "DEFER_UNTIL_READY", False)
+    _FakeSentenceTransformer.release.set()
+
+    model = amenity_matcher._get_model()
+
+    assert isinstance(model, _FakeSentenceTransformer)
+    assert amenity_matcher._get_model() is model
+    assert amenity_matcher.model_status() == "ready"
+    assert not amenity_matcher.embeddings_deferred()
@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.api import amenity_matcher
+from backend.api.amenity_matcher import OnnxSentenceEncoder
+
+
+class _FakeTokenizer:
+    def encode_batch(self, texts):
+        encodings = []
+        for text in texts:
+            ids = [len(word) for word in text.split()]
+            pad = 3 - len(ids)
+            encodings.append(SimpleNamespace(ids=ids + [0] * pad, attention_mask=[1] * len(ids) + [0] * pad))
+        return encodings
+
+
+class _FakeSession:
+    """Token embedding = [id, 1]; padding positions get a large value that pooling must ignore."""
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, _outputs, feeds):
+        ids = feeds["input_ids"].astype(np.float32)
+        hidden = np.stack([ids, np.ones_like(ids)], axis=-1)
+        hidden[feeds["attention_mask"] == 0] = 1000.0
+        return [hidden]
+
+
+def test_onnx_encoder_mean_pools_over_the_attention_mask():
+    encoder = OnnxSentenceEncoder(_FakeSession(), _FakeTokenizer(), batch_size=1)
+
+    raw = encoder.encode(["ab abcd", "abc"], normalize_embeddings=False)
+    normalized = encoder.encode(["ab abcd", "abc"])
+
+    np.testing.assert_allclose(raw, [[3.0, 1.0], [3.0, 1.0]])
+    np.testing.assert_allclose(np.linalg.norm(normalized, axis=1), [1.0, 1.0], rtol=1e-6)
+
+
+ONNX_DIR = Path(os.getenv("AMENITY_EMBED_ONNX_DIR", "backend/data/embedding-onnx"))
+
+
+@pytest.mark.skipif(
+    not (ONNX_DIR / amenity_matcher.ONNX_MODEL_FILE).exists(),
+    reason="run scripts/export_embedding_onnx.py to produce the ONNX export",
+)
+def test_onnx_int8_export_matches_pytorch_embeddings():
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+
+    sentences = [
+        "Unwind in the jacuzzi after a day outside.",
+        "Fast wi-fi throughout the flat, plus a dedicated desk.",
+        "Roast marshmallows by the fire pit on the terrace.",
+        "hot tub",
+        "free parking on premises",
+    ]
+    reference = sentence_transformers.SentenceTransformer(amenity_matcher.DEFAULT_MODEL_NAME).encode(
+        sentences, normalize_embeddings=True, show_progress_bar=False
+    )
+    onnx = OnnxSentenceEncoder.from_dir(ONNX_DIR, amenity_matcher.ONNX_MODEL_FILE).encode(sentences)
+
+    cosine = (reference * onnx).sum(axis=1)
+    assert cosine.min() > 0.98
+    # Quantization must not change which sentence an alias matches best.
+    aliases, listing = slice(3, None), slice(0, 3)
+    np.testing.assert_array_equal(
+        (reference[aliases] @ reference[listing].T).argmax(axis=1),
+        (onnx[aliases] @ onnx[listing].T).argmax(axis=1),
+    )
@@ -0,0 +1,117 @@
+from backend.api.extract import extract_listing
+from backend.api.pdp import extract_from_payload
+
+
+def _payload(*sections):
+    return {
+        "data": {
+            "presentation": {
+                "stayProductDetailPage": {
+                    "sections": {
+                        "sections": [
+                            {"sectionComponentType": kind, "section": body}
+                            for kind, body in sections
+                        ]
+                    }
+                }
+            }
+        }
+    }
+
+
+def test_extract_from_payload_reads_core_sections():
+    payload = _payload(
+        ("TITLE_DEFAULT", {"title": "  Sunny loft  near the park "}),
+        ("OVERVIEW_DEFAULT", {"title": "Entire loft in Portland, Oregon"}),
+        (
+            "DESCRIPTION_DEFAULT",
+            {"htmlDescription": {"htmlText": "Bright loft.<br /><br /><b>The space</b><br />Two rooms &amp; a deck."}},
+        ),
+        (
+            "AMENITIES_DEFAULT",
+            {
+                "seeAllAmenitiesGroups": [
+                    {
+                        "title": "Kitchen",
+                        "amenities": [
+                            {"title": "Coffee maker", "available": True},
+                            {"title": "Dishwasher", "available": False},
+                        ],
+                    },
+                    {"title": "Internet", "amenities": [{"title": "Wifi", "available": True}]},
+                ]
+            },
+        ),
+        (
+            "PHOTO_TOUR_SCROLLABLE_MODAL",
+            {
+                "mediaItems": [
+                    {
+                        "baseUrl": "https://a0.muscache.com/im/pictures/a.jpg",
+                        "accessibilityLabel": "Listing image 1",
+                        "imageMetadata": {"caption": "Primary bedroom"},
+                    },
+                    {"baseUrl": "https://a0.muscache.com/im/pictures/b.jpg", "accessibilityLabel": "Listing image 2"},
+                    {"baseUrl": "https://a0.muscache.com/im/pictures/a.jpg"},
+                ]
+            },
+        ),
+        ("POLICIES_DEFAULT", {"houseRules": [{"title": "No parties"}, {"title": "No parties"}, {"title": "Pets allowed"}]}),
+    )
+
+    result = extract_from_payload(payload)
+
+    assert result.title == "Sunny loft near the park"
+    assert result.summary == "Entire loft in Portland, Oregon"
+    assert result.description == "Bright loft.\n\nThe space\nTwo rooms & a deck."
+    assert result.amenities == ["Coffee maker", "Wifi"]
+    assert [photo.url for photo in result.photos] == [
+        "https://a0.muscache.com/im/pictures/a.jpg",
+        "https://a0.muscache.com/im/pictures/b.jpg",
+    ]
+    assert [photo.alt for photo in result.photos] == ["Primary bedroom", ""]
+    assert result.house_rules == ["No parties", "Pets allowed"]
+    assert result.reviews == []
+    assert "reviews" not in result.found_fields()
+
+
+def test_extract_from_payload_tolerates_missing_or_unknown_payloads():
+    assert extract_from_payload(None).found_fields() == []
+    assert extract_from_payload({"data": {"unexpected": [1, 2, 3]}}).found_fields() == []
+
+
+def test_preview_only_payload_leaves_photos_and_amenities_to_the_dom():
+    payload = _payload(
+        (
+            "HERO_DEFAULT",
+            {"previewImages": [{"baseUrl": f"https://a0.muscache.com/im/pictures/hero-{index}.jpg"} for index in range(5)]},
+        ),
+        (
+            "AMENITIES_DEFAULT",
+            {
+                "previewAmenitiesGroups": [
+                    {"amenities": [{"title": "Wifi", "available": True}, {"title": "Kitchen", "available": True}]}
+                ]
+            },
+        ),
+    )
+    gallery = "".join(
+        f'<button aria-label="Room {index}"><img src="https://a0.muscache.com/im/pictures/p-{index}.jpg?im_w=720"></button>'
+        for index in range(30)
+    )
+    amenities = "".join(
+        f'<div data-testid="amenity-item">{name}</div>' for name in ("Wifi", "Kitchen", "Hot tub", "Washer")
+    )
+    html = (
+        '<html><body><h1 data-testid="title">Loft</h1>'
+        f"<div>{gallery}</div>"
+        f'<div data-section-id="AMENITIES_DEFAULT">{amenities}</div>'
+        "</body></html>"
+    )
+
+    structured = extract_from_payload(payload)
+    content = extract_listing(html, "https://www.airbnb.com/rooms/1", preloaded_state=payload)
+
+    assert structured.photos == [] and structured.amenities == []
+    assert len(content.photos) == 30
+    assert content.amenities_listed == ["Wifi", "Kitchen", "Hot tub", "Washer"]
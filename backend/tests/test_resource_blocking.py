@@ -0,0 +1,34 @@
+from backend.api.browser import ResourceBlockProfile
+
+
+def test_block_profile_allows_documents_and_listing_api_calls():
+    profile = ResourceBlockProfile()
+
+    assert profile.block_reason("https://www.airbnb.com/rooms/1", "document") is None
+    assert (
+        profile.block_reason("https://www.airbnb.com/api/v3/StaysPdpSections?operationName=x", "fetch")
+        is None
+    )
+    assert profile.block_reason("https://a0.muscache.com/airbnb/static/app.js", "script") is None
+
+
+def test_block_profile_blocks_media_trackers_and_large_images():
+    profile = ResourceBlockProfile()
+
+    assert profile.block_reason("https://a0.muscache.com/font.woff2", "font") == "resource_type"
+    assert profile.block_reason("https://a0.muscache.com/tour.mp4", "media") == "resource_type"
+    assert (
+        profile.block_reason("https://www.googletagmanager.com/gtm.js?id=1", "script") == "url_pattern"
+    )
+    assert profile.block_reason("https://www.airbnb.com/tracking/jitney/logging", "xhr") == "url_pattern"
+    assert (
+        profile.block_reason("https://a0.muscache.com/im/pictures/a.jpg?im_w=1200", "image")
+        == "image_width"
+    )
+    assert profile.block_reason("https://a0.muscache.com/im/pictures/a.jpg?im_w=320", "image") is None
+
+
+def test_block_profile_without_image_limit_keeps_images():
+    profile = ResourceBlockProfile(max_image_width=None)
+
+    assert profile.block_reason("https://a0.muscache.com/im/pictures/a.jpg?im_w=1440", "image") is None
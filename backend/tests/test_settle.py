@@ -0,0 +1,55 @@
+import asyncio
+from collections import defaultdict
+
+from backend.api.settle import NetworkMonitor
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.listeners = defaultdict(list)
+
+    def on(self, event, handler) -> None:
+        self.listeners[event].append(handler)
+
+    def remove_listener(self, event, handler) -> None:
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, payload) -> None:
+        for handler in list(self.listeners[event]):
+            handler(payload)
+
+
+def test_network_monitor_waits_for_inflight_requests():
+    async def scenario():
+        page = _FakePage()
+        monitor = NetworkMonitor(page)
+        page.emit("request", "xhr-1")
+
+        async def finish_later():
+            await asyncio.sleep(0.05)
+            page.emit("requestfinished", "xhr-1")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        finisher = asyncio.create_task(finish_later())
+        idle = await monitor.wait_for_idle(idle_ms=20, timeout_ms=1000)
+        elapsed = loop.time() - started
+        await finisher
+        monitor.detach()
+        return idle, elapsed, page.listeners
+
+    idle, elapsed, listeners = asyncio.run(scenario())
+
+    assert idle is True
+    assert 0.05 <= elapsed < 0.5
+    assert not any(listeners.values())
+
+
+def test_network_monitor_times_out_on_hanging_request():
+    async def scenario():
+        page = _FakePage()
+        monitor = NetworkMonitor(page)
+        page.emit("request", "beacon")
+        return await monitor.wait_for_idle(idle_ms=10, timeout_ms=60)
+
+    assert asyncio.run(scenario()) is False
@@ -0,0 +1,70 @@
+import asyncio
+
+from backend.api.cache import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = 0
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def scenario():
+        flights: SingleFlight[str, str] = SingleFlight()
+        results = await asyncio.gather(*(flights.run("listing", work) for _ in range(5)))
+        return results, flights.in_flight("listing")
+
+    results, still_running = asyncio.run(scenario())
+
+    assert results == ["done"] * 5
+    assert calls == 1
+    assert still_running is False
+
+
+def test_single_flight_shares_errors_and_survives_leader_cancel():
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("render failed")
+
+    async def slow() -> str:
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def scenario():
+        flights: SingleFlight[str, str] = SingleFlight()
+        outcomes = await asyncio.gather(
+            flights.run("a", failing), flights.run("a", failing), return_exceptions=True
+        )
+
+        leader = asyncio.ensure_future(flights.run("b", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.run("b", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return outcomes, await follower
+
+    outcomes, follower_result = asyncio.run(scenario())
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert follower_result == "ok"
+
+
+def test_single_flight_runs_again_after_completion():
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def scenario():
+        flights: SingleFlight[str, int] = SingleFlight()
+        first = await flights.run("key", work)
+        second = await flights.run("key", work)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
+    assert calls == 2
@@ -0,0 +1,40 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api import telemetry
+
+
+def test_spans_feed_request_timings_and_histograms():
+    async def scenario():
+        with telemetry.collect_timings() as timings:
+            with telemetry.span("test_goto"):
+                await asyncio.sleep(0)
+            # Work handed to a thread is still attributed to the request.
+            await asyncio.to_thread(lambda: telemetry.record("test_extract", 12.0))
+            telemetry.record("test_extract", 3.0)
+        return timings
+
+    timings = asyncio.run(scenario())
+
+    assert [stage for stage, _ in timings] == ["test_goto", "test_extract", "test_extract"]
+    histogram = telemetry.stage_histograms()["test_extract"]
+    assert histogram["count"] == 2
+    assert histogram["sum_ms"] == 15.0
+    assert histogram["le_ms"]["5"] == 1 and histogram["le_ms"]["25"] == 2 and histogram["le_ms"]["+Inf"] == 2
+    assert telemetry.server_timing_header(timings[1:], total_ms=20) == "test_extract;dur=15.0, total;dur=20.0"
+
+
+def test_server_timing_middleware_reports_stages():
+    app = FastAPI()
+    app.add_middleware(telemetry.ServerTimingMiddleware)
+
+    @app.get("/work")
+    async def work():
+        telemetry.record("test_refine", 40.0)
+        return {"ok": True}
+
+    response = TestClient(app).get("/work")
+
+    assert response.headers["server-timing"].startswith("test_refine;dur=40.0, total;dur=")
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from backend.api.cache import AssessmentCache, TieredCache
+from backend.api.database import Database
+
+
+class _MemoryStore:
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple[str, str], str] = {}
+        self.reads = 0
+
+    async def get_cache_entry(self, namespace: str, key: str) -> Optional[str]:
+        self.reads += 1
+        return self.entries.get((namespace, key))
+
+    async def put_cache_entry(self, namespace, key, value, *, ttl_seconds, max_entries) -> None:
+        self.entries[(namespace, key)] = value
+
+
+def _tier(store) -> TieredCache[dict]:
+    import json
+
+    return TieredCache[dict](
+        AssessmentCache(maxsize=8, ttl_seconds=60),
+        namespace="listing",
+        serialize=json.dumps,
+        deserialize=json.loads,
+        store=store,
+    )
+
+
+def test_tiered_cache_reads_through_to_persistent_store():
+    store = _MemoryStore()
+
+    async def scenario():
+        writer = _tier(store)
+        await writer.set("listing-1", {"overall": 80})
+
+        # A fresh process starts with an empty L1 but shares the store.
+        reader = _tier(store)
+        first = await reader.get("listing-1")
+        second = await reader.get("listing-1")
+        missing = await reader.get("listing-2")
+        return first, second, missing
+
+    first, second, missing = asyncio.run(scenario())
+
+    assert first == {"overall": 80}
+    assert second == {"overall": 80}
+    assert missing is None
+    # Second lookup is served from L1; only the first and the miss hit L2.
+    assert store.reads == 2
+
+
+def test_database_cache_entries_expire_and_evict(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "cache.sqlite3"))
+        await db.connect()
+        try:
+            await db.put_cache_entry("listing", "a", "A", ttl_seconds=60, max_entries=2)
+            await db.put_cache_entry("listing", "b", "B", ttl_seconds=60, max_entries=2)
+            await db.put_cache_entry("listing", "c", "C", ttl_seconds=60, max_entries=2)
+            await db.put_cache_entry("report", "x", "X", ttl_seconds=-1, max_entries=2)
+            return [
+                await db.get_cache_entry("listing", key) for key in ("a", "b", "c")
+            ] + [await db.get_cache_entry("report", "x")]
+        finally:
+            await db.close()
+
+    assert asyncio.run(scenario()) == [None, "B", "C", None]
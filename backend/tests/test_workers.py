@@ -0,0 +1,61 @@
+import asyncio
+import pickle
+
+from backend.api.extract import ListingCapture
+from backend.api.workers import AnalysisExecutor, analyze_capture
+
+HTML = """
+<html><body>
+    <h1 data-testid="title">Garden cottage</h1>
+    <div data-section-id="DESCRIPTION_DEFAULT"><p>You will love the quiet garden and fast wifi.</p></div>
+</body></html>
+"""
+
+
+def _capture() -> ListingCapture:
+    return ListingCapture(
+        url="https://www.airbnb.com/rooms/1",
+        html=HTML,
+        amenities_items=["Wifi", "Kitchen"],
+    )
+
+
+def test_capture_round_trips_through_pickle():
+    capture = _capture()
+
+    assert pickle.loads(pickle.dumps(capture)) == capture
+
+
+def test_analysis_executor_thread_and_process_modes_agree():
+    async def run(workers: int):
+        executor = AnalysisExecutor(max_workers=workers)
+        try:
+            return await executor.analyze(_capture())
+        finally:
+            executor.shutdown()
+
+    inline_content, inline_result = analyze_capture(_capture())
+    thread_content, thread_result = asyncio.run(run(0))
+    process_content, process_result = asyncio.run(run(1))
+
+    assert inline_content.title == "Garden cottage"
+    assert thread_content == inline_content == process_content
+    assert thread_result == inline_result == process_result
+
+
+def test_warm_spawns_every_worker_before_the_first_request():
+    async def run():
+        executor = AnalysisExecutor(max_workers=2)
+        try:
+            before = executor.status()
+            await executor.warm()
+            return before, executor.status(), len(executor._worker_states)
+        finally:
+            executor.shutdown()
+
+    before, after, warmed = asyncio.run(run())
+
+    assert before == {"workers": "warming (0/2)", "embeddings": "idle"}
+    assert after == {"workers": "ready", "embeddings": "idle"}
+    assert warmed == 2
+    assert AnalysisExecutor().status()["workers"] == "inline"